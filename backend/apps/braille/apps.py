@@ -4,4 +4,9 @@ from django.apps import AppConfig
 class BrailleConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.braille'
-    verbose_name = '점자 변환'
\ No newline at end of file
+    verbose_name = '점자 변환'
+
+    def ready(self):
+        # 점자 테이블을 시작 시 한 번 컴파일 (첫 요청 지연과 워커별 JSON 재파싱 방지)
+        from utils import braille_registry
+        braille_registry.compile_table()
@@ -2,9 +2,10 @@
 Service Layer Pattern Implementation for Braille App
 점자 패턴 생성 비즈니스 로직
 """
-from typing import Dict, List, Optional
-import re
-from utils.braille_converter import text_to_cells
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+from utils.content_extractor import extract_formula, find_formulas
+from utils.math_braille import math_to_cells
 
 
 class BraillePatternService:
@@ -37,42 +38,44 @@ class BraillePatternService:
         패턴 생성
         pattern_type: 'answer', 'trend', 'number', 'status', 'extremum'
         """
-        if pattern_type == 'answer':
-            is_correct = data.get('is_correct', False) if data else False
-            return self.PATTERNS['answer_correct' if is_correct else 'answer_wrong']
-        
-        elif pattern_type == 'trend':
-            trend = data.get('trend', 'stable') if data else 'stable'
-            if trend == 'increase':
-                return self.PATTERNS['trend_increase']
-            elif trend == 'decrease':
-                return self.PATTERNS['trend_decrease']
-            else:
-                return self.PATTERNS['trend_stable']
-        
-        elif pattern_type == 'number':
-            num = data.get('number', 1) if data else 1
-            return self.NUMBER_PATTERNS.get(num, [0, 0, 0, 0, 0, 0])
-        
-        elif pattern_type == 'status':
-            status = data.get('status', 'stop') if data else 'stop'
-            if status == 'start':
-                return self.PATTERNS['status_start']
-            elif status == 'pause':
-                return self.PATTERNS['status_pause']
-            else:
-                return self.PATTERNS['status_stop']
+        return list(self.pattern_tuple(pattern_type, data))
+    
+    def pattern_tuple(self, pattern_type: str, data: Dict = None) -> Tuple[int, ...]:
+        """
+        사건(type, data) → 미리 계산해 둔 불변 패턴 튜플 (알 수 없는 타입은 빈 패턴)
+        """
+        return PATTERN_TABLE.get(_pattern_key(pattern_type, data), EMPTY_PATTERN)
+    
+    def generate_sequence(self, events: List[Dict]) -> List[Tuple[int, ...]]:
+        """
+        사건 목록 [{type, data}, ...] → 패턴 스트림 (입력 순서 유지)
+        """
+        table = PATTERN_TABLE
+        return [table.get(_pattern_key(event.get('type'), event.get('data')), EMPTY_PATTERN) for event in events]
+    
+    def series_to_events(self, values: List[float], tolerance: float = 0.0) -> List[Dict]:
+        """
+        수치 계열 → 점별 사건 (그래프 재생용)
+        - 안쪽 점에서 증가→감소면 극대, 감소→증가면 극소
+        - 그 밖의 점은 들어오는 구간의 추세 (첫 점은 나가는 구간), 변화량이 tolerance 이하면 유지
+        """
+        count = len(values)
+        trends = []
+        for i in range(1, count):
+            delta = values[i] - values[i - 1]
+            trends.append('stable' if abs(delta) <= tolerance else ('increase' if delta > 0 else 'decrease'))
         
-        elif pattern_type == 'extremum':
-            extremum_type = data.get('type', 'maximum') if data else 'maximum'
-            if extremum_type == 'maximum':
-                return self.PATTERNS['extremum_maximum']
+        events = []
+        for i in range(count):
+            incoming = trends[i - 1] if i > 0 else None
+            outgoing = trends[i] if i < count - 1 else None
+            if incoming == 'increase' and outgoing == 'decrease':
+                events.append({'type': 'extremum', 'data': {'type': 'maximum'}})
+            elif incoming == 'decrease' and outgoing == 'increase':
+                events.append({'type': 'extremum', 'data': {'type': 'minimum'}})
             else:
-                return self.PATTERNS['extremum_minimum']
-        
-        else:
-            # 알 수 없는 타입
-            return [0, 0, 0, 0, 0, 0]
+                events.append({'type': 'trend', 'data': {'trend': incoming or outgoing or 'stable'}})
+        return events
     
     def validate_pattern(self, pattern: List[int]) -> bool:
         """패턴 유효성 검증"""
@@ -85,50 +88,89 @@ class BraillePatternService:
     def convert_formula_to_braille(self, formula: str) -> List[List[int]]:
         """
         수식을 점자로 변환
-        수식 패턴 감지 및 최적화된 점자 변환
+        단일 스캔 토크나이저 + 수식 점자 테이블 (수표, 연산 기호, 분수, 근호, 적분 등)
         """
         if not formula:
             return []
         
-        # 수식 패턴 정규화 (예: x² -> x^2, ∫ -> integral 등)
-        normalized = formula
-        
-        # 지수 패턴 정규화
-        normalized = re.sub(r'([a-zA-Z])\s*²', r'\1^2', normalized)
-        normalized = re.sub(r'([a-zA-Z])\s*³', r'\1^3', normalized)
-        normalized = re.sub(r'([a-zA-Z])\s*⁴', r'\1^4', normalized)
-        
-        # 점자 변환
-        cells = text_to_cells(normalized)
-        return cells
+        return math_to_cells(formula)
     
     def extract_formula_from_text(self, text: str) -> Optional[str]:
         """
-        텍스트에서 수식 추출
+        텍스트에서 첫 번째 수식 추출 (없으면 None)
         """
-        if not text:
-            return None
-        
-        # 수식 패턴: 변수, 지수, 연산자, 등호 등
-        formula_pattern = r'[a-zA-Z]\s*[²³⁴⁵⁶⁷⁸⁹⁰⁺⁻⁼⁽⁾∫∑∏√∞±×÷≤≥≠≈]|[\+\-\*\/\=\<\>\(\)\^]|\\[a-zA-Z]+'
-        
-        matches = re.finditer(formula_pattern, text)
-        if matches:
-            # 첫 번째 수식 부분 추출
-            match = next(matches, None)
-            if match:
-                start = match.start()
-                # 수식이 끝나는 지점 찾기
-                end = start
-                for i in range(start, min(start + 50, len(text))):
-                    char = text[i]
-                    if re.match(r'[.!?]', char) or (i > start + 10 and re.match(r'\s', char)):
-                        end = i
-                        break
-                if end == start:
-                    end = min(start + 50, len(text))
-                return text[start:end].strip()
-        
-        return None
+        formula = extract_formula(text)
+        return formula or None
+    
+    def find_formulas_in_text(self, text: str) -> List[Dict]:
+        """
+        텍스트의 모든 수식과 위치 (한 번의 선형 스캔)
+        Returns:
+            [{'formula': str, 'start': int, 'end': int}, ...]
+        """
+        return [
+            {'formula': span.text, 'start': span.start, 'end': span.end}
+            for span in find_formulas(text)
+        ]
+
+
+# 테이블에 없는 키 (잘못된 사건 → 빈 패턴)
+_UNKNOWN_KEY = ()
+
+
+def _pattern_key(pattern_type: str, data: Optional[Dict]) -> Tuple:
+    """
+    사건 → 패턴 테이블 키 (generate_pattern의 기본값 규칙과 같음)
+    키는 클라이언트 입력으로 만들므로 type이 문자열이 아니거나 number가 정수가 아니면 _UNKNOWN_KEY
+    """
+    if not isinstance(pattern_type, str):
+        return _UNKNOWN_KEY
+    data = data if isinstance(data, dict) else {}
+    if pattern_type == 'answer':
+        return ('answer', bool(data.get('is_correct', False)))
+    if pattern_type == 'trend':
+        trend = data.get('trend', 'stable')
+        return ('trend', trend if trend in ('increase', 'decrease') else 'stable')
+    if pattern_type == 'number':
+        number = data.get('number', 1)
+        if not isinstance(number, int) or isinstance(number, bool):
+            return _UNKNOWN_KEY
+        return ('number', number)
+    if pattern_type == 'status':
+        status = data.get('status', 'stop')
+        return ('status', status if status in ('start', 'pause') else 'stop')
+    if pattern_type == 'extremum':
+        return ('extremum', 'maximum' if data.get('type', 'maximum') == 'maximum' else 'minimum')
+    return (pattern_type,)
+
+
+def _build_pattern_table() -> MappingProxyType:
+    """사건 키 → 패턴 튜플 (모듈 로드 시 한 번 계산하고 검증)"""
+    patterns = BraillePatternService.PATTERNS
+    table = {
+        ('answer', True): patterns['answer_correct'],
+        ('answer', False): patterns['answer_wrong'],
+        ('trend', 'increase'): patterns['trend_increase'],
+        ('trend', 'decrease'): patterns['trend_decrease'],
+        ('trend', 'stable'): patterns['trend_stable'],
+        ('status', 'start'): patterns['status_start'],
+        ('status', 'pause'): patterns['status_pause'],
+        ('status', 'stop'): patterns['status_stop'],
+        ('extremum', 'maximum'): patterns['extremum_maximum'],
+        ('extremum', 'minimum'): patterns['extremum_minimum'],
+    }
+    for number, pattern in BraillePatternService.NUMBER_PATTERNS.items():
+        table[('number', number)] = pattern
+    
+    service = BraillePatternService()
+    for key, pattern in table.items():
+        if not service.validate_pattern(pattern):
+            raise ValueError(f"잘못된 패턴입니다: {key}")
+    return MappingProxyType({key: tuple(pattern) for key, pattern in table.items()})
+
 
+# 빈 패턴 (알 수 없는 사건)
+EMPTY_PATTERN = (0, 0, 0, 0, 0, 0)
 
+# 사건 키 → 불변 패턴 튜플
+PATTERN_TABLE = _build_pattern_table()
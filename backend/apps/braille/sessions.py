@@ -0,0 +1,98 @@
+"""
+증분 변환 세션 저장소 (자유 변환 화면)
+세션별로 마지막 변환 문서(utils.braille_incremental.IncrementalBraille)를 Django 캐시(BRAILLE_SESSION_CACHE)에 보관
+- 마지막 사용 뒤 SESSION_TTL이 지나면 만료, 세션 수 한도와 정리는 캐시 백엔드(MAX_ENTRIES 등)를 따름
+- 워커 프로세스가 여럿이면 공유 캐시(Redis/Memcached 등)를 써야 함
+  (기본 LocMemCache는 프로세스별이라 다른 워커로 간 요청은 세션을 찾지 못함)
+- 편집 결과(diff)는 편집 요청의 응답으로만 돌려줌 (서버에서 먼저 밀어 주는 채널은 없음)
+"""
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from django.conf import settings
+from django.core.cache import caches
+from utils.braille_incremental import IncrementalBraille
+
+# 세션 유지 시간 (초)
+SESSION_TTL = 30 * 60
+
+# 세션 한 문서의 최대 길이 (문자 수)
+MAX_SESSION_CHARS = 200000
+
+# 편집 잠금: 잠금 키 유지 시간과 잠금을 기다리는 최대 시간 (초)
+LOCK_TTL = 10
+LOCK_WAIT = 3
+LOCK_POLL = 0.02
+
+KEY_PREFIX = 'braille-session:'
+
+
+class SessionBusy(Exception):
+    """다른 요청이 같은 세션을 편집하고 있어 잠금을 얻지 못함"""
+
+
+class BrailleSession:
+    """세션 하나: 문서와 편집 버전 (캐시에 pickle로 저장)"""
+
+    __slots__ = ('id', 'document', 'version')
+
+    def __init__(self, document: IncrementalBraille):
+        self.id = uuid.uuid4().hex
+        self.document = document
+        self.version = 0
+
+
+def _cache():
+    return caches[getattr(settings, 'BRAILLE_SESSION_CACHE', 'default')]
+
+
+def _key(session_id: str) -> str:
+    return KEY_PREFIX + str(session_id)
+
+
+def create_session(text: str = '', contracted: bool = False) -> BrailleSession:
+    """새 세션 (text를 한 번 전체 변환)"""
+    session = BrailleSession(IncrementalBraille(text, contracted))
+    save_session(session)
+    return session
+
+
+def save_session(session: BrailleSession) -> None:
+    """세션 저장 (만료 시간 연장)"""
+    _cache().set(_key(session.id), session, SESSION_TTL)
+
+
+def get_session(session_id: str) -> Optional[BrailleSession]:
+    """세션 조회 (없거나 만료되면 None, 조회하면 만료 시간 연장)"""
+    cache = _cache()
+    session = cache.get(_key(session_id))
+    if session is not None:
+        cache.touch(_key(session_id), SESSION_TTL)
+    return session
+
+
+@contextmanager
+def edit_session(session_id: str) -> Iterator[Optional[BrailleSession]]:
+    """
+    세션을 잠그고 조회 (없으면 None)
+    바뀐 내용은 블록 안에서 save_session으로 저장해야 하며, 저장하지 않으면 버려짐
+    LOCK_WAIT 안에 잠금을 얻지 못하면 SessionBusy
+    """
+    cache = _cache()
+    lock_key = _key(session_id) + ':lock'
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + LOCK_WAIT
+    while not cache.add(lock_key, token, LOCK_TTL):
+        if time.monotonic() >= deadline:
+            raise SessionBusy(session_id)
+        time.sleep(LOCK_POLL)
+    try:
+        yield get_session(session_id)
+    finally:
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+
+def close_session(session_id: str) -> bool:
+    return _cache().delete(_key(session_id))
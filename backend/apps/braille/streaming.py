@@ -0,0 +1,57 @@
+"""
+점자 청크 스트리밍 응답
+긴 텍스트를 디스플레이 폭 단위로 나누어 NDJSON 또는 SSE 프레임으로 전송
+"""
+import json
+from typing import Iterable, Iterator
+from django.http import StreamingHttpResponse
+from utils.braille_converter import serialize_braille
+
+STREAM_MODES = ('ndjson', 'sse')
+
+# 청크 폭 기본값 (3-cell 디스플레이)과 상한
+DEFAULT_CHUNK_WIDTH = 3
+MAX_CHUNK_WIDTH = 256
+
+
+def parse_chunk_width(value) -> int:
+    """요청 값에서 청크 폭을 읽고 검증"""
+    if value in (None, ''):
+        return DEFAULT_CHUNK_WIDTH
+    width = int(value)
+    if not 1 <= width <= MAX_CHUNK_WIDTH:
+        raise ValueError(f"width는 1~{MAX_CHUNK_WIDTH} 범위여야 합니다")
+    return width
+
+
+def _iter_frames(chunks: Iterable[str], fmt: str, mode: str) -> Iterator[str]:
+    """점자 청크를 프레임 문자열로 변환"""
+    index = offset = 0
+    try:
+        for chunk in chunks:
+            frame = json.dumps({
+                'index': index,
+                'offset': offset,
+                'cells': serialize_braille(chunk, fmt),
+            }, ensure_ascii=False)
+            yield f"data: {frame}\n\n" if mode == 'sse' else frame + "\n"
+            index += 1
+            offset += len(chunk)
+        done = json.dumps({'done': True, 'chunks': index, 'count': offset, 'format': fmt})
+        yield f"event: done\ndata: {done}\n\n" if mode == 'sse' else done + "\n"
+    except Exception as e:
+        error = json.dumps({'error': str(e)}, ensure_ascii=False)
+        yield f"event: error\ndata: {error}\n\n" if mode == 'sse' else error + "\n"
+
+
+def braille_stream_response(chunks: Iterable[str], fmt: str = 'cells', mode: str = 'ndjson') -> StreamingHttpResponse:
+    """
+    점자 청크 스트리밍 응답 생성
+    ndjson: 줄마다 {"index", "offset", "cells"} 프레임, 마지막 줄은 {"done": true, ...}
+    sse: data: 프레임, 마지막은 event: done
+    """
+    content_type = 'text/event-stream' if mode == 'sse' else 'application/x-ndjson'
+    resp = StreamingHttpResponse(_iter_frames(chunks, fmt, mode), content_type=content_type)
+    resp["Cache-Control"] = "no-cache"
+    resp["X-Accel-Buffering"] = "no"  # 프록시(ngrok 등) 버퍼링 방지
+    return resp
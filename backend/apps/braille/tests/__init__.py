@@ -0,0 +1,2 @@
+# Braille app tests
+
@@ -0,0 +1,42 @@
+"""
+Braille Benchmark Tests
+"""
+from django.test import TestCase
+from utils.braille_benchmark import (
+    DiffCase, build_workloads, differential_cases, run_benchmark, run_differential, synthetic_corpus,
+)
+from utils.braille_converter import text_to_cells, text_to_unicode
+
+
+class BenchmarkTest(TestCase):
+    """벤치마크 / 차분 검증 도구 테스트"""
+
+    def test_synthetic_corpus(self):
+        corpus = synthetic_corpus(10000, seed=1)
+        self.assertGreaterEqual(len(corpus.encode('utf-8')), 10000)
+        self.assertEqual(corpus, synthetic_corpus(10000, seed=1))
+
+    def test_workloads(self):
+        workloads = build_workloads(corpus_bytes=2000)
+        self.assertEqual(set(workloads), {'words', 'sentences', 'units', 'synthetic'})
+        self.assertTrue(all(workloads.values()))
+
+    def test_run_benchmark(self):
+        texts = ['나는 학생이다.', '학교']
+        result = run_benchmark('sample', text_to_cells, texts, repeat=2)
+        self.assertEqual(result.chars, sum(map(len, texts)))
+        self.assertEqual(result.cells, sum(len(text_to_cells(text)) for text in texts))
+        self.assertGreater(result.peak_bytes, 0)
+        self.assertIn('cells_per_sec', result.as_dict())
+
+    def test_differential(self):
+        self.assertTrue(list(differential_cases()))
+        cases = [
+            DiffCase('sample', '학교', text_to_unicode('학교')),
+            DiffCase('sample', '친구', text_to_unicode('학교')),
+        ]
+        report = run_differential(text_to_cells, cases)
+        self.assertEqual(report['sample']['matched'], 1)
+        mismatch = report['sample']['mismatches'][0]
+        self.assertEqual(mismatch['text'], '친구')
+        self.assertEqual(mismatch['actual'], text_to_unicode('친구'))
@@ -0,0 +1,59 @@
+"""
+Braille Contraction Unit Tests
+"""
+from unittest.mock import patch
+from django.test import TestCase
+from utils import braille_contraction
+from utils.braille_contraction import contracted_text_to_unicode, get_rules
+from utils.braille_converter import char_to_unicode, text_to_unicode
+
+
+def cells(*dots):
+    return ''.join(chr(0x2800 + sum(1 << (dot - 1) for dot in cell)) for cell in dots)
+
+
+class ContractionTest(TestCase):
+    """약자/약어 변환 테스트"""
+
+    def test_abbreviated_word_at_word_start(self):
+        """약어는 어절 첫머리에서 최장 일치"""
+        self.assertEqual(contracted_text_to_unicode('그래서'), cells([1], [2, 3, 4]))
+        self.assertEqual(contracted_text_to_unicode('그리하여'), cells([1], [1, 5, 6]))
+        self.assertTrue(contracted_text_to_unicode('그래서는').startswith(cells([1], [2, 3, 4])))
+
+    def test_abbreviated_word_not_in_middle(self):
+        """어절 중간의 약어는 적용하지 않음"""
+        self.assertFalse(contracted_text_to_unicode('아그래서').endswith(cells([1], [2, 3, 4])))
+
+    def test_syllable_abbreviation_with_final(self):
+        """'가' 약자 + 받침"""
+        self.assertEqual(contracted_text_to_unicode('강'), cells([1, 2, 4, 6]) + char_to_unicode('ㅇ'))
+
+    def test_rime_abbreviation(self):
+        """'언' 약자 앞에 초성"""
+        self.assertEqual(contracted_text_to_unicode('건'), char_to_unicode('ㄱ') + cells([2, 3, 4, 5, 6]))
+
+    def test_no_abbreviation_before_vowel(self):
+        """'나' 뒤에 모음이 오면 풀어 씀"""
+        braille = contracted_text_to_unicode('나이')
+        self.assertTrue(braille.startswith(char_to_unicode('ㄴ') + char_to_unicode('ㅏ')))
+
+    def test_fewer_cells(self):
+        """약자 적용 시 셀 수 감소"""
+        text = '그러나 우리는 영화를 보았다'
+        self.assertLess(len(contracted_text_to_unicode(text)), len(text_to_unicode(text)))
+
+    def test_rules_compiled_once(self):
+        """규칙은 한 번만 컴파일"""
+        self.assertIs(get_rules(), get_rules())
+
+    def test_recompiled_on_catalog_change(self):
+        """braille_catalog.json이 바뀌면 규칙을 다시 컴파일하고 어절 메모를 비움"""
+        rules = get_rules()
+        contracted_text_to_unicode('그래서')
+        braille_contraction.invalidate()
+        with patch.object(braille_contraction, 'catalog_file_version', return_value=('changed', 0)):
+            self.assertIsNot(get_rules(), rules)
+            self.assertEqual(braille_contraction._memo_contracted_word.cache_info().currsize, 0)
+        braille_contraction.invalidate()
+        self.assertEqual(contracted_text_to_unicode('그래서'), cells([1], [2, 3, 4]))
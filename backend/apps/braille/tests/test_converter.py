@@ -0,0 +1,253 @@
+"""
+Braille Converter Unit Tests
+"""
+import base64
+import unicodedata
+from unittest import skipUnless
+from unittest.mock import patch
+from django.test import TestCase
+from utils import braille_registry, braille_vectorized
+from utils.braille_parallel import ParallelBrailleConverter, cut_points, encode_alignment, encode_packed, split_text
+from utils.braille_converter import (
+    text_to_cells, text_to_unicode, unicode_to_cells, _load_braille_map,
+    text_to_packed, packed_to_cells, cells_to_packed, packed_to_unicode, serialize_braille,
+    iter_text_blocks, iter_braille_chunks, iter_cells, memo_stats, word_cells,
+    text_alignment, pack_alignment, unpack_alignment, project_alignment,
+)
+
+
+class TextToCellsTest(TestCase):
+    """text_to_cells 테스트"""
+
+    def setUp(self):
+        self.braille_map = _load_braille_map()
+
+    def test_syllable_decomposition(self):
+        """받침 없는 음절은 초성 + 중성 셀로 분해"""
+        cells = text_to_cells('소')
+        self.assertEqual(cells, [self.braille_map['ㅅ'], self.braille_map['ㅗ']])
+
+    def test_final_consonant(self):
+        """받침은 종성 인덱스 기준으로 변환"""
+        cells = text_to_cells('각')
+        self.assertEqual(cells[-1], self.braille_map['ㄱ'])
+
+    def test_double_final_consonant(self):
+        """겹받침은 두 자음 셀로 변환"""
+        cells = text_to_cells('닭')
+        self.assertEqual(cells[-2:], [self.braille_map['ㄹ'], self.braille_map['ㄱ']])
+
+    def test_precomposed_entry(self):
+        """12점 매핑은 두 셀로 분할"""
+        cells = text_to_cells('가')
+        self.assertEqual(cells, [self.braille_map['가'][:6], self.braille_map['가'][6:]])
+
+    def test_unknown_char_is_blank(self):
+        """알 수 없는 문자는 빈 셀"""
+        self.assertEqual(text_to_cells('@'), [[0, 0, 0, 0, 0, 0]])
+
+    def test_empty(self):
+        """빈 입력"""
+        self.assertEqual(text_to_cells(''), [])
+        self.assertEqual(text_to_cells(None), [])
+
+    def test_unicode_round_trip(self):
+        """유니코드 출력과 셀 배열이 일치"""
+        text = '오늘 날씨가 맑다.'
+        braille = text_to_unicode(text)
+        self.assertTrue(all(0x2800 <= ord(ch) <= 0x283F for ch in braille))
+        self.assertEqual(unicode_to_cells(braille), text_to_cells(text))
+
+
+class PackedFormatTest(TestCase):
+    """패킹 셀 형식 테스트"""
+
+    def test_one_byte_per_cell(self):
+        """셀당 1바이트, 6비트 마스크"""
+        text = '안녕하세요'
+        packed = text_to_packed(text)
+        self.assertEqual(len(packed), len(text_to_cells(text)))
+        self.assertTrue(all(b < 64 for b in packed))
+
+    def test_round_trip(self):
+        """패킹 ↔ 셀 배열 왕복 변환"""
+        cells = text_to_cells('오늘 날씨가 맑다.')
+        self.assertEqual(packed_to_cells(cells_to_packed(cells)), cells)
+
+    def test_invalid_byte(self):
+        """6비트 범위를 넘는 값은 거부"""
+        with self.assertRaises(ValueError):
+            packed_to_unicode(bytes([64]))
+
+    def test_serialize_formats(self):
+        """응답 형식별 직렬화"""
+        braille = text_to_unicode('사랑')
+        self.assertEqual(serialize_braille(braille, 'cells'), unicode_to_cells(braille))
+        self.assertEqual(serialize_braille(braille, 'unicode'), braille)
+        self.assertEqual(
+            base64.b64decode(serialize_braille(braille, 'packed')),
+            text_to_packed('사랑'),
+        )
+        with self.assertRaises(ValueError):
+            serialize_braille(braille, 'xml')
+
+
+class StreamingConversionTest(TestCase):
+    """청크 스트리밍 변환 테스트"""
+
+    text = '오늘 날씨가 맑다. 나는 학생이다. ' * 50
+
+    def test_blocks_cover_text(self):
+        """블록을 이어 붙이면 원문"""
+        blocks = list(iter_text_blocks(self.text, block_chars=64))
+        self.assertGreater(len(blocks), 1)
+        self.assertEqual(''.join(blocks), self.text)
+
+    def test_chunks_match_full_conversion(self):
+        """청크를 이어 붙이면 전체 변환 결과와 같음"""
+        chunks = list(iter_braille_chunks(iter_text_blocks(self.text, block_chars=64), 3))
+        self.assertTrue(all(len(chunk) == 3 for chunk in chunks[:-1]))
+        self.assertEqual(''.join(chunks), text_to_unicode(self.text))
+
+    def test_nfd_blocks_without_spaces(self):
+        """공백 없는 NFD 한글도 음절 중간에서 자르지 않음"""
+        text = unicodedata.normalize('NFD', '나는학생이다' * 20)
+        blocks = list(iter_text_blocks(text, block_chars=7))
+        self.assertGreater(len(blocks), 1)
+        self.assertEqual(''.join(blocks), text)
+        for block in blocks:
+            self.assertFalse('\u1160' <= block[0] <= '\u11ff')
+        chunks = iter_braille_chunks(iter_text_blocks(text, block_chars=7), 4)
+        self.assertEqual(''.join(chunks), text_to_unicode(text))
+
+    def test_iter_cells(self):
+        """셀 제너레이터"""
+        self.assertEqual(list(iter_cells(self.text)), text_to_cells(self.text))
+
+
+class WordMemoTest(TestCase):
+    """어절 메모 테스트"""
+
+    def test_repeated_words_hit_memo(self):
+        """반복되는 어절은 메모에서 재사용"""
+        before = memo_stats()
+        text_to_unicode('메모테스트 메모테스트 메모테스트')
+        after = memo_stats()
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertEqual(after['hits'] - before['hits'], 2)
+
+    def test_word_cells(self):
+        """어절 셀 튜플"""
+        cells = word_cells('학교')
+        self.assertIsInstance(cells, tuple)
+        self.assertEqual([list(cell) for cell in cells], text_to_cells('학교'))
+
+    def test_invalidated_on_table_change(self):
+        """ko_braille.json 버전이 바뀌면 메모를 비움"""
+        text_to_unicode('사랑')
+        braille_registry.compile_table()
+        text_to_unicode('사랑')
+        stats = memo_stats()
+        self.assertEqual(stats['size'], 1)
+        self.assertIsNotNone(stats['table_version'])
+
+
+class VectorizedConversionTest(TestCase):
+    """NumPy 벡터화 대량 변환 테스트"""
+
+    text = '오늘 날씨가 맑다. 닭이 울었다! abc 😀 ' * 20
+
+    @skipUnless(braille_vectorized.NUMPY_AVAILABLE, 'NumPy 미설치')
+    def test_matches_python_path(self):
+        """순수 파이썬 경로와 같은 결과"""
+        self.assertEqual(braille_vectorized.text_to_packed_array(self.text).tobytes(), text_to_packed(self.text))
+        cells = braille_vectorized.text_to_cell_array(self.text)
+        self.assertEqual(cells.shape, (len(text_to_cells(self.text)), 6))
+        self.assertEqual(cells.tolist(), text_to_cells(self.text))
+
+    @skipUnless(braille_vectorized.NUMPY_AVAILABLE, 'NumPy 미설치')
+    def test_empty(self):
+        """빈 입력"""
+        self.assertEqual(braille_vectorized.text_to_packed_array('').size, 0)
+
+    def test_fallback_without_numpy(self):
+        """NumPy가 없으면 순수 파이썬 경로"""
+        with patch.object(braille_vectorized, 'NUMPY_AVAILABLE', False):
+            self.assertEqual(braille_vectorized.bulk_text_to_packed(self.text), text_to_packed(self.text))
+
+
+class ParallelSplitTest(TestCase):
+    """병렬 변환 조각 나누기 테스트"""
+
+    def test_split_at_sentence_ends(self):
+        """조각은 문장 끝에서 끊기고 이어 붙이면 원문"""
+        text = '오늘 날씨가 맑다. 나는 학생이다! 정말요? ' * 30
+        pieces = list(split_text(text, 50))
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual(''.join(pieces), text)
+        self.assertTrue(all(piece.endswith(('. ', '! ', '? ')) for piece in pieces[:-1]))
+
+    def test_chunked_equals_single_pass(self):
+        """로마자/수식/약자 상태가 있는 인코더도 조각으로 나눠 변환한 결과가 한 번에 변환한 것과 같음"""
+        cases = {
+            'mixed': 'We read books. The fox runs. 나는 학생. ',
+            'mixed_math': '값은 \\frac{a + b}{2} = 1 이다. New York에 x + 1 = 3 갔다. ',
+            'english': 'the\nfox and the dog. The cat\nsat. ',
+            'math': '\\frac{a + b}{2} + √(x + 1) = 3 x^{2 + n} ',
+        }
+        for encoder, sentence in cases.items():
+            text = sentence * 10
+            with ParallelBrailleConverter(workers=1, chunk_chars=16) as converter:
+                [(packed, alignment)] = converter.convert_texts_aligned([text], [encoder])
+            self.assertEqual(packed, encode_packed(text, encoder), encoder)
+            self.assertEqual(alignment, encode_alignment(text, encoder), encoder)
+
+    def test_cut_points(self):
+        """이어지는 로마자 구간과 수식 안에서는 자르지 않음"""
+        text = 'We read books. 나는 x + 1 = 2 학생'
+        self.assertEqual(cut_points(text, 'mixed'), [text.index('나'), text.index('x'), text.index('+'),
+                                                     text.index('1'), text.index('='), text.index('2'),
+                                                     text.index('학')])
+        self.assertEqual(cut_points(text, 'mixed_math'), [text.index('나'), text.index('x'), text.index('학')])
+        self.assertIsNone(cut_points(text, 'text'))
+        self.assertEqual(cut_points('√(x + 1) = 2', 'math'), [9, 11])
+
+
+class AlignmentTest(TestCase):
+    """원문-셀 정렬 배열 테스트"""
+
+    text = '오늘 날씨가 맑다. 닭이 울었다! abc 😀 '
+
+    def test_prefix_sums(self):
+        """문자 i의 셀 범위는 offsets[i]:offsets[i + 1]"""
+        offsets = text_alignment(self.text)
+        braille = text_to_unicode(self.text)
+        self.assertEqual(len(offsets), len(self.text) + 1)
+        self.assertEqual(offsets[-1], len(braille))
+        for index, ch in enumerate(self.text):
+            self.assertEqual(braille[offsets[index]:offsets[index + 1]], text_to_unicode(ch))
+
+    def test_pack_round_trip(self):
+        offsets = text_alignment(self.text)
+        data = pack_alignment(offsets)
+        self.assertEqual(len(data), 4 * len(offsets))
+        self.assertEqual(unpack_alignment(data), offsets)
+        with patch.object(braille_vectorized, 'NUMPY_AVAILABLE', False):
+            self.assertEqual(braille_vectorized.bulk_text_alignment(self.text), data)
+        if braille_vectorized.NUMPY_AVAILABLE:
+            self.assertEqual(braille_vectorized.bulk_text_alignment(self.text), data)
+
+    def test_project_spans(self):
+        """일부 구간만 변환한 정렬을 원문 기준으로 옮김 (빠진 문자는 다음 구간 시작)"""
+        text = 'ab. cd'
+        offsets = text_alignment('ab cd')
+        projected = project_alignment(offsets, [(0, 2), (4, 6)], 1, len(text))
+        self.assertEqual(list(projected), [0, 1, offsets[3], offsets[3], offsets[3], offsets[4], offsets[5]])
+
+    def test_parallel_pieces_joined(self):
+        """조각별 정렬을 이어 붙여도 한 번에 계산한 것과 같음"""
+        text = self.text * 10
+        with ParallelBrailleConverter(workers=1, chunk_chars=16) as converter:
+            [(packed, alignment)] = converter.convert_texts_aligned([text])
+        self.assertEqual(packed, text_to_packed(text))
+        self.assertEqual(alignment, pack_alignment(text_alignment(text)))
@@ -0,0 +1,71 @@
+"""
+Braille Decoder Tests
+"""
+import base64
+import json
+from django.test import TestCase, Client
+from utils.braille_converter import text_to_cells, text_to_packed, text_to_unicode
+from utils.braille_decoder import get_decoder, unicode_to_text, verify_braille
+
+
+class BrailleDecoderTest(TestCase):
+    """점자 역변환 테스트"""
+
+    def test_round_trip(self):
+        """받침/겹받침/문장부호가 섞인 문장 왕복"""
+        for text in ['오늘 날씨가 맑다.', '닭이 울었다!', '그래서 우리는 학교에 갔다.', '사랑해요, 감사합니다?']:
+            self.assertEqual(unicode_to_text(text_to_unicode(text)), text)
+
+    def test_inverse_index(self):
+        """셀 마스크 → 후보 자모 (같은 점형의 자모를 모두 보관)"""
+        candidates = get_decoder().candidates
+        self.assertIn('ㅅ', candidates[10])
+        self.assertIn('ㅡ', candidates[10])
+
+    def test_ambiguous_jamo_verifies(self):
+        """같은 점형을 쓰는 자모는 원문과 달라도 점자 왕복은 일치"""
+        braille = text_to_unicode('타조')
+        self.assertEqual(unicode_to_text(braille), '다조')
+        self.assertTrue(verify_braille(braille))
+
+    def test_unknown_pattern_kept(self):
+        """매핑 없는 점형은 점자 문자 그대로"""
+        self.assertEqual(unicode_to_text('⠿'), '⠿')
+        self.assertEqual(unicode_to_text(''), '')
+
+
+class BrailleDecodeViewTest(TestCase):
+    """역변환 API 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+
+    def post(self, url, payload):
+        return self.client.post(url, json.dumps(payload), content_type='application/json')
+
+    def test_decode_cells(self):
+        """레거시 셀 배열 입력"""
+        response = self.post('/api/braille/decode/', {'cells': text_to_cells('학생')})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['text'], '학생')
+
+    def test_decode_packed(self):
+        """packed(base64) 입력"""
+        packed = base64.b64encode(text_to_packed('친구')).decode('ascii')
+        response = self.post('/api/braille/decode/', {'cells': packed, 'format': 'packed'})
+        self.assertEqual(json.loads(response.content)['text'], '친구')
+
+    def test_decode_invalid(self):
+        """형식에 맞지 않는 입력"""
+        response = self.post('/api/braille/decode/', {'cells': 'abc', 'format': 'unicode'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_decode_batch(self):
+        """일괄 역변환 (id 유지, 항목별 오류)"""
+        response = self.post('/api/braille/decode/batch/', {
+            'format': 'unicode',
+            'items': [{'id': 'a', 'cells': text_to_unicode('사랑')}, {'id': 'b', 'cells': 3}],
+        })
+        data = json.loads(response.content)
+        self.assertEqual(data['results'][0], {'id': 'a', 'text': '사랑'})
+        self.assertIn('error', data['results'][1])
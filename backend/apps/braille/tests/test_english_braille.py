@@ -0,0 +1,93 @@
+"""
+English Braille Tests
+"""
+from django.test import TestCase
+from utils.braille_converter import BLANK_CELL, dot_numbers_to_unicode, text_to_unicode, unicode_to_packed
+from utils.english_braille import english_alignment, english_to_unicode
+
+
+def _dots(*cells):
+    return dot_numbers_to_unicode(list(cells))
+
+
+CAPITAL = _dots([6])
+NUMBER = _dots([3, 4, 5, 6])
+GRADE1 = _dots([5, 6])
+
+
+class EnglishBrailleTest(TestCase):
+    """영어 점자 (UEB) 테스트"""
+
+    def test_letters_not_blank(self):
+        """로마자가 빈 셀로 사라지지 않음"""
+        braille = english_to_unicode('quiz', grade=1)
+        self.assertEqual(braille, _dots([1, 2, 3, 4, 5], [1, 3, 6], [2, 4], [1, 3, 5, 6]))
+        self.assertNotIn(BLANK_CELL, english_to_unicode('Students read carefully'.replace(' ', '')))
+
+    def test_capital_indicators(self):
+        """첫 글자 대문자는 대문자표, 전체 대문자 낱말은 대문자 낱말표"""
+        self.assertEqual(english_to_unicode('Cat', grade=1), CAPITAL + english_to_unicode('cat', grade=1))
+        self.assertEqual(english_to_unicode('CAT', grade=1), CAPITAL * 2 + english_to_unicode('cat', grade=1))
+        mixed = english_to_unicode('McD', grade=1)
+        self.assertEqual(mixed.count(CAPITAL), 2)
+
+    def test_number_indicator(self):
+        """수표 + a~j, 수 뒤의 a~j 글자는 1종 기호"""
+        self.assertEqual(english_to_unicode('2024'), NUMBER + _dots([1, 2], [2, 4, 5], [1, 2], [1, 4, 5]))
+        self.assertEqual(english_to_unicode('3a', grade=1), NUMBER + _dots([1, 4]) + GRADE1 + _dots([1]))
+        self.assertEqual(english_to_unicode('3z', grade=1), NUMBER + _dots([1, 4], [1, 3, 5, 6]))
+
+    def test_non_ascii_digits(self):
+        """전각/아랍 숫자는 수가 아니라 기타 문자 (점자 문자만 나옴)"""
+        for text in ['A１', '٣b']:
+            braille = english_to_unicode(text)
+            self.assertNotIn(NUMBER, braille)
+            self.assertEqual(len(unicode_to_packed(braille)), len(braille))
+
+    def test_contractions(self):
+        """2종 약자: 낱말 기호, 강한 약자, 위치 조건"""
+        self.assertEqual(english_to_unicode('the'), _dots([2, 3, 4, 6]))
+        self.assertEqual(english_to_unicode('and'), _dots([1, 2, 3, 4, 6]))
+        self.assertEqual(english_to_unicode('knowledge'), _dots([1, 3]))
+        self.assertEqual(english_to_unicode('The'), CAPITAL + _dots([2, 3, 4, 6]))
+        # 낱말 기호는 낱말 전체일 때만 (cannot ≠ can + not)
+        self.assertNotEqual(english_to_unicode('cans'), english_to_unicode('can') + english_to_unicode('s'))
+        # ea는 낱말 가운데에서만
+        self.assertEqual(english_to_unicode('sea'), english_to_unicode('sea', grade=1))
+        self.assertEqual(len(english_to_unicode('read')), 3)
+
+    def test_grade1_single_letter(self):
+        """2종에서 홀로 쓴 낱글자(a, i, o 제외)는 1종 기호"""
+        self.assertEqual(english_to_unicode('b'), GRADE1 + _dots([1, 2]))
+        self.assertEqual(english_to_unicode('a'), _dots([1]))
+
+    def test_punctuation(self):
+        self.assertEqual(english_to_unicode('go!'), _dots([1, 2, 4, 5], [2, 3, 5]))
+
+    def test_hangul_segments(self):
+        """한글 구간은 한글 점자 테이블"""
+        self.assertEqual(
+            english_to_unicode('영어 English 문장입니다.'),
+            text_to_unicode('영어') + BLANK_CELL + english_to_unicode('English') + BLANK_CELL + text_to_unicode('문장입니다.'),
+        )
+
+    def test_alignment_by_word(self):
+        offsets = english_alignment('The cat')
+        self.assertEqual(len(offsets), len('The cat') + 1)
+        self.assertEqual(offsets[-1], len(english_to_unicode('The cat')))
+        self.assertEqual(offsets[4], len(english_to_unicode('The')) + 1)
+
+
+class EnglishStrategyTest(TestCase):
+    """영어 전략 변환 테스트"""
+
+    def test_english_strategy(self):
+        from apps.exam.services import BrailleConversionService
+        from utils.braille_converter import unicode_to_packed
+
+        service = BrailleConversionService()
+        text = 'Read the passage. 다음 글을 읽고 답하시오.'
+        self.assertEqual(service._convert_with_strategy(text, 'english'), english_to_unicode(text))
+        packed, alignment = service._convert_aligned_with_strategy(text, 'english')
+        self.assertEqual(packed, unicode_to_packed(english_to_unicode(text)))
+        self.assertEqual(len(alignment), 4 * (len(text) + 1))
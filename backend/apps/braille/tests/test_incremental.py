@@ -0,0 +1,64 @@
+"""
+Incremental Braille Conversion Tests
+"""
+import random
+from unittest import mock
+from django.test import TestCase
+from utils import braille_incremental
+from utils.braille_contraction import contracted_text_to_unicode
+from utils.braille_converter import text_to_unicode
+from utils.braille_incremental import IncrementalBraille
+
+
+def apply_diff(braille, diff):
+    return braille[:diff.start] + diff.inserted + braille[diff.start + diff.deleted:]
+
+
+class IncrementalBrailleTest(TestCase):
+    """증분 변환 테스트"""
+
+    def test_initial(self):
+        doc = IncrementalBraille('나는 학생이다')
+        self.assertEqual(doc.braille, text_to_unicode('나는 학생이다'))
+        self.assertEqual(len(doc), len('나는 학생이다'))
+        self.assertEqual(IncrementalBraille('').braille, '')
+
+    def test_edit_diff_is_local(self):
+        """편집한 어절의 바뀐 셀만 돌려줌"""
+        doc = IncrementalBraille('나는 학생이다')
+        diff = doc.edit(3, 3, '착한 ')
+        self.assertEqual(doc.text, '나는 착한 학생이다')
+        self.assertEqual(diff.start, len(text_to_unicode('나는 ')))
+        self.assertEqual(diff.deleted, 0)
+        self.assertEqual(diff.inserted, text_to_unicode('착한 '))
+
+    def test_random_edits_match_full_conversion(self):
+        """무작위 편집 뒤에도 전체 변환 결과와 같음 (블록 경계를 넘는 편집 포함)"""
+        rng = random.Random(7)
+        alphabet = '가나다 라마 바사  아자차.'
+        with mock.patch.object(braille_incremental, 'BLOCK_WORDS', 3):
+            for contracted, convert in ((False, text_to_unicode), (True, contracted_text_to_unicode)):
+                text = '나는 학생이다 오늘 날씨가 맑다 그래서 그리고'
+                doc = IncrementalBraille(text, contracted)
+                braille = doc.braille
+                for _ in range(500):
+                    start = rng.randint(0, len(text))
+                    end = rng.randint(start, min(len(text), start + 10))
+                    insert = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+                    braille = apply_diff(braille, doc.edit(start, end, insert))
+                    text = text[:start] + insert + text[end:]
+                    self.assertEqual(doc.text, text)
+                    self.assertEqual(braille, convert(text))
+
+    def test_invalid_range(self):
+        doc = IncrementalBraille('나는')
+        with self.assertRaises(IndexError):
+            doc.edit(1, 5, '')
+
+    def test_table_change_reconverts(self):
+        """점자 테이블이 바뀌면 전체를 다시 변환"""
+        doc = IncrementalBraille('나는 학생')
+        with mock.patch.object(braille_incremental, 'table_version', return_value=('changed',)):
+            diff = doc.edit(0, 0, '너')
+        self.assertEqual((diff.start, diff.deleted), (0, len(text_to_unicode('나는 학생'))))
+        self.assertEqual(diff.inserted, text_to_unicode('너나는 학생'))
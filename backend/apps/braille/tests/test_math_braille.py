@@ -0,0 +1,235 @@
+"""
+Math Braille Tests
+"""
+import json
+import unicodedata
+from unittest.mock import patch
+from django.test import TestCase, Client
+from apps.braille.services import BraillePatternService
+from utils.braille_converter import BLANK_CELL, dot_numbers_to_unicode, text_to_unicode, unicode_to_cells
+from utils.content_extractor import contains_formula, extract_formula, find_formulas
+from utils import math_braille
+from utils.math_braille import get_math_table, math_alignment, math_to_unicode, split_words, tokenize
+from utils.mixed_braille import mixed_to_unicode
+
+
+def _dots(*cells):
+    return dot_numbers_to_unicode(list(cells))
+
+
+NUMBER = _dots([3, 4, 5, 6])
+LETTER = _dots([3, 5, 6])
+SUPERSCRIPT = _dots([4, 5])
+FRACTION = _dots([3, 4])
+ROOT = _dots([3, 4, 5])
+ROOT_END = _dots([1, 2, 4, 5, 6])
+
+
+class MathTokenizerTest(TestCase):
+    """수식 토크나이저 테스트"""
+
+    def test_token_kinds(self):
+        """단일 스캔으로 종류별 토큰 분류"""
+        kinds = [token.kind for token in tokenize('sin x² + 3.5 ≤ √y')]
+        self.assertEqual(
+            kinds,
+            ['func', 'space', 'letter', 'sup', 'space', 'symbol', 'space', 'number', 'space', 'symbol', 'space', 'root', 'letter'],
+        )
+
+    def test_tokens_cover_input(self):
+        """토큰을 이어 붙이면 원문 (위치 포함)"""
+        formula = '∫₀¹ f(x) dx = \\frac{1}{2} 넓이'
+        tokens = tokenize(formula)
+        self.assertEqual(''.join(token.text for token in tokens), formula)
+        for token in tokens:
+            self.assertEqual(formula[token.start:token.end], token.text)
+
+
+class MathBrailleEncoderTest(TestCase):
+    """수식 점자 인코더 테스트"""
+
+    def test_number_sign(self):
+        """수 앞에 수표, 소수점 포함"""
+        digits = get_math_table().digits
+        self.assertEqual(math_to_unicode('12'), NUMBER + '12'.translate(digits))
+        self.assertEqual(math_to_unicode('1.5'), NUMBER + _dots([1]) + _dots([2, 5, 6]) + _dots([1, 5]))
+
+    def test_superscript(self):
+        """x², x^2, x^{2} 는 모두 같은 점자"""
+        expected = math_to_unicode('x²')
+        self.assertEqual(expected, LETTER + _dots([1, 3, 4, 6]) + SUPERSCRIPT + NUMBER + _dots([1, 2]))
+        self.assertEqual(math_to_unicode('x^2'), expected)
+        self.assertEqual(math_to_unicode('x^{2}'), expected)
+
+    def test_fraction_denominator_first(self):
+        """분수는 분모, 분수표, 분자 순"""
+        expected = math_to_unicode('2') + FRACTION + math_to_unicode('1')
+        self.assertEqual(math_to_unicode('1/2'), expected)
+        self.assertEqual(math_to_unicode('\\frac{1}{2}'), expected)
+
+    def test_root(self):
+        """근호는 근호표와 닫는 표 사이에 내용"""
+        self.assertEqual(math_to_unicode('√2'), ROOT + math_to_unicode('2') + ROOT_END)
+        self.assertEqual(math_to_unicode('√(x+1)'), ROOT + math_to_unicode('x+1') + ROOT_END)
+        self.assertEqual(math_to_unicode('\\sqrt{x}'), math_to_unicode('√x'))
+
+    def test_integral_and_latex_alias(self):
+        """LaTeX 명령은 같은 기호의 점자"""
+        self.assertEqual(math_to_unicode('\\int'), math_to_unicode('∫'))
+        self.assertEqual(math_to_unicode('\\alpha \\le \\pi'), math_to_unicode('α ≤ π'))
+        self.assertNotEqual(math_to_unicode('∫'), BLANK_CELL)
+
+    def test_no_blank_for_symbols(self):
+        """수식 기호가 빈 셀로 사라지지 않음"""
+        for symbol in ['+', '=', '×', '÷', '∞', '∑', '∂', '≠']:
+            self.assertNotIn(BLANK_CELL, math_to_unicode(symbol), symbol)
+
+    def test_spaces_and_hangul(self):
+        """공백은 빈 셀 하나, 한글은 한글 점자 테이블"""
+        self.assertEqual(math_to_unicode('x 넓이'), math_to_unicode('x') + BLANK_CELL + text_to_unicode('넓이'))
+
+    def test_spaces_inside_groups(self):
+        """묶음 안에 공백이 있어도 수식 전체를 한 번에 인코딩한 것과 같음"""
+        table = get_math_table()
+        for formula in ['\\frac{a + b}{2}', '√(x + 1)', '\\sqrt{x + 1}', 'x^{2 + n}', '√(x + 1) = 2']:
+            self.assertEqual(math_to_unicode(formula), table.encode(table.tokenize(formula)), formula)
+        self.assertEqual(math_to_unicode('\\frac{a + b}{2}')[:len(math_to_unicode('2'))], math_to_unicode('2'))
+        self.assertTrue(math_to_unicode('√(x + 1)').endswith(ROOT_END))
+        self.assertEqual(split_words('√(x + 1) = 2'), ['√(x + 1)', '=', '2'])
+
+    def test_spaced_group_alignment(self):
+        """묶음 안 공백이 든 어절도 정렬 배열 길이/끝 셀이 맞음, 혼합 변환도 같은 점자"""
+        formula = '\\frac{a + b}{2} = 1'
+        offsets = math_alignment(formula)
+        self.assertEqual(len(offsets), len(formula) + 1)
+        self.assertEqual(offsets[-1], len(math_to_unicode(formula)))
+        self.assertEqual(mixed_to_unicode('식 x^{2 + n} = 0', formulas=True).count(math_to_unicode('x^{2 + n}')), 1)
+
+    def test_nfc_and_ascii_digits(self):
+        """NFD 한글은 NFC로, 전각/아랍 숫자는 수가 아님"""
+        self.assertEqual(math_to_unicode(unicodedata.normalize('NFD', 'x 넓이')), math_to_unicode('x 넓이'))
+        self.assertEqual([token.kind for token in tokenize('１٣')], ['other', 'other'])
+
+    def test_memo_cleared_on_table_change(self):
+        """한글 점자 테이블이 바뀌면 수식 어절 메모를 비움"""
+        math_to_unicode('넓이')
+        self.assertGreater(math_braille._memo_math_word.cache_info().currsize, 0)
+        with patch.object(math_braille, 'table_version', return_value=('changed', 0)):
+            math_braille.check_table_version()
+        self.assertEqual(math_braille._memo_math_word.cache_info().currsize, 0)
+
+    def test_alignment_by_word(self):
+        """수식 정렬은 어절 단위 (어절 안의 문자는 어절 시작 셀)"""
+        formula = '1/2 + x²'
+        offsets = math_alignment(formula)
+        braille = math_to_unicode(formula)
+        self.assertEqual(len(offsets), len(formula) + 1)
+        self.assertEqual(offsets[-1], len(braille))
+        first = len(math_to_unicode('1/2'))
+        self.assertEqual(list(offsets[:4]), [0, 0, 0, first])
+        self.assertEqual(braille[offsets[6]:], math_to_unicode('x²'))
+
+    def test_service_uses_math_encoder(self):
+        """BraillePatternService 수식 변환"""
+        cells = BraillePatternService().convert_formula_to_braille('x² + 1')
+        self.assertEqual(cells, unicode_to_cells(math_to_unicode('x² + 1')))
+        self.assertEqual(BraillePatternService().convert_formula_to_braille(''), [])
+
+
+class MathStrategyTest(TestCase):
+    """수학 전략 변환 테스트"""
+
+    def test_math_strategy_uses_math_braille(self):
+        from apps.exam.services import BrailleConversionService
+        from utils.braille_converter import unicode_to_packed
+
+        service = BrailleConversionService()
+        text = 'x² + 2x + 1 = 0'
+        expected = math_to_unicode(service._strategy_text(text, 'math'))
+        self.assertTrue(expected.startswith(math_to_unicode('x²')))
+        self.assertEqual(service._convert_with_strategy(text, 'math'), expected)
+        self.assertEqual(service._convert_packed_with_strategy(text, 'math'), unicode_to_packed(expected))
+
+
+class FormulaScannerTest(TestCase):
+    """수식 스캐너 테스트"""
+
+    def test_finds_all_formulas_with_spans(self):
+        text = 'x² + 2x + 1 = 0 이고 y = 3 이다. 또 \\frac{1}{2}x - 3 = 0의 해는?'
+        spans = find_formulas(text)
+        self.assertEqual([span.text for span in spans], ['x² + 2x + 1 = 0', 'y = 3', '\\frac{1}{2}x - 3 = 0'])
+        for span in spans:
+            self.assertEqual(text[span.start:span.end], span.text)
+
+    def test_no_formula(self):
+        """괄호나 낱글자만으로는 수식 아님"""
+        self.assertEqual(find_formulas('(예) 사과 A를 고르시오'), [])
+        self.assertFalse(contains_formula('오늘 날씨가 맑다.'))
+        self.assertFalse(contains_formula(''))
+        self.assertEqual(extract_formula('수식 없음'), '')
+
+    def test_edge_words_trimmed(self):
+        """앞뒤의 영어 낱말은 수식에서 제외, 변수 곱은 유지"""
+        self.assertEqual(extract_formula('The value of x + 1 = 3.'), 'x + 1 = 3')
+        self.assertEqual(extract_formula('xy + 1 = z'), 'xy + 1 = z')
+        self.assertEqual(extract_formula('∫ f(x) dx 를 구하시오'), '∫ f(x) dx')
+
+    def test_hyphenated_prose_not_formula(self):
+        """글자에 붙은 하이픈 합성어는 옆의 수식에 붙이지 않음"""
+        self.assertEqual([span.text for span in find_formulas('A-B형 혈액과 x + 1 = 3')], ['x + 1 = 3'])
+        self.assertEqual([span.text for span in find_formulas('x - y = 3 A-B형이다')], ['x - y = 3'])
+        self.assertEqual([span.text for span in find_formulas('노-사 합의와 COVID-19 검사, y = 2x')], ['y = 2x'])
+        # 하이픈 말고 연산 기호가 있으면 조사가 붙어도 수식
+        self.assertEqual(extract_formula('x²-1을 인수분해하시오'), 'x²-1')
+        self.assertEqual(extract_formula('A - B = C형'), 'A - B = C')
+
+    def test_long_unit(self):
+        """긴 단원의 모든 수식 (길이 제한 없음)"""
+        formula = ' + '.join(f'{n}x' for n in range(1, 40)) + ' = 0'
+        text = ('다음 식을 풀어라. ' + formula + '. ') * 500
+        spans = find_formulas(text)
+        self.assertEqual(len(spans), 500)
+        self.assertTrue(all(span.text == formula for span in spans))
+
+
+class FormulaViewTest(TestCase):
+    """수식 점자 변환 API 테스트"""
+
+    def test_convert_formula(self):
+        response = Client().post(
+            '/api/braille/formula/',
+            data=json.dumps({'formula': '\\frac{1}{2}'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['cells'], unicode_to_cells(math_to_unicode('1/2')))
+
+    def test_extract_formula_returns_all_spans(self):
+        response = Client().post(
+            '/api/braille/extract-formula/',
+            data=json.dumps({'text': 'x² + 1 = 0 이고 y = 3 이다'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['has_formula'])
+        self.assertEqual(data['formula'], 'x² + 1 = 0')
+        self.assertEqual(data['formulas'], [
+            {'formula': 'x² + 1 = 0', 'start': 0, 'end': 10},
+            {'formula': 'y = 3', 'start': 14, 'end': 19},
+        ])
+
+    def test_extract_formula_spans_in_original_text(self):
+        """앞뒤 공백이 있어도 위치는 보낸 텍스트 기준"""
+        text = '   식 x + 1 = 2  '
+        response = Client().post(
+            '/api/braille/extract-formula/',
+            data=json.dumps({'text': text}),
+            content_type='application/json',
+        )
+        [span] = response.json()['formulas']
+        self.assertEqual(text[span['start']:span['end']], 'x + 1 = 2')
+        self.assertEqual(span['formula'], 'x + 1 = 2')
+        blank = Client().post('/api/braille/extract-formula/', data=json.dumps({'text': '   '}), content_type='application/json')
+        self.assertEqual(blank.status_code, 400)
@@ -0,0 +1,126 @@
+"""
+Mixed Script Braille Tests
+"""
+from django.test import TestCase
+from utils.braille_converter import BLANK_CELL, dot_numbers_to_unicode, text_to_unicode, unicode_to_packed, unpack_alignment
+from utils.braille_parallel import encode_alignment, encode_packed
+from utils.english_braille import english_to_unicode
+from utils.math_braille import math_to_unicode
+from utils.mixed_braille import mixed_alignment, mixed_to_unicode
+from utils.script_segmenter import HANGUL, LATIN, MATH, NUMBER, PUNCT, SPACE, segment
+
+
+def _dots(*cells):
+    return dot_numbers_to_unicode(list(cells))
+
+
+NUMBER_SIGN = _dots([3, 4, 5, 6])
+ROMAN = _dots([3, 5, 6])
+ROMAN_END = _dots([2, 5, 6])
+
+
+class ScriptSegmenterTest(TestCase):
+    """문자 종류별 구간 나누기 테스트"""
+
+    def test_segment_kinds(self):
+        text = 'DNA는 3.5배, 큼'
+        runs = segment(text)
+        self.assertEqual(
+            [(run.kind, run.text) for run in runs],
+            [(LATIN, 'DNA'), (HANGUL, '는'), (SPACE, ' '), (NUMBER, '3.5'), (HANGUL, '배'),
+             (PUNCT, ','), (SPACE, ' '), (HANGUL, '큼')],
+        )
+        self.assertEqual(''.join(run.text for run in runs), text)
+        self.assertTrue(all(text[run.start:run.end] == run.text for run in runs))
+
+    def test_segment_formulas(self):
+        runs = segment('값은 x + 1 = 3 이다', formulas=True)
+        math = [run for run in runs if run.kind == MATH]
+        self.assertEqual([run.text for run in math], ['x + 1 = 3'])
+
+
+    def test_ascii_digits_only(self):
+        """전각/아랍 숫자는 수 구간이 아님"""
+        self.assertEqual([run.kind for run in segment('１٣')], [PUNCT])
+
+
+class MixedBrailleTest(TestCase):
+    """한글 바탕 혼합 텍스트 변환 테스트"""
+
+    def test_korean_only_matches_table(self):
+        self.assertEqual(mixed_to_unicode('나는 학생이다.'), text_to_unicode('나는 학생이다.'))
+
+    def test_number(self):
+        """수표 + 숫자, ㄴ 등으로 시작하는 한글 앞은 띄움"""
+        self.assertEqual(mixed_to_unicode('3월'), NUMBER_SIGN + _dots([1, 4]) + text_to_unicode('월'))
+        self.assertEqual(mixed_to_unicode('5년'), NUMBER_SIGN + _dots([1, 5]) + BLANK_CELL + text_to_unicode('년'))
+
+    def test_latin_passage(self):
+        """여러 어절에 걸친 로마자 구간은 로마자표/종료표 한 쌍"""
+        braille = mixed_to_unicode('New York에 갔다')
+        self.assertEqual(braille.count(ROMAN), 1)
+        self.assertTrue(braille.startswith(ROMAN + english_to_unicode('New', grade=1)))
+        self.assertIn(english_to_unicode('York', grade=1) + ROMAN_END + text_to_unicode('에'), braille)
+        # 텍스트 끝의 로마자 구간은 닫지 않음
+        self.assertFalse(mixed_to_unicode('이름은 Tom').endswith(ROMAN_END))
+
+    def test_latin_not_blank(self):
+        """로마자/숫자가 빈 셀로 사라지지 않음"""
+        self.assertEqual(text_to_unicode('abc'), BLANK_CELL * 3)
+        self.assertNotIn(BLANK_CELL, mixed_to_unicode('abc123'))
+
+    def test_formulas(self):
+        text = '값은 x + 1 = 3 이다'
+        self.assertIn(math_to_unicode('x + 1 = 3'), mixed_to_unicode(text, formulas=True))
+        self.assertNotIn(math_to_unicode('x + 1 = 3'), mixed_to_unicode(text))
+
+    def test_alignment(self):
+        for text in ('나는 학생이다', '2024년 3월', 'New York에 갔다.', '값은 x + 1 = 3 이다'):
+            for formulas in (False, True):
+                offsets = mixed_alignment(text, formulas)
+                self.assertEqual(len(offsets), len(text) + 1)
+                self.assertEqual(offsets[-1], len(mixed_to_unicode(text, formulas)))
+        # 한글 어절은 문자 단위
+        offsets = mixed_alignment('DNA 구조')
+        self.assertEqual(offsets[5] - offsets[4], len(text_to_unicode('구')))
+
+    def test_non_ascii_digits(self):
+        """전각/아랍 숫자가 든 텍스트도 점자 문자만 나옴 (패킹 가능)"""
+        for text in ('A１ 학생', '３월 ٣개', 'x１ + 1 = 2'):
+            for encoder in ('mixed', 'mixed_math'):
+                packed = encode_packed(text, encoder)
+                self.assertEqual(len(unpack_alignment(encode_alignment(text, encoder))), len(text) + 1)
+                self.assertEqual(packed, unicode_to_packed(mixed_to_unicode(text, encoder == 'mixed_math')))
+
+    def test_encoders(self):
+        for text in ('나는 학생이다', 'pH 7은 중성'):
+            self.assertEqual(encode_packed(text, 'mixed'), unicode_to_packed(mixed_to_unicode(text)))
+            self.assertEqual(list(unpack_alignment(encode_alignment(text, 'mixed'))), list(mixed_alignment(text)))
+
+
+class EnglishSegmentTest(TestCase):
+    """영어 바탕 텍스트 속 한글 구간 테스트"""
+
+    def test_punct_follows_script(self):
+        self.assertEqual(
+            english_to_unicode('Hello세계,'),
+            english_to_unicode('Hello') + text_to_unicode('세계,'),
+        )
+        self.assertEqual(
+            english_to_unicode('세계Hello!'),
+            text_to_unicode('세계') + english_to_unicode('Hello!'),
+        )
+
+
+class MixedStrategyTest(TestCase):
+    """과목별 전략의 혼합 변환 테스트"""
+
+    def test_strategies(self):
+        from apps.exam.services import BrailleConversionService
+
+        service = BrailleConversionService()
+        text = '물의 화학식은 H2O이고 온도 T = 100 이다'
+        self.assertEqual(service._convert_with_strategy(text, 'social'), mixed_to_unicode(text))
+        self.assertEqual(service._convert_with_strategy(text, 'science'), mixed_to_unicode(text, formulas=True))
+        packed, _ = service._convert_aligned_with_strategy(text, 'science')
+        self.assertEqual(packed, unicode_to_packed(mixed_to_unicode(text, formulas=True)))
@@ -0,0 +1,53 @@
+"""
+Braille Output Format Tests
+"""
+import io
+from django.test import TestCase
+from utils.braille_converter import MASK_DOTS, text_to_unicode, text_to_packed, unicode_to_cells
+from utils.braille_output import (
+    BRF_CHARS, cells_to_unicode, unicode_to_brf, packed_to_brf, iter_braille_file, write_braille_file,
+)
+from apps.exam.views import convert_cells_to_brl
+
+
+class BrailleOutputTest(TestCase):
+    """.brl / BRF 출력 테스트"""
+
+    def test_all_64_patterns(self):
+        """64개 점형 전체를 U+2800 + 마스크로 인코딩"""
+        cells = [list(dots) for dots in MASK_DOTS]
+        braille = cells_to_unicode(cells)
+        self.assertEqual(braille, ''.join(chr(0x2800 + mask) for mask in range(64)))
+        self.assertEqual(unicode_to_cells(braille), cells)
+        self.assertEqual(convert_cells_to_brl(cells), braille)
+
+    def test_brf_table(self):
+        """BRF 테이블은 64개 서로 다른 ASCII 문자"""
+        self.assertEqual(len(set(BRF_CHARS)), 64)
+        self.assertEqual(unicode_to_brf('⠀⠁⠃⠿'), ' AB=')
+
+    def test_packed_to_brf(self):
+        """패킹 셀에서 바로 BRF 생성"""
+        text = '오늘 날씨가 맑다.'
+        self.assertEqual(packed_to_brf(text_to_packed(text)), unicode_to_brf(text_to_unicode(text)))
+
+    def test_streaming_writer_lines(self):
+        """청크 경계와 무관하게 줄 폭으로 나눔"""
+        braille = text_to_unicode('나는 학생이다. ' * 20)
+        chunks = [braille[i:i + 7] for i in range(0, len(braille), 7)]
+        lines = list(iter_braille_file(chunks, 'brl', line_cells=10))
+        self.assertTrue(all(len(line) == 11 for line in lines[:-1]))
+        self.assertEqual(''.join(line.rstrip('\n') for line in lines), braille)
+
+    def test_brf_pages(self):
+        """BRF는 CRLF 줄바꿈, 쪽마다 폼피드"""
+        out = io.StringIO()
+        lines = write_braille_file(['⠁' * 30], out, 'brf', line_cells=5, page_lines=2)
+        self.assertEqual(lines, 6)
+        self.assertEqual(out.getvalue().count('\f'), 3)
+        self.assertTrue(out.getvalue().startswith('AAAAA\r\nAAAAA\r\n\f'))
+
+    def test_invalid_format(self):
+        """지원하지 않는 파일 형식"""
+        with self.assertRaises(ValueError):
+            list(iter_braille_file(['⠁'], 'txt'))
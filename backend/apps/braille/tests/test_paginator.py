@@ -0,0 +1,73 @@
+"""
+Braille Paginator Tests
+"""
+import json
+from django.test import TestCase, Client
+from utils.braille_converter import BLANK_CELL, text_to_unicode
+from utils.braille_paginator import BraillePaginator, paginate_text
+
+
+class BraillePaginatorTest(TestCase):
+    """디스플레이 창 나누기 테스트"""
+
+    def test_words_not_split(self):
+        """창에 들어가는 어절은 자르지 않고 다음 창으로 넘김"""
+        text = '오늘 날씨가 맑다 그래서 우리는 학교에 갔다'
+        words = text.split()
+        width = max(len(text_to_unicode(word)) for word in words)
+        paginator = paginate_text(text, width)
+        for window in paginator.windows():
+            self.assertLessEqual(len(window), width)
+            self.assertFalse(window.startswith(BLANK_CELL) or window.endswith(BLANK_CELL))
+        # 창을 빈 셀로 이으면 원래 점자 (어절 경계에서만 나눔)
+        self.assertEqual(BLANK_CELL.join(paginator.windows()), text_to_unicode(text))
+
+    def test_long_word_split_at_width(self):
+        """창보다 긴 어절만 폭 단위로 나눔"""
+        braille = text_to_unicode('대한민국')
+        paginator = BraillePaginator(braille, 3)
+        self.assertEqual(''.join(paginator.windows()), braille)
+        self.assertTrue(all(len(window) <= 3 for window in paginator.windows()))
+
+    def test_random_access(self):
+        """k번째 창을 바로 조회, 셀 위치 → 창 번호"""
+        braille = text_to_unicode('가나 다라 마바 사아 ' * 100)
+        for width in (3, 20, 40):
+            paginator = BraillePaginator(braille, width)
+            windows = list(paginator.windows())
+            self.assertEqual(paginator.window(len(windows) // 2), windows[len(windows) // 2])
+            self.assertEqual(paginator.window(-1), windows[-1])
+            k = len(windows) // 3
+            self.assertEqual(paginator.window_at(paginator.starts[k]), k)
+
+    def test_empty(self):
+        self.assertEqual(len(BraillePaginator('', 3)), 0)
+        self.assertEqual(len(BraillePaginator(BLANK_CELL * 5, 3)), 0)
+        with self.assertRaises(ValueError):
+            BraillePaginator('⠁', 0)
+
+
+class BraillePaginateViewTest(TestCase):
+    """창 나누기 API 테스트"""
+
+    def test_paginate(self):
+        response = Client().post(
+            '/api/braille/paginate/',
+            data=json.dumps({'text': '나는 학생이다', 'width': 40, 'format': 'unicode', 'count': 10}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['total_windows'], 1)
+        self.assertEqual(data['windows'][0], {
+            'index': 0, 'offset': 0, 'length': len(text_to_unicode('나는 학생이다')),
+            'cells': text_to_unicode('나는 학생이다'),
+        })
+
+    def test_invalid_width(self):
+        response = Client().post(
+            '/api/braille/paginate/',
+            data=json.dumps({'text': '나는', 'width': 0}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
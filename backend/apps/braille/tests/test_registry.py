@@ -0,0 +1,40 @@
+"""
+Braille Table Registry Tests
+"""
+import json
+from django.test import TestCase, Client
+from utils import braille_registry
+from utils.braille_converter import text_to_cells, text_to_unicode
+
+
+class BrailleRegistryTest(TestCase):
+    """점자 테이블 레지스트리 테스트"""
+
+    def test_compiled_at_startup(self):
+        """앱 시작(ready) 시 이미 컴파일됨"""
+        self.assertIsNotNone(braille_registry._TABLE)
+        self.assertIs(braille_registry.get_table(), braille_registry._TABLE)
+
+    def test_immutable_lookups(self):
+        """조회 테이블은 읽기 전용"""
+        table = braille_registry.get_table()
+        with self.assertRaises(TypeError):
+            table.translate[ord('가')] = ''
+        with self.assertRaises(TypeError):
+            table.source['가'] = (0,) * 6
+        self.assertIsInstance(table.syllables, tuple)
+        self.assertEqual(len(table.syllables), braille_registry.HANGUL_COUNT)
+
+    def test_syllable_lookup(self):
+        """음절 배열과 변환 테이블이 일치"""
+        table = braille_registry.get_table()
+        self.assertEqual(table.syllable('학'), text_to_unicode('학'))
+        self.assertIsNone(table.syllable('a'))
+        self.assertEqual(table.char('@'), braille_registry.BLANK_CELL)
+
+    def test_legacy_endpoint_uses_same_table(self):
+        """레거시 /api/api/ 경로도 같은 테이블로 변환"""
+        client = Client()
+        for url in ('/api/braille/encode/', '/api/api/braille/encode/'):
+            response = client.post(url, json.dumps({'text': '사랑'}), content_type='application/json')
+            self.assertEqual(json.loads(response.content), {'cells': text_to_cells('사랑')})
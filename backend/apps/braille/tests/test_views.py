@@ -0,0 +1,178 @@
+"""
+Braille API View Tests
+"""
+import json
+from unittest.mock import patch
+from django.test import TestCase, Client
+from apps.braille import sessions
+from utils.braille_converter import text_to_cells, text_to_packed, text_to_unicode
+
+
+class BrailleEncodeViewTest(TestCase):
+    """점자 변환 API 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+
+    def post(self, url, payload, **extra):
+        return self.client.post(url, json.dumps(payload), content_type='application/json', **extra)
+
+    def test_encode_legacy_cells(self):
+        """기본 형식은 레거시 셀 배열"""
+        response = self.post('/api/braille/encode/', {'text': '사랑'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {'cells': text_to_cells('사랑')})
+
+    def test_encode_packed_octet_stream(self):
+        """packed + octet-stream 요청은 바이너리 응답"""
+        response = self.post(
+            '/api/braille/encode/', {'text': '사랑', 'format': 'packed'},
+            HTTP_ACCEPT='application/octet-stream',
+        )
+        self.assertEqual(response['Content-Type'], 'application/octet-stream')
+        self.assertEqual(response.content, text_to_packed('사랑'))
+
+    def test_encode_invalid_format(self):
+        """지원하지 않는 형식"""
+        response = self.post('/api/braille/encode/', {'text': '사랑', 'format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_batch(self):
+        """일괄 변환 (id 유지, 항목별 오류)"""
+        response = self.post('/api/braille/encode/batch/', {
+            'items': [{'id': 'a', 'text': '학교'}, {'id': 'b', 'text': 3}, {'text': '친구'}],
+        })
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(data['results'][0], {'id': 'a', 'cells': text_to_cells('학교')})
+        self.assertIn('error', data['results'][1])
+        self.assertEqual(data['results'][2], {'id': 2, 'cells': text_to_cells('친구')})
+
+    def test_batch_limit(self):
+        """일괄 변환 항목 수 제한"""
+        response = self.post('/api/braille/encode/batch/', {'texts': ['가'] * 501})
+        self.assertEqual(response.status_code, 413)
+
+    def test_encode_stream_ndjson(self):
+        """NDJSON 스트리밍은 width 셀 단위 청크"""
+        response = self.post('/api/braille/encode/', {
+            'text': '나는 학생이다.', 'stream': 'ndjson', 'width': 4, 'format': 'unicode',
+        })
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        frames = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertTrue(frames[-1]['done'])
+        chunks = [frame['cells'] for frame in frames[:-1]]
+        self.assertTrue(all(len(chunk) == 4 for chunk in chunks[:-1]))
+        self.assertEqual(''.join(chunks), text_to_unicode('나는 학생이다.'))
+
+
+class PatternSequenceViewTest(TestCase):
+    """패턴 스트림 API 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+
+    def post(self, payload):
+        return self.client.post('/api/braille/pattern/sequence/', json.dumps(payload), content_type='application/json')
+
+    def test_events(self):
+        """사건 목록 → 단건 API와 같은 패턴 스트림"""
+        from apps.braille.services import BraillePatternService
+
+        service = BraillePatternService()
+        events = [
+            {'type': 'answer', 'data': {'is_correct': True}},
+            {'type': 'number', 'data': {'number': 4}},
+            {'type': 'status', 'data': {'status': 'pause'}},
+            {'type': 'unknown'},
+        ]
+        response = self.post({'events': events})
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data['count'], 4)
+        self.assertEqual(data['patterns'], [service.generate_pattern(e['type'], e.get('data')) for e in events])
+
+    def test_series(self):
+        """수치 계열 → 추세/극값 패턴"""
+        data = json.loads(self.post({'series': [1, 3, 2, 2, 4]}).content)
+        self.assertEqual(
+            [(e['type'], e['data']) for e in data['events']],
+            [('trend', {'trend': 'increase'}), ('extremum', {'type': 'maximum'}),
+             ('trend', {'trend': 'decrease'}), ('trend', {'trend': 'stable'}), ('trend', {'trend': 'increase'})],
+        )
+        self.assertEqual(data['patterns'][1], [1, 0, 1, 0, 0, 0])
+        # tolerance 이하 변화는 유지
+        flat = json.loads(self.post({'series': [1, 1.05, 1], 'tolerance': 0.1}).content)
+        self.assertEqual({e['data']['trend'] for e in flat['events']}, {'stable'})
+
+    def test_single_pattern_shares_service(self):
+        """단건 패턴 API도 요청마다 서비스를 만들지 않고 같은 패턴 테이블 사용"""
+        from unittest.mock import patch
+
+        with patch('apps.braille.views.BraillePatternService', side_effect=AssertionError):
+            response = self.client.post(
+                '/api/braille/pattern/', json.dumps({'type': 'number', 'data': {'number': 4}}),
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+        sequence = json.loads(self.post({'events': [{'type': 'number', 'data': {'number': 4}}]}).content)
+        self.assertEqual(json.loads(response.content)['pattern'], sequence['patterns'][0])
+
+    def test_unhashable_input_is_blank(self):
+        """type/number가 배열·객체여도 500이 아니라 빈 패턴"""
+        blank = [0, 0, 0, 0, 0, 0]
+        for payload in ({'type': ['answer']}, {'type': {'a': 1}}, {'type': 'number', 'data': {'number': [1]}},
+                        {'type': 'number', 'data': {'number': {'n': 1}}}, {'type': 'number', 'data': {'number': True}}):
+            response = self.client.post('/api/braille/pattern/', json.dumps(payload), content_type='application/json')
+            self.assertEqual(response.status_code, 200, payload)
+            self.assertEqual(json.loads(response.content)['pattern'], blank)
+        data = json.loads(self.post({'events': [{'type': 'number', 'data': {'number': [2]}}]}).content)
+        self.assertEqual(data['patterns'], [blank])
+
+    def test_invalid(self):
+        self.assertEqual(self.post({}).status_code, 400)
+        self.assertEqual(self.post({'events': [], 'series': []}).status_code, 400)
+        self.assertEqual(self.post({'series': [1, 'a']}).status_code, 400)
+        self.assertEqual(self.post({'events': [{'data': {}}]}).status_code, 400)
+
+
+class BrailleSessionViewTest(TestCase):
+    """증분 변환 세션 API 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+
+    def post(self, url, payload):
+        return self.client.post(url, json.dumps(payload), content_type='application/json')
+
+    def test_session_edits(self):
+        created = json.loads(self.post('/api/braille/session/', {'text': '나는 학생', 'format': 'unicode'}).content)
+        self.assertEqual(created['cells'], text_to_unicode('나는 학생'))
+        url = f"/api/braille/session/{created['session_id']}/edit/"
+
+        braille = created['cells']
+        response = self.post(url, {'edits': [{'start': 5, 'end': 5, 'text': '이다'}], 'version': 0, 'format': 'unicode'})
+        data = json.loads(response.content)
+        self.assertEqual(data['version'], 1)
+        for diff in data['diffs']:
+            braille = braille[:diff['start']] + diff['cells'] + braille[diff['start'] + diff['deleted']:]
+        self.assertEqual(braille, text_to_unicode('나는 학생이다'))
+        self.assertEqual(data['total_cells'], len(braille))
+
+        # 버전이 맞지 않으면 409
+        self.assertEqual(self.post(url, {'start': 0, 'end': 0, 'text': '가', 'version': 0}).status_code, 409)
+        # 범위 밖 편집은 400이며 앞의 편집도 적용하지 않음
+        edits = [{'start': 0, 'end': 0, 'text': '가'}, {'start': 0, 'end': 100, 'text': ''}]
+        self.assertEqual(self.post(url, {'edits': edits}).status_code, 400)
+        # 다른 요청이 편집 중이면 409
+        with patch.object(sessions, 'LOCK_WAIT', 0), sessions.edit_session(created['session_id']):
+            self.assertEqual(self.post(url, {'start': 0, 'end': 0, 'text': '가'}).status_code, 409)
+
+        current = json.loads(self.client.get(f"/api/braille/session/{created['session_id']}/?format=unicode").content)
+        self.assertEqual(current['text'], '나는 학생이다')
+        self.assertEqual(current['version'], 1)
+        self.assertEqual(current['cells'], braille)
+
+        self.assertEqual(self.client.delete(f"/api/braille/session/{created['session_id']}/").status_code, 200)
+        self.assertEqual(self.post(url, {'start': 0, 'end': 0, 'text': '가'}).status_code, 404)
@@ -3,9 +3,17 @@ from . import views
 
 urlpatterns = [
     path("encode/", views.braille_convert, name="braille_encode"),
+    path("encode/batch/", views.braille_convert_batch, name="braille_encode_batch"),  # 일괄 변환
+    path("paginate/", views.braille_paginate, name="braille_paginate"),  # 디스플레이 폭 단위 창
+    path("session/", views.braille_session_create, name="braille_session_create"),  # 증분 변환 세션
+    path("session/<str:session_id>/", views.braille_session, name="braille_session"),
+    path("session/<str:session_id>/edit/", views.braille_session_edit, name="braille_session_edit"),
+    path("decode/", views.braille_decode, name="braille_decode"),  # 점자 → 텍스트
+    path("decode/batch/", views.braille_decode_batch, name="braille_decode_batch"),  # 일괄 역변환
     path("convert/", views.braille_convert, name="braille_convert"),  # legacy compatibility
     path("", views.braille_convert, name="braille_convert_root"),  # /api/convert/ 호환
     path("pattern/", views.generate_pattern, name="generate_pattern"),  # New Jeomgeuli-Suneung
+    path("pattern/sequence/", views.generate_pattern_sequence, name="generate_pattern_sequence"),  # 패턴 스트림
     path("formula/", views.convert_formula, name="convert_formula"),  # 수식 점자 변환
     path("extract-formula/", views.extract_formula, name="extract_formula"),  # 수식 추출
 ]
\ No newline at end of file
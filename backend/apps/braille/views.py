@@ -1,36 +1,463 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 import json
-from utils.braille_converter import text_to_cells
+from utils.braille_converter import (
+    CELL_FORMATS, text_to_unicode, texts_to_unicode, unicode_to_cells, unicode_to_packed,
+    serialize_braille, deserialize_braille, iter_text_blocks, iter_braille_chunks,
+)
+from utils.braille_contraction import contracted_text_to_unicode
+from utils.braille_decoder import unicode_to_text
+from utils.braille_paginator import paginate_text, parse_window_range, window_frames
 from .services import BraillePatternService
+from .sessions import (
+    MAX_SESSION_CHARS, SessionBusy, close_session, create_session, edit_session, get_session, save_session,
+)
+from .streaming import STREAM_MODES, braille_stream_response, parse_chunk_width
+
+# 일괄 변환 요청 한도
+BATCH_MAX_ITEMS = 500
+BATCH_MAX_CHARS = 200000
+
+# 패턴 스트림 요청 한도 (사건/수치 개수)
+PATTERN_SEQUENCE_MAX_ITEMS = 10000
+
+# 패턴 서비스는 상태가 없어 요청 간에 공유
+_pattern_service = BraillePatternService()
+
+
+def _is_contracted(value) -> bool:
+    """약자/약어 적용 여부 (JSON bool 또는 쿼리 문자열)"""
+    if isinstance(value, str):
+        return value.lower() in ('1', 'true', 'yes')
+    return bool(value)
 
 @csrf_exempt
 def braille_convert(request):
     """
-    POST {"text": "..."} -> {"cells": [[0|1 x 6], ...]}
+    POST {"text": "...", "format": "cells|packed|unicode"} -> {"cells": ...}
     프론트엔드 호환을 위한 점자 변환 API
+    - cells(기본): [[0|1 x 6], ...] 레거시 형식
+    - packed: 셀당 1바이트(6비트 점 마스크)를 base64로 인코딩
+      (Accept: application/octet-stream 이면 바이너리 그대로 응답)
+    - unicode: 점자 유니코드 문자열 (U+2800~U+283F)
+    stream=ndjson|sse 이면 width(기본 3) 셀 단위 청크로 나누어 스트리밍
+    contracted=true 이면 약자/약어 적용
     """
     try:
-        print(f"[braille_convert] Request method: {request.method}")
-        print(f"[braille_convert] Request body: {request.body}")
-        
         if request.method == "GET":
-            text = request.GET.get("text","")
+            params = request.GET
         else:
-            payload = json.loads(request.body.decode("utf-8") or "{}")
-            text = payload.get("text","")
+            params = json.loads(request.body.decode("utf-8") or "{}")
+        text = params.get("text","")
+        fmt = params.get("format", "cells")
+        stream = params.get("stream")
+        convert = contracted_text_to_unicode if _is_contracted(params.get("contracted")) else text_to_unicode
         
-        print(f"[braille_convert] Text to convert: '{text}'")
-        cells = text_to_cells(text)
-        print(f"[braille_convert] Generated {len(cells)} cells")
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({"error": f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
         
-        return JsonResponse({"cells": cells})
+        if stream:
+            if stream not in STREAM_MODES:
+                return JsonResponse({"error": f"stream은 {', '.join(STREAM_MODES)} 중 하나여야 합니다"}, status=400)
+            try:
+                width = parse_chunk_width(params.get("width"))
+            except ValueError as e:
+                return JsonResponse({"error": str(e)}, status=400)
+            chunks = iter_braille_chunks(iter_text_blocks(text), width, convert)
+            return braille_stream_response(chunks, fmt, stream)
+        
+        braille = convert(text)
+        
+        if fmt == "packed" and "application/octet-stream" in request.headers.get("Accept", ""):
+            return HttpResponse(unicode_to_packed(braille), content_type="application/octet-stream")
+        
+        if fmt == "cells":
+            return JsonResponse({"cells": unicode_to_cells(braille)})
+        
+        return JsonResponse({
+            "cells": serialize_braille(braille, fmt),
+            "format": fmt,
+            "count": len(braille),
+        })
     except Exception as e:
-        print(f"[braille_convert] Error: {e}")
         import traceback
         traceback.print_exc()
         return JsonResponse({"error": str(e)}, status=500)
 
+@csrf_exempt
+def braille_convert_batch(request):
+    """
+    여러 텍스트 일괄 점자 변환
+    POST /api/braille/encode/batch/
+    Body: { items: [{ id?: any, text: string }, ...] | texts: [string, ...], format?: 'cells' | 'packed' | 'unicode', contracted?: bool }
+    -> { ok, format, count, results: [{ id, cells } | { id, error }, ...] }
+    """
+    try:
+        if request.method != "POST":
+            return JsonResponse({'error': 'POST만 지원'}, status=405)
+        
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        fmt = payload.get("format", "cells")
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({"error": f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+        
+        items = payload.get("items")
+        if items is None:
+            items = payload.get("texts")
+        if not isinstance(items, list) or not items:
+            return JsonResponse({'error': 'items 배열이 필요합니다'}, status=400)
+        if len(items) > BATCH_MAX_ITEMS:
+            return JsonResponse({'error': f'한 번에 최대 {BATCH_MAX_ITEMS}개까지 변환할 수 있습니다'}, status=413)
+        
+        # 항목 검증 (잘못된 항목은 개별 오류로 보고)
+        ids, texts, errors = [], [], {}
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                item_id, text = item.get("id", index), item.get("text")
+            else:
+                item_id, text = index, item
+            ids.append(item_id)
+            if not isinstance(text, str):
+                errors[index] = 'text는 문자열이어야 합니다'
+                text = ''
+            texts.append(text)
+        
+        if sum(len(text) for text in texts) > BATCH_MAX_CHARS:
+            return JsonResponse({'error': f'전체 텍스트는 최대 {BATCH_MAX_CHARS}자까지 변환할 수 있습니다'}, status=413)
+        
+        if _is_contracted(payload.get("contracted")):
+            converted = [contracted_text_to_unicode(text) for text in texts]
+        else:
+            converted = texts_to_unicode(texts)
+        
+        results = []
+        for index, braille in enumerate(converted):
+            if index in errors:
+                results.append({'id': ids[index], 'error': errors[index]})
+            else:
+                results.append({'id': ids[index], 'cells': serialize_braille(braille, fmt)})
+        
+        return JsonResponse({
+            'ok': True,
+            'format': fmt,
+            'count': len(results),
+            'results': results,
+        })
+    except json.JSONDecodeError:
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+def braille_paginate(request):
+    """
+    텍스트를 디스플레이 폭 단위 점자 창으로 나누기 (어절을 자르지 않음)
+    POST /api/braille/paginate/
+    Body: { text: string, width?: 3|20|40 (기본 3), start?: int, count?: int, format?: 'cells' | 'packed' | 'unicode' }
+    -> { ok, width, total_windows, windows: [{ index, offset, length, cells }, ...] }
+    """
+    try:
+        if request.method != "POST":
+            return JsonResponse({'error': 'POST만 지원'}, status=405)
+        
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        text = payload.get("text")
+        if not isinstance(text, str) or not text:
+            return JsonResponse({'error': 'text가 필요합니다'}, status=400)
+        if len(text) > BATCH_MAX_CHARS:
+            return JsonResponse({'error': f'텍스트는 최대 {BATCH_MAX_CHARS}자까지 나눌 수 있습니다'}, status=413)
+        fmt = payload.get("format", "cells")
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({"error": f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+        try:
+            width = parse_chunk_width(payload.get("width"))
+            start, count = parse_window_range(payload.get("start"), payload.get("count"))
+        except (TypeError, ValueError) as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
+        paginator = paginate_text(text, width)
+        return JsonResponse({
+            'ok': True,
+            'width': width,
+            'total_windows': len(paginator),
+            'windows': window_frames(paginator, start, count, lambda braille: serialize_braille(braille, fmt)),
+            'format': fmt,
+        })
+    except json.JSONDecodeError:
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+def _parse_edit(edit) -> tuple:
+    """편집 항목 {start, end, text}에서 (start, end, text)를 읽고 검증"""
+    if not isinstance(edit, dict):
+        raise ValueError("편집 항목은 {start, end, text} 객체여야 합니다")
+    start, end, text = edit.get('start'), edit.get('end', edit.get('start')), edit.get('text', '')
+    if not isinstance(start, int) or not isinstance(end, int) or isinstance(start, bool) or isinstance(end, bool):
+        raise ValueError("start와 end는 정수여야 합니다")
+    if not isinstance(text, str):
+        raise ValueError("text는 문자열이어야 합니다")
+    return start, end, text
+
+
+@csrf_exempt
+def braille_session_create(request):
+    """
+    증분 변환 세션 시작 (자유 변환 화면)
+    POST /api/braille/session/
+    Body: { text?: string, contracted?: bool, format?: "cells|packed|unicode" }
+    Response: { session_id, version: 0, length, total_cells, cells(전체) }
+    """
+    try:
+        if request.method != 'POST':
+            return JsonResponse({'error': 'POST만 지원'}, status=405)
+        
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        text = payload.get('text', '')
+        fmt = payload.get('format', 'cells')
+        if not isinstance(text, str):
+            return JsonResponse({'error': 'text는 문자열이어야 합니다'}, status=400)
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({'error': f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+        if len(text) > MAX_SESSION_CHARS:
+            return JsonResponse({'error': f'텍스트는 최대 {MAX_SESSION_CHARS}자까지 가능합니다'}, status=400)
+        
+        session = create_session(text, _is_contracted(payload.get('contracted')))
+        document = session.document
+        return JsonResponse({
+            'ok': True,
+            'session_id': session.id,
+            'version': session.version,
+            'length': len(document),
+            'total_cells': document.cell_count,
+            'cells': serialize_braille(document.braille, fmt),
+            'format': fmt,
+        })
+    except json.JSONDecodeError:
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+def braille_session(request, session_id):
+    """
+    증분 변환 세션 조회/종료
+    GET /api/braille/session/{id}/?format= → { version, text, total_cells, cells(전체) } (다시 맞출 때)
+    DELETE /api/braille/session/{id}/
+    """
+    try:
+        if request.method == 'DELETE':
+            if not close_session(session_id):
+                return JsonResponse({'error': '세션을 찾을 수 없습니다'}, status=404)
+            return JsonResponse({'ok': True})
+        if request.method != 'GET':
+            return JsonResponse({'error': 'GET/DELETE만 지원'}, status=405)
+        
+        fmt = request.GET.get('format', 'cells')
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({'error': f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+        session = get_session(session_id)
+        if session is None:
+            return JsonResponse({'error': '세션을 찾을 수 없습니다'}, status=404)
+        
+        document = session.document
+        return JsonResponse({
+            'ok': True,
+            'session_id': session.id,
+            'version': session.version,
+            'text': document.text,
+            'total_cells': document.cell_count,
+            'cells': serialize_braille(document.braille, fmt),
+            'format': fmt,
+        })
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+def braille_session_edit(request, session_id):
+    """
+    증분 변환 세션에 편집 적용 (편집에 걸친 어절만 다시 변환)
+    POST /api/braille/session/{id}/edit/
+    Body: { edits: [{start, end, text}, ...] 또는 start, end, text, version?: 기준 버전, format? }
+    Response: { version, diffs: [{start, deleted, cells}], total_cells }
+    - 편집은 순서대로 적용하며 각 위치는 앞 편집을 적용한 텍스트 기준
+    - diff는 점자 셀 위치 기준: cells[start:start + deleted]를 넣은 셀로 바꿈
+    - version이 세션 버전과 다르면 409 (GET으로 다시 맞춘 뒤 재시도)
+    - 편집 중 하나라도 실패하면 아무것도 적용하지 않음
+    - diff는 이 응답으로만 전달 (서버에서 밀어 주는 채널 없음)
+    - 세션은 Django 캐시에 있으므로 워커가 여럿이면 공유 캐시 필요 (sessions.py 참고)
+    """
+    try:
+        if request.method != 'POST':
+            return JsonResponse({'error': 'POST만 지원'}, status=405)
+        
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        fmt = payload.get('format', 'cells')
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({'error': f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+        edits = payload.get('edits', [payload] if 'start' in payload else None)
+        if not isinstance(edits, list) or not edits:
+            return JsonResponse({'error': 'edits 또는 start/end/text가 필요합니다'}, status=400)
+        try:
+            edits = [_parse_edit(edit) for edit in edits]
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
+        try:
+            with edit_session(session_id) as session:
+                if session is None:
+                    return JsonResponse({'error': '세션을 찾을 수 없습니다'}, status=404)
+                
+                # 편집은 모두 적용된 뒤에만 저장 (중간에 실패하면 세션은 그대로)
+                stored_version = session.version
+                base_version = payload.get('version')
+                if base_version is not None and base_version != stored_version:
+                    return JsonResponse({
+                        'error': '세션 버전이 맞지 않습니다', 'version': stored_version,
+                    }, status=409)
+                
+                document = session.document
+                diffs = []
+                for start, end, text in edits:
+                    if len(document) - (end - start) + len(text) > MAX_SESSION_CHARS:
+                        error = f'텍스트는 최대 {MAX_SESSION_CHARS}자까지 가능합니다'
+                        return JsonResponse({'error': error, 'version': stored_version}, status=400)
+                    try:
+                        diff = document.edit(start, end, text)
+                    except IndexError as e:
+                        return JsonResponse({'error': str(e), 'version': stored_version}, status=400)
+                    session.version += 1
+                    diffs.append({
+                        'start': diff.start,
+                        'deleted': diff.deleted,
+                        'cells': serialize_braille(diff.inserted, fmt),
+                    })
+                save_session(session)
+        except SessionBusy:
+            return JsonResponse({'error': '다른 편집을 적용하는 중입니다. 잠시 뒤 다시 시도하세요'}, status=409)
+        
+        return JsonResponse({
+            'ok': True,
+            'version': session.version,
+            'diffs': diffs,
+            'total_cells': document.cell_count,
+            'format': fmt,
+        })
+    except json.JSONDecodeError:
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+def braille_decode(request):
+    """
+    점자 → 텍스트 역변환
+    POST /api/braille/decode/
+    Body: { cells: [[0|1 x 6], ...] | string, format?: 'cells' | 'packed' | 'unicode' }
+    -> { ok, text, count }
+    """
+    try:
+        if request.method != "POST":
+            return JsonResponse({'error': 'POST만 지원'}, status=405)
+        
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        fmt = payload.get("format", "cells")
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({"error": f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+        
+        try:
+            braille = deserialize_braille(payload.get("cells"), fmt)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        
+        return JsonResponse({
+            'ok': True,
+            'text': unicode_to_text(braille),
+            'count': len(braille),
+        })
+    except json.JSONDecodeError:
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+def braille_decode_batch(request):
+    """
+    여러 점자 일괄 역변환
+    POST /api/braille/decode/batch/
+    Body: { items: [{ id?: any, cells: ... }, ...], format?: 'cells' | 'packed' | 'unicode' }
+    -> { ok, format, count, results: [{ id, text } | { id, error }, ...] }
+    """
+    try:
+        if request.method != "POST":
+            return JsonResponse({'error': 'POST만 지원'}, status=405)
+        
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        fmt = payload.get("format", "cells")
+        if fmt not in CELL_FORMATS:
+            return JsonResponse({"error": f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+        
+        items = payload.get("items")
+        if not isinstance(items, list) or not items:
+            return JsonResponse({'error': 'items 배열이 필요합니다'}, status=400)
+        if len(items) > BATCH_MAX_ITEMS:
+            return JsonResponse({'error': f'한 번에 최대 {BATCH_MAX_ITEMS}개까지 변환할 수 있습니다'}, status=413)
+        
+        # 항목별 역직렬화 (잘못된 항목은 개별 오류로 보고)
+        decoded, total = [], 0
+        for index, item in enumerate(items):
+            item_id = item.get("id", index) if isinstance(item, dict) else index
+            value = item.get("cells") if isinstance(item, dict) else item
+            try:
+                braille = deserialize_braille(value, fmt)
+            except ValueError as e:
+                decoded.append((item_id, None, str(e)))
+                continue
+            total += len(braille)
+            decoded.append((item_id, braille, None))
+        
+        if total > BATCH_MAX_CHARS:
+            return JsonResponse({'error': f'전체 셀은 최대 {BATCH_MAX_CHARS}개까지 변환할 수 있습니다'}, status=413)
+        
+        results = []
+        for item_id, braille, error in decoded:
+            if error:
+                results.append({'id': item_id, 'error': error})
+            else:
+                results.append({'id': item_id, 'text': unicode_to_text(braille)})
+        
+        return JsonResponse({
+            'ok': True,
+            'format': fmt,
+            'count': len(results),
+            'results': results,
+        })
+    except json.JSONDecodeError:
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
 @csrf_exempt
 def convert(request):
     """레거시 호환"""
@@ -55,11 +482,8 @@ def generate_pattern(request):
         if not pattern_type:
             return JsonResponse({'error': 'type이 필요합니다'}, status=400)
         
-        service = BraillePatternService()
-        pattern = service.generate_pattern(pattern_type, pattern_data)
-        
-        if not service.validate_pattern(pattern):
-            return JsonResponse({'error': '패턴 생성 실패'}, status=500)
+        # 패턴 테이블(PATTERN_TABLE)은 만들 때 한 번 검증함
+        pattern = _pattern_service.generate_pattern(pattern_type, pattern_data)
         
         return JsonResponse({
             'ok': True,
@@ -74,6 +498,55 @@ def generate_pattern(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@csrf_exempt
+def generate_pattern_sequence(request):
+    """
+    패턴 스트림 생성 (그래프 재생 등, 한 번의 요청으로 전체 스트림)
+    POST /api/braille/pattern/sequence/
+    Body: { events: [{type, data}, ...] } 또는 { series: [number, ...], tolerance?: number }
+    Response: { patterns: [[0|1 x 6], ...], count, events(series일 때 점별 사건) }
+    """
+    try:
+        if request.method != 'POST':
+            return JsonResponse({'error': 'POST만 지원'}, status=405)
+        
+        payload = json.loads(request.body.decode("utf-8") or "{}")
+        events = payload.get('events')
+        series = payload.get('series')
+        
+        if (events is None) == (series is None):
+            return JsonResponse({'error': 'events 또는 series 중 하나가 필요합니다'}, status=400)
+        
+        items = events if events is not None else series
+        if not isinstance(items, list):
+            return JsonResponse({'error': 'events/series는 배열이어야 합니다'}, status=400)
+        if len(items) > PATTERN_SEQUENCE_MAX_ITEMS:
+            return JsonResponse({'error': f'최대 {PATTERN_SEQUENCE_MAX_ITEMS}개까지 요청할 수 있습니다'}, status=400)
+        
+        response = {'ok': True}
+        if series is not None:
+            if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in series):
+                return JsonResponse({'error': 'series는 숫자 배열이어야 합니다'}, status=400)
+            tolerance = payload.get('tolerance', 0)
+            if not isinstance(tolerance, (int, float)) or tolerance < 0:
+                return JsonResponse({'error': 'tolerance는 0 이상의 숫자여야 합니다'}, status=400)
+            events = _pattern_service.series_to_events(series, tolerance)
+            response['events'] = events
+        elif not all(isinstance(event, dict) and isinstance(event.get('type'), str) for event in events):
+            return JsonResponse({'error': 'events 항목은 {type, data} 객체여야 합니다'}, status=400)
+        
+        patterns = _pattern_service.generate_sequence(events)
+        response['patterns'] = patterns
+        response['count'] = len(patterns)
+        return JsonResponse(response)
+    except json.JSONDecodeError:
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
 @csrf_exempt
 def convert_formula(request):
     """
@@ -91,8 +564,7 @@ def convert_formula(request):
         if not formula:
             return JsonResponse({'error': '수식이 필요합니다'}, status=400)
         
-        service = BraillePatternService()
-        cells = service.convert_formula_to_braille(formula)
+        cells = _pattern_service.convert_formula_to_braille(formula)
         
         return JsonResponse({
             'ok': True,
@@ -113,24 +585,26 @@ def extract_formula(request):
     텍스트에서 수식 추출
     POST /api/braille/extract-formula/
     Body: { text: string }
+    Response: { formula: 첫 수식 | null, formulas: [{formula, start, end}, ...], has_formula }
     """
     try:
         if request.method != 'POST':
             return JsonResponse({'error': 'POST만 지원'}, status=405)
         
         payload = json.loads(request.body.decode("utf-8") or "{}")
-        text = payload.get('text', '').strip()
+        text = payload.get('text', '')
         
-        if not text:
+        # 공백만 있는지만 확인하고, 수식 위치(start/end)는 보낸 텍스트 그대로를 기준으로
+        if not text.strip():
             return JsonResponse({'error': '텍스트가 필요합니다'}, status=400)
         
-        service = BraillePatternService()
-        formula = service.extract_formula_from_text(text)
+        formulas = _pattern_service.find_formulas_in_text(text)
         
         return JsonResponse({
             'ok': True,
-            'formula': formula,
-            'has_formula': formula is not None,
+            'formula': formulas[0]['formula'] if formulas else None,
+            'formulas': formulas,
+            'has_formula': bool(formulas),
         })
     except json.JSONDecodeError:
         return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
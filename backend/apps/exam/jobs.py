@@ -0,0 +1,221 @@
+"""
+교재 점자 변환 작업 큐 (DB 기반)
+- enqueue_textbook: 작업 등록 (PDF 업로드 요청은 등록만 하고 바로 응답)
+- claim_job: 실행할 작업 하나를 조건부 UPDATE로 임대 (여러 워커가 동시에 시도해도 한 워커만 성공)
+- run_job: 단원별로 변환하며 임대 연장, 변환되지 않은 단원이 남으면 대기 시간을 두 배씩 늘려 재시도
+- run_worker: manage.py braille_worker의 워커 루프
+"""
+import os
+import socket
+import time
+from datetime import timedelta
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F, Q
+from django.utils import timezone
+from .models import BrailleContent, BrailleJob, Textbook
+from .services import BrailleConversionService
+
+# 한 번에 임대를 시도할 후보 작업 수 (다른 워커와 경쟁해서 놓치면 다음 후보)
+CLAIM_CANDIDATES = 10
+
+# 재시도 대기 상한 (초)
+MAX_RETRY_SECONDS = 3600
+
+
+class LeaseLost(Exception):
+    """작업 임대를 잃음 (임대가 만료되어 다른 워커가 가져감)"""
+
+
+def lease_seconds() -> int:
+    """작업 임대 시간 (BRAILLE_JOB_LEASE_SECONDS)"""
+    return getattr(settings, 'BRAILLE_JOB_LEASE_SECONDS', 300)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """attempts번째 시도가 실패한 뒤 재시도까지 대기 (BRAILLE_JOB_RETRY_SECONDS부터 두 배씩)"""
+    base = getattr(settings, 'BRAILLE_JOB_RETRY_SECONDS', 30)
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), MAX_RETRY_SECONDS))
+
+
+def worker_id(index: int = 0) -> str:
+    """임대 소유자 이름 (호스트:프로세스:워커 번호)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{index}"
+
+
+def enqueue_textbook(textbook: Textbook) -> BrailleJob:
+    """교재 변환 작업 등록 (대기/실행 중인 작업이 있으면 그 작업을 돌려줌)"""
+    job = BrailleJob.objects.filter(textbook=textbook, status__in=['queued', 'running']).first()
+    if job is not None:
+        return job
+    return BrailleJob.objects.create(
+        textbook=textbook,
+        max_attempts=getattr(settings, 'BRAILLE_JOB_MAX_ATTEMPTS', 3),
+    )
+
+
+def _claimable(now) -> Q:
+    """임대할 수 있는 작업: 실행 시간이 된 대기 작업, 임대가 만료된 실행 중 작업 (시도 횟수가 남은 것)"""
+    return Q(status='queued', run_after__lte=now) | Q(
+        status='running', lease_expires_at__lt=now, attempts__lt=F('max_attempts'),
+    )
+
+
+def claim_job(owner: str) -> Optional[BrailleJob]:
+    """
+    실행할 작업 하나를 owner 이름으로 임대 (없으면 None)
+    조건부 UPDATE 한 번으로 상태를 바꾸므로 같은 작업을 두 워커가 함께 가져가지 않음
+    """
+    now = timezone.now()
+    # 시도 횟수를 다 쓴 채 임대가 만료된 작업 (워커가 죽음)은 실패 처리
+    BrailleJob.objects.filter(
+        status='running', lease_expires_at__lt=now, attempts__gte=F('max_attempts'),
+    ).update(
+        status='failed', lease_owner='', lease_expires_at=None, finished_at=now, updated_at=now,
+        error_message='워커 임대가 만료되었습니다 (최대 시도 횟수 초과)',
+    )
+
+    candidates = list(
+        BrailleJob.objects.filter(_claimable(now)).order_by('run_after', 'id').values_list('id', flat=True)[:CLAIM_CANDIDATES]
+    )
+    for job_id in candidates:
+        claimed = BrailleJob.objects.filter(_claimable(now), id=job_id).update(
+            status='running',
+            lease_owner=owner,
+            lease_expires_at=now + timedelta(seconds=lease_seconds()),
+            attempts=F('attempts') + 1,
+            started_at=now,
+            updated_at=now,
+        )
+        if claimed:
+            return BrailleJob.objects.select_related('textbook').get(id=job_id)
+    return None
+
+
+def heartbeat(job_id: int, owner: str) -> bool:
+    """임대 연장 (임대를 잃었으면 False)"""
+    now = timezone.now()
+    return BrailleJob.objects.filter(id=job_id, status='running', lease_owner=owner).update(
+        lease_expires_at=now + timedelta(seconds=lease_seconds()),
+        updated_at=now,
+    ) == 1
+
+
+def _finish(job: BrailleJob, owner: str, error: Optional[str] = None) -> str:
+    """
+    실행 결과 기록 (임대를 가진 워커만)
+    오류가 있으면 시도 횟수가 남았을 때 대기열로 되돌리고, 다 썼으면 실패
+    Returns:
+        기록된 작업 상태 (임대를 잃었으면 '')
+    """
+    now = timezone.now()
+    if error is None:
+        fields = {'status': 'completed', 'error_message': '', 'finished_at': now}
+    elif job.attempts < job.max_attempts:
+        fields = {'status': 'queued', 'error_message': error, 'run_after': now + retry_delay(job.attempts)}
+    else:
+        fields = {'status': 'failed', 'error_message': error, 'finished_at': now}
+    updated = BrailleJob.objects.filter(id=job.id, status='running', lease_owner=owner).update(
+        lease_owner='', lease_expires_at=None, updated_at=now, **fields,
+    )
+    return fields['status'] if updated else ''
+
+
+def run_job(job: BrailleJob, owner: str, service: BrailleConversionService = None) -> str:
+    """
+    임대한 작업 실행: 교재 단원을 순서대로 변환 (완료된 단원은 건너뜀)
+    단원마다 임대를 연장해 진행 상황이 단원 단위로 보이게 함
+
+    Returns:
+        작업 상태 ('completed' | 'queued'(재시도 대기) | 'failed' | ''(임대를 잃음))
+    """
+    service = service or BrailleConversionService()
+    textbook = job.textbook
+    pending: List[int] = []
+    try:
+        for unit_id in textbook.units.order_by('order', 'id').values_list('id', flat=True):
+            if not heartbeat(job.id, owner):
+                raise LeaseLost(job.id)
+            result = service.convert_unit_to_braille(unit_id, textbook.subject, fmt='unicode')
+            if result['status'] != 'completed':
+                pending.append(unit_id)
+    except LeaseLost:
+        return ''
+    except Exception as e:
+        return _finish(job, owner, str(e))
+
+    if pending:
+        return _finish(job, owner, f"변환되지 않은 단원 {len(pending)}개: {pending[:10]}")
+    return _finish(job, owner)
+
+
+def run_worker(owner: str, poll: float = 1.0, once: bool = False, stop=None) -> int:
+    """
+    작업을 임대해 실행하는 루프
+    once: 대기열이 비면 종료 (기본은 poll초마다 다시 확인)
+    stop: set되면 현재 작업을 마치고 종료하는 Event
+    Returns:
+        실행한 작업 수
+    """
+    processed = 0
+    while stop is None or not stop.is_set():
+        close_old_connections()
+        job = claim_job(owner)
+        if job is None:
+            if once:
+                break
+            time.sleep(poll)
+            continue
+        run_job(job, owner)
+        processed += 1
+    return processed
+
+
+def get_job_status(job_id: int) -> Optional[Dict]:
+    """
+    작업 상태와 단원별 변환 상태 (진행률은 단원 상태 수로 계산)
+    작업이 없으면 None
+    """
+    try:
+        job = BrailleJob.objects.select_related('textbook').get(id=job_id)
+    except BrailleJob.DoesNotExist:
+        return None
+
+    strategy = BrailleConversionService._resolve_strategy(job.textbook.subject or 'korean')
+    units = list(job.textbook.units.order_by('order', 'id').values('id', 'title', 'order'))
+    contents = {
+        content['unit_id']: content
+        for content in BrailleContent.objects.filter(
+            unit_id__in=[unit['id'] for unit in units], strategy=strategy,
+        ).values('unit_id', 'status', 'error_message', 'converted_at')
+    }
+
+    progress = {'total': len(units), 'completed': 0, 'converting': 0, 'failed': 0, 'pending': 0}
+    unit_statuses = []
+    for unit in units:
+        content = contents.get(unit['id'])
+        status = content['status'] if content else 'pending'
+        progress[status] += 1
+        entry = {'unit_id': unit['id'], 'title': unit['title'], 'order': unit['order'], 'status': status}
+        if status == 'completed' and content['converted_at']:
+            entry['converted_at'] = content['converted_at'].isoformat()
+        elif status == 'failed':
+            entry['error'] = content['error_message']
+        unit_statuses.append(entry)
+
+    return {
+        'job_id': job.id,
+        'textbook_id': job.textbook_id,
+        'status': job.status,
+        'strategy': strategy,
+        'attempts': job.attempts,
+        'max_attempts': job.max_attempts,
+        'error_message': job.error_message or None,
+        'created_at': job.created_at.isoformat(),
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'run_after': job.run_after.isoformat() if job.status == 'queued' else None,
+        'progress': progress,
+        'units': unit_statuses,
+    }
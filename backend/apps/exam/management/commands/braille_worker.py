@@ -0,0 +1,67 @@
+"""
+교재 점자 변환 작업 워커
+사용법:
+    python manage.py braille_worker                  # 워커 1개 (Ctrl+C로 종료)
+    python manage.py braille_worker --workers 4      # 워커 프로세스 4개
+    python manage.py braille_worker --once           # 대기열을 비우고 종료
+"""
+import multiprocessing
+import os
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _worker_main(settings_module: str, index: int, poll: float, once: bool, stop) -> None:
+    """워커 프로세스 진입점 (spawn으로 띄우므로 Django 설정부터)"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+    from apps.exam.jobs import run_worker, worker_id
+    try:
+        run_worker(worker_id(index), poll=poll, once=once, stop=stop)
+    except KeyboardInterrupt:
+        pass
+
+
+class Command(BaseCommand):
+    help = '교재 점자 변환 작업 큐를 처리하는 워커 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='워커 프로세스 수 (기본 1, 1이면 현재 프로세스에서 실행)')
+        parser.add_argument('--poll', type=float, default=1.0, help='대기열이 비었을 때 다시 확인하는 간격 (초)')
+        parser.add_argument('--once', action='store_true', help='대기열을 비우면 종료')
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        poll = options['poll']
+        once = options['once']
+        if workers < 1:
+            raise CommandError('--workers는 1 이상이어야 합니다')
+
+        if workers == 1:
+            from apps.exam.jobs import run_worker, worker_id
+            try:
+                processed = run_worker(worker_id(), poll=poll, once=once)
+            except KeyboardInterrupt:
+                return
+            self.stdout.write(self.style.SUCCESS(f'[OK] 작업 {processed}개 처리'))
+            return
+
+        context = multiprocessing.get_context('spawn')
+        stop = context.Event()
+        settings_module = os.environ.get('DJANGO_SETTINGS_MODULE', 'jeomgeuli_backend.settings')
+        processes = [
+            context.Process(target=_worker_main, args=(settings_module, index, poll, once, stop))
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(f'워커 {workers}개 시작')
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            # 실행 중인 작업은 마치고 종료 (임대가 남아 있으면 만료 뒤 다른 워커가 이어받음)
+            stop.set()
+            for process in processes:
+                process.join()
+        self.stdout.write(self.style.SUCCESS('[OK] 워커 종료'))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0003_braillecontent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='braillecontent',
+            name='packed_cells',
+            field=models.BinaryField(blank=True, default=b'', verbose_name='패킹 점자 셀'),
+        ),
+    ]
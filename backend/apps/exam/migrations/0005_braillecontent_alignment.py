@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0004_braillecontent_packed_cells'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='braillecontent',
+            name='alignment',
+            field=models.BinaryField(blank=True, default=b'', verbose_name='원문-셀 정렬'),
+        ),
+    ]
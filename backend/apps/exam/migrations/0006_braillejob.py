@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0005_braillecontent_alignment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BrailleJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', '대기 중'), ('running', '실행 중'), ('completed', '완료'), ('failed', '실패')], default='queued', max_length=20, verbose_name='작업 상태')),
+                ('attempts', models.IntegerField(default=0, verbose_name='시도 횟수')),
+                ('max_attempts', models.IntegerField(default=3, verbose_name='최대 시도 횟수')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 가능 시간')),
+                ('lease_owner', models.CharField(blank=True, max_length=100, verbose_name='임대 워커')),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True, verbose_name='임대 만료 시간')),
+                ('error_message', models.TextField(blank=True, verbose_name='오류 메시지')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작 시간')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료 시간')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('textbook', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='braille_jobs', to='exam.textbook', verbose_name='교재')),
+            ],
+            options={
+                'verbose_name': '점자 변환 작업',
+                'verbose_name_plural': '점자 변환 작업',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='exam_braill_status_d7530f_idx')],
+            },
+        ),
+    ]
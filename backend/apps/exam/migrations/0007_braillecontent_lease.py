@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:06
+
+from django.db import migrations, models
+
+
+def remove_duplicate_contents(apps, schema_editor):
+    """단원·전략별로 행 하나만 남김 (최근에 변환 완료된 행 우선)"""
+    BrailleContent = apps.get_model('exam', 'BrailleContent')
+    seen = set()
+    duplicates = []
+    rows = BrailleContent.objects.order_by(
+        'unit_id', 'strategy', models.F('converted_at').desc(nulls_last=True), '-created_at', '-id',
+    )
+    for content_id, unit_id, strategy in rows.values_list('id', 'unit_id', 'strategy'):
+        key = (unit_id, strategy)
+        if key in seen:
+            duplicates.append(content_id)
+        else:
+            seen.add(key)
+    BrailleContent.objects.filter(id__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0006_braillejob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='braillecontent',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='마지막 하트비트'),
+        ),
+        migrations.AddField(
+            model_name='braillecontent',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='임대 만료 시간'),
+        ),
+        migrations.AddField(
+            model_name='braillecontent',
+            name='lease_owner',
+            field=models.CharField(blank=True, max_length=100, verbose_name='임대 워커'),
+        ),
+        migrations.RunPython(remove_duplicate_contents, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='braillecontent',
+            constraint=models.UniqueConstraint(fields=('unit', 'strategy'), name='unique_braille_content_strategy'),
+        ),
+    ]
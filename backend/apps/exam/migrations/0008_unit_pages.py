@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0007_braillecontent_lease'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unit',
+            name='end_page',
+            field=models.IntegerField(blank=True, null=True, verbose_name='끝 페이지'),
+        ),
+        migrations.AddField(
+            model_name='unit',
+            name='start_page',
+            field=models.IntegerField(blank=True, null=True, verbose_name='시작 페이지'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0008_unit_pages'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='textbook',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64, verbose_name='파일 해시'),
+        ),
+    ]
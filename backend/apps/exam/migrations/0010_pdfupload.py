@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0009_textbook_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PdfUpload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('filename', models.CharField(max_length=255, verbose_name='파일명')),
+                ('status', models.CharField(choices=[('waiting', '업로드 대기'), ('receiving', '수신 중'), ('extracting', '텍스트 추출 중'), ('completed', '완료'), ('failed', '실패')], default='waiting', max_length=20, verbose_name='업로드 상태')),
+                ('total_bytes', models.BigIntegerField(blank=True, null=True, verbose_name='파일 크기')),
+                ('received_bytes', models.BigIntegerField(default=0, verbose_name='받은 바이트')),
+                ('content_hash', models.CharField(blank=True, max_length=64, verbose_name='파일 해시')),
+                ('total_pages', models.IntegerField(blank=True, null=True, verbose_name='페이지 수')),
+                ('extracted_pages', models.IntegerField(default=0, verbose_name='추출한 페이지 수')),
+                ('units_created', models.IntegerField(default=0, verbose_name='생성한 단원 수')),
+                ('existing', models.BooleanField(default=False, verbose_name='기존 교재')),
+                ('error_message', models.TextField(blank=True, verbose_name='오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='uploads', to='exam.braillejob', verbose_name='점자 변환 작업')),
+                ('textbook', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='uploads', to='exam.textbook', verbose_name='교재')),
+            ],
+            options={
+                'verbose_name': 'PDF 업로드',
+                'verbose_name_plural': 'PDF 업로드',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:22
+
+from django.db import migrations, models
+
+
+def clear_duplicate_hashes(apps, schema_editor):
+    """같은 해시의 교재가 여럿이면 가장 먼저 만든 교재만 해시를 남김 (나머지는 해시 없는 예전 교재로)"""
+    Textbook = apps.get_model('exam', 'Textbook')
+    seen = set()
+    duplicates = []
+    rows = Textbook.objects.exclude(content_hash='').order_by('content_hash', 'created_at', 'id')
+    for textbook_id, content_hash in rows.values_list('id', 'content_hash'):
+        if content_hash in seen:
+            duplicates.append(textbook_id)
+        else:
+            seen.add(content_hash)
+    Textbook.objects.filter(id__in=duplicates).update(content_hash='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam', '0010_pdfupload'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_duplicate_hashes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='textbook',
+            constraint=models.UniqueConstraint(condition=models.Q(('content_hash', ''), _negated=True), fields=('content_hash',), name='unique_textbook_content_hash'),
+        ),
+    ]
@@ -8,6 +8,8 @@ class Textbook(models.Model):
     publisher = models.CharField(max_length=100, blank=True, verbose_name="출판사")
     year = models.IntegerField(null=True, blank=True, verbose_name="연도")
     subject = models.CharField(max_length=50, blank=True, verbose_name="과목")
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True, verbose_name="파일 해시")
+    # 업로드한 PDF 바이트의 SHA-256 (같은 파일을 다시 올리면 제목/연도가 아니라 내용으로 감지)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -15,6 +17,12 @@ class Textbook(models.Model):
         ordering = ['-year', 'title']
         verbose_name = "교재"
         verbose_name_plural = "교재"
+        constraints = [
+            # 같은 파일을 동시에 올려도 교재는 하나 (해시가 없는 예전 교재는 제외)
+            models.UniqueConstraint(
+                fields=['content_hash'], condition=~models.Q(content_hash=''), name='unique_textbook_content_hash',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.year or 'N/A'})"
@@ -26,6 +34,9 @@ class Unit(models.Model):
     title = models.CharField(max_length=200, verbose_name="단원명")
     order = models.IntegerField(default=0, verbose_name="순서")
     content = models.TextField(blank=True, verbose_name="내용")
+    start_page = models.IntegerField(null=True, blank=True, verbose_name="시작 페이지")
+    end_page = models.IntegerField(null=True, blank=True, verbose_name="끝 페이지")
+    # PDF에서 추출한 단원의 페이지 범위 (1부터)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -149,13 +160,22 @@ class BrailleContent(models.Model):
     
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='braille_contents', verbose_name="단원")
     cells = models.JSONField(default=list, verbose_name="점자 셀 배열")
-    # 예: [[1, 0, 0, 0, 0, 0], [1, 1, 0, 0, 0, 0], ...]
+    # 예: [[1, 0, 0, 0, 0, 0], [1, 1, 0, 0, 0, 0], ...] (레거시 형식, 신규 변환은 packed_cells 사용)
+    packed_cells = models.BinaryField(default=b'', blank=True, verbose_name="패킹 점자 셀")
+    # 셀당 1바이트, 하위 6비트가 점 마스크 (점1 = bit0 ... 점6 = bit5)
+    alignment = models.BinaryField(default=b'', blank=True, verbose_name="원문-셀 정렬")
+    # 단원 원문(NFC) 문자별 셀 시작 위치 누적합, 원소당 uint32 리틀엔디언 (길이 = 원문 길이 + 1)
     
     strategy = models.CharField(max_length=20, choices=STRATEGY_CHOICES, default='korean', verbose_name="과목별 전략")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', verbose_name="변환 상태")
     converted_at = models.DateTimeField(null=True, blank=True, verbose_name="변환 완료 시간")
     error_message = models.TextField(blank=True, verbose_name="오류 메시지")
     
+    # 변환 임대: 'converting'으로 바꾼 워커만 결과를 저장하고, 만료되면 다른 워커가 다시 가져감
+    lease_owner = models.CharField(max_length=100, blank=True, verbose_name="임대 워커")
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name="마지막 하트비트")
+    lease_expires_at = models.DateTimeField(null=True, blank=True, verbose_name="임대 만료 시간")
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -167,7 +187,82 @@ class BrailleContent(models.Model):
             models.Index(fields=['unit', 'status']),
             models.Index(fields=['status']),
         ]
+        constraints = [
+            models.UniqueConstraint(fields=['unit', 'strategy'], name='unique_braille_content_strategy'),
+        ]
     
     def __str__(self):
         return f"{self.unit.title} - {self.get_strategy_display()} ({self.get_status_display()})"
 
+
+
+class BrailleJob(models.Model):
+    """교재 점자 변환 작업 (DB 작업 큐, 처리는 manage.py braille_worker)"""
+    STATUS_CHOICES = [
+        ('queued', '대기 중'),
+        ('running', '실행 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    textbook = models.ForeignKey(Textbook, on_delete=models.CASCADE, related_name='braille_jobs', verbose_name="교재")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued', verbose_name="작업 상태")
+    attempts = models.IntegerField(default=0, verbose_name="시도 횟수")
+    max_attempts = models.IntegerField(default=3, verbose_name="최대 시도 횟수")
+    run_after = models.DateTimeField(default=timezone.now, verbose_name="실행 가능 시간")
+    # 재시도는 run_after를 뒤로 미뤄 대기열에 다시 넣음
+    lease_owner = models.CharField(max_length=100, blank=True, verbose_name="임대 워커")
+    lease_expires_at = models.DateTimeField(null=True, blank=True, verbose_name="임대 만료 시간")
+    # 실행 중 작업은 워커가 임대를 연장하고, 만료되면 다른 워커가 다시 가져감
+    error_message = models.TextField(blank=True, verbose_name="오류 메시지")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="시작 시간")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="종료 시간")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        verbose_name = "점자 변환 작업"
+        verbose_name_plural = "점자 변환 작업"
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+        ]
+    
+    def __str__(self):
+        return f"{self.textbook.title} 점자 변환 ({self.get_status_display()})"
+
+
+class PdfUpload(models.Model):
+    """스트리밍 PDF 업로드 (수신/추출/단원 생성 진행 상황)"""
+    STATUS_CHOICES = [
+        ('waiting', '업로드 대기'),
+        ('receiving', '수신 중'),
+        ('extracting', '텍스트 추출 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    filename = models.CharField(max_length=255, verbose_name="파일명")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='waiting', verbose_name="업로드 상태")
+    total_bytes = models.BigIntegerField(null=True, blank=True, verbose_name="파일 크기")
+    received_bytes = models.BigIntegerField(default=0, verbose_name="받은 바이트")
+    content_hash = models.CharField(max_length=64, blank=True, verbose_name="파일 해시")
+    total_pages = models.IntegerField(null=True, blank=True, verbose_name="페이지 수")
+    extracted_pages = models.IntegerField(default=0, verbose_name="추출한 페이지 수")
+    units_created = models.IntegerField(default=0, verbose_name="생성한 단원 수")
+    textbook = models.ForeignKey(Textbook, on_delete=models.SET_NULL, null=True, blank=True, related_name='uploads', verbose_name="교재")
+    job = models.ForeignKey(BrailleJob, on_delete=models.SET_NULL, null=True, blank=True, related_name='uploads', verbose_name="점자 변환 작업")
+    existing = models.BooleanField(default=False, verbose_name="기존 교재")
+    error_message = models.TextField(blank=True, verbose_name="오류 메시지")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "PDF 업로드"
+        verbose_name_plural = "PDF 업로드"
+    
+    def __str__(self):
+        return f"{self.filename} ({self.get_status_display()})"
@@ -27,6 +27,14 @@ class TextbookRepository:
     def filter_by_subject(self, subject: str) -> List[Textbook]:
         """과목별 교재 조회"""
         return list(Textbook.objects.filter(subject=subject))
+    
+    def get_by_content_hash(self, content_hash: str) -> Optional[Textbook]:
+        """PDF 파일 해시로 교재 조회"""
+        return Textbook.objects.filter(content_hash=content_hash).first()
+    
+    def get_unhashed(self, title: str, year: Optional[int]) -> Optional[Textbook]:
+        """파일 해시가 기록되지 않은 (예전에 만든) 교재를 제목/연도로 조회"""
+        return Textbook.objects.filter(title=title, year=year, content_hash='').first()
 
 
 class UnitRepository:
@@ -2,14 +2,29 @@
 Service Layer Pattern Implementation for Exam App
 비즈니스 로직 캡슐화
 """
-from typing import Dict, Optional, List
+import os
+import socket
+import unicodedata
+import uuid
+from datetime import timedelta
+from typing import Dict, Iterator, Optional, List, Tuple
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.utils import timezone
 from .repositories import (
     TextbookRepository, UnitRepository, QuestionRepository,
     QuestionAttemptRepository, GraphTableRepository, ExamSessionRepository
 )
-from .models import QuestionAttempt, BrailleContent, Unit
-from utils.braille_converter import text_to_cells
+from .models import QuestionAttempt, BrailleContent, Textbook, Unit
+from utils.braille_converter import (
+    packed_to_unicode, cells_to_packed, serialize_braille,
+    pack_alignment, unpack_alignment, project_alignment,
+)
+from utils.braille_parallel import encode_alignment, encode_packed
+from utils.english_braille import english_to_unicode
+from utils.math_braille import math_to_unicode
+from utils.mixed_braille import mixed_to_unicode
 
 
 class TextbookService:
@@ -37,6 +52,40 @@ class TextbookService:
             for textbook in textbooks
         ]
     
+    def find_uploaded(self, content_hash: str, title: str, year: Optional[int]) -> Optional[Textbook]:
+        """
+        같은 PDF로 이미 만든 교재 (파일 해시로 찾음)
+        해시가 없는 예전 교재는 제목/연도가 같으면 같은 파일로 보고 해시를 채워 넣음
+        """
+        textbook = self.repo.get_by_content_hash(content_hash)
+        if textbook is None:
+            textbook = self.repo.get_unhashed(title, year)
+            if textbook is not None:
+                textbook.content_hash = content_hash
+                try:
+                    with transaction.atomic():
+                        textbook.save(update_fields=['content_hash', 'updated_at'])
+                except IntegrityError:
+                    # 그사이 같은 파일로 다른 교재가 만들어짐
+                    textbook = self.repo.get_by_content_hash(content_hash)
+        return textbook
+    
+    def create_uploaded(self, content_hash: str, **fields) -> Tuple[Textbook, bool]:
+        """
+        PDF 파일 해시로 교재 생성
+        해시에는 유일 제약이 있어 같은 파일을 동시에 올리면 한 요청만 만들고, 나머지는 그 교재를 받음
+        Returns:
+            (Textbook, 새로 만들었는지)
+        """
+        try:
+            with transaction.atomic():
+                return self.repo.create(content_hash=content_hash, **fields), True
+        except IntegrityError:
+            textbook = self.repo.get_by_content_hash(content_hash)
+            if textbook is None:
+                raise
+            return textbook, False
+    
     def get_textbook(self, textbook_id: int) -> Optional[dict]:
         """교재 상세 조회"""
         textbook = self.repo.get_by_id(textbook_id)
@@ -69,6 +118,8 @@ class UnitService:
             'title': unit.title,
             'order': unit.order,
             'content': unit.content,
+            'start_page': unit.start_page,
+            'end_page': unit.end_page,
             'textbook_id': unit.textbook.id,
             'textbook_title': unit.textbook.title,
         }
@@ -332,16 +383,27 @@ class ExamSessionService:
         }
 
 
+def convert_lease_seconds() -> int:
+    """단원 변환 임대 시간 (BRAILLE_CONVERT_LEASE_SECONDS)"""
+    return getattr(settings, 'BRAILLE_CONVERT_LEASE_SECONDS', 600)
+
+
+def lease_owner() -> str:
+    """변환 호출마다 다른 임대 소유자 이름 (호스트:프로세스:임의값)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
 class BrailleConversionService:
     """점자 변환 서비스"""
     
     def __init__(self):
         pass
     
-    def convert_unit_to_braille(self, unit_id: int, subject: str = None) -> Dict:
+    def convert_unit_to_braille(self, unit_id: int, subject: str = None, fmt: str = 'cells') -> Dict:
         """
         단원을 점자로 변환
         과목별 전략 적용
+        fmt: 응답 셀 형식 ('cells' | 'packed' | 'unicode')
         """
         try:
             unit = Unit.objects.get(id=unit_id)
@@ -351,21 +413,7 @@ class BrailleConversionService:
         # 과목 자동 감지 (textbook.subject 사용)
         if not subject:
             subject = unit.textbook.subject or 'korean'
-        
-        # 과목명 정규화
-        subject_lower = subject.lower()
-        if '수학' in subject_lower or subject_lower == 'math':
-            strategy = 'math'
-        elif '국어' in subject_lower or subject_lower == 'korean':
-            strategy = 'korean'
-        elif '영어' in subject_lower or subject_lower == 'english':
-            strategy = 'english'
-        elif '과학' in subject_lower or subject_lower == 'science':
-            strategy = 'science'
-        elif '사회' in subject_lower or subject_lower == 'social':
-            strategy = 'social'
-        else:
-            strategy = 'korean'  # 기본값
+        strategy = self._resolve_strategy(subject)
         
         # 기존 점자 데이터 확인
         existing = BrailleContent.objects.filter(
@@ -378,54 +426,26 @@ class BrailleConversionService:
             return {
                 'unit_id': unit_id,
                 'status': 'completed',
-                'cells': existing.cells,
+                'cells': serialize_braille(self._stored_braille(existing), fmt),
+                'format': fmt,
                 'strategy': existing.strategy,
                 'converted_at': existing.converted_at.isoformat() if existing.converted_at else None,
             }
         
-        # 새 변환 시작
-        braille_content, created = BrailleContent.objects.get_or_create(
-            unit=unit,
-            strategy=strategy,
-            defaults={
-                'status': 'converting',
-                'cells': [],
-            }
-        )
-        
-        if not created and braille_content.status == 'converting':
-            # 이미 변환 중이면 대기
-            return {
-                'unit_id': unit_id,
-                'status': 'converting',
-                'cells': [],
-                'strategy': strategy,
-            }
+        # 변환 임대 (조건부 UPDATE 한 번으로 가져가므로 다른 워커와 겹치지 않음)
+        braille_content, _ = BrailleContent.objects.get_or_create(unit=unit, strategy=strategy)
+        owner = lease_owner()
+        if not self._claim(BrailleContent.objects.filter(id=braille_content.id), owner):
+            # 다른 워커가 변환 중 (또는 방금 완료)
+            braille_content.refresh_from_db()
+            return self._content_result(unit_id, braille_content, strategy, fmt)
         
         # 점자 변환 (과목별 전략 적용)
         try:
-            cells = self._convert_with_strategy(unit.content, strategy)
-            
-            # 변환 완료
-            braille_content.cells = cells
-            braille_content.status = 'completed'
-            braille_content.converted_at = timezone.now()
-            braille_content.error_message = ''
-            braille_content.save()
-            
-            return {
-                'unit_id': unit_id,
-                'status': 'completed',
-                'cells': cells,
-                'strategy': strategy,
-                'converted_at': braille_content.converted_at.isoformat(),
-            }
+            packed, alignment = self._convert_aligned_with_strategy(unit.content, strategy)
         except Exception as e:
             # 변환 실패
-            braille_content.status = 'failed'
-            braille_content.error_message = str(e)
-            braille_content.save()
-            
+            self._release(braille_content.id, owner, status='failed', error_message=str(e))
             return {
                 'unit_id': unit_id,
                 'status': 'failed',
@@ -433,75 +453,388 @@ class BrailleConversionService:
                 'strategy': strategy,
                 'error': str(e),
             }
+        
+        # 변환 완료 (셀당 1바이트로 패킹해서 저장, 원문-셀 정렬 포함)
+        converted_at = timezone.now()
+        self._release(
+            braille_content.id, owner,
+            packed_cells=packed, alignment=alignment, cells=[],
+            status='completed', converted_at=converted_at, error_message='',
+        )
+        return {
+            'unit_id': unit_id,
+            'status': 'completed',
+            'cells': serialize_braille(packed_to_unicode(packed), fmt),
+            'format': fmt,
+            'strategy': strategy,
+            'converted_at': converted_at.isoformat(),
+        }
+    
+    @staticmethod
+    def _claimable(now, force: bool = False) -> Q:
+        """임대할 수 있는 행: 대기/실패, 임대가 만료되었거나 임대 정보가 없는 변환 중 행 (force면 완료 행도)"""
+        claimable = Q(status__in=['pending', 'failed']) | Q(status='converting') & (
+            Q(lease_expires_at__lt=now) | Q(lease_expires_at__isnull=True)
+        )
+        if force:
+            claimable |= Q(status='completed')
+        return claimable
+    
+    def _claim(self, queryset, owner: str, force: bool = False) -> int:
+        """queryset 중 임대할 수 있는 행을 owner 이름으로 'converting'으로 바꿈 (가져간 행 수)"""
+        now = timezone.now()
+        return queryset.filter(self._claimable(now, force)).update(
+            status='converting',
+            lease_owner=owner,
+            heartbeat_at=now,
+            lease_expires_at=now + timedelta(seconds=convert_lease_seconds()),
+            updated_at=now,
+        )
+    
+    @staticmethod
+    def _heartbeat(content_ids: List[int], owner: str) -> int:
+        """임대 연장 (아직 임대를 가진 행 수)"""
+        now = timezone.now()
+        return BrailleContent.objects.filter(id__in=content_ids, status='converting', lease_owner=owner).update(
+            heartbeat_at=now,
+            lease_expires_at=now + timedelta(seconds=convert_lease_seconds()),
+            updated_at=now,
+        )
+    
+    @staticmethod
+    def _release(content_id: int, owner: str, **fields) -> bool:
+        """변환 결과 저장 후 임대 해제 (임대를 잃었으면 저장하지 않고 False)"""
+        return BrailleContent.objects.filter(id=content_id, status='converting', lease_owner=owner).update(
+            lease_owner='', heartbeat_at=None, lease_expires_at=None, updated_at=timezone.now(), **fields,
+        ) == 1
     
-    def _convert_with_strategy(self, text: str, strategy: str) -> List[List[int]]:
+    @staticmethod
+    def _resolve_strategy(subject: str) -> str:
+        """과목명 → 변환 전략"""
+        subject_lower = (subject or '').lower()
+        if '수학' in subject_lower or subject_lower == 'math':
+            return 'math'
+        elif '국어' in subject_lower or subject_lower == 'korean':
+            return 'korean'
+        elif '영어' in subject_lower or subject_lower == 'english':
+            return 'english'
+        elif '과학' in subject_lower or subject_lower == 'science':
+            return 'science'
+        elif '사회' in subject_lower or subject_lower == 'social':
+            return 'social'
+        return 'korean'  # 기본값
+    
+    def _stored_braille(self, braille_content: BrailleContent) -> str:
         """
-        과목별 전략에 따라 텍스트를 점자로 변환
+        저장된 점자 데이터를 점자 유니코드 문자열로 읽기
+        (packed_cells 우선, 레거시 행은 cells JSON 사용)
         """
-        from utils.content_extractor import extract_formula, split_sentences, extract_keywords
+        packed = braille_content.packed_cells
+        if packed:
+            return packed_to_unicode(bytes(packed))
+        return packed_to_unicode(cells_to_packed(braille_content.cells or []))
+    
+    def _strategy_spans(self, text: str, strategy: str):
+        """
+        과목별 전략에 따라 점자로 옮길 원문 구간과 구간 사이 구분자
+        Returns:
+            ([(start, end), ...], separator)
+        """
+        from utils.content_extractor import find_formulas, sentence_spans
         
         if strategy == 'math':
-            # 수학: 수식 중심
-            formula = extract_formula(text)
-            if formula:
-                # 수식만 점자로 변환
-                return text_to_cells(formula)
-            else:
-                # 수식이 없으면 전체 텍스트 변환
-                return text_to_cells(text)
+            # 수학: 단원의 모든 수식을 공백으로 이어 붙임 (수식이 없으면 전체 텍스트)
+            formulas = find_formulas(text)
+            if formulas:
+                return [(span.start, span.end) for span in formulas], ' '
         
         elif strategy == 'korean':
-            # 국어: 문장 단위
-            sentences = split_sentences(text)
+            # 국어: 문장 단위로 나누어 이어 붙임
+            sentences = sentence_spans(text)
             if sentences:
-                # 각 문장을 점자로 변환하여 합침
-                all_cells = []
-                for sentence in sentences:
-                    cells = text_to_cells(sentence)
-                    all_cells.extend(cells)
-                return all_cells
-            else:
-                return text_to_cells(text)
-        
-        elif strategy == 'english':
-            # 영어: 단어/구절 단위 (일단 전체 변환)
-            return text_to_cells(text)
+                return sentences, ''
         
-        elif strategy in ['science', 'social']:
-            # 과학/사회: 용어 중심 (일단 전체 변환)
-            return text_to_cells(text)
-        
-        else:
-            # 기본: 전체 텍스트 변환
-            return text_to_cells(text)
+        # 영어/과학/사회/기본: 전체 텍스트 변환
+        return [(0, len(text or ''))], ''
+    
+    def _strategy_text(self, text: str, strategy: str) -> str:
+        """
+        과목별 전략에 따라 점자로 옮길 텍스트 선택
+        """
+        text = text or ''
+        spans, separator = self._strategy_spans(text, strategy)
+        return separator.join(text[start:end] for start, end in spans)
+    
+    def _project_alignment(self, text: str, strategy: str, alignment: bytes) -> bytes:
+        """전략 텍스트 기준 정렬 바이트를 단원 원문 기준으로 옮김"""
+        spans, separator = self._strategy_spans(text, strategy)
+        return pack_alignment(project_alignment(unpack_alignment(alignment), spans, len(separator), len(text)))
+    
+    @staticmethod
+    def _strategy_encoder(strategy: str) -> str:
+        """과목별 전략 → 패킹 인코더 이름 (utils.braille_parallel.encode_packed)"""
+        if strategy in ('math', 'english'):
+            return strategy
+        if strategy == 'science':
+            # 과학: 본문 속 수식은 수식 점자
+            return 'mixed_math'
+        # 국어/사회/기본: 숫자와 로마자 구간은 각각의 점자로
+        return 'mixed'
+    
+    def _convert_with_strategy(self, text: str, strategy: str) -> str:
+        """
+        과목별 전략에 따라 텍스트를 점자로 변환
+        점자 유니코드 문자열(셀당 1문자)을 반환 (수학은 수식 점자, 영어는 UEB 2종 + 한글 구간은 한글 점자,
+        그 밖에는 한글 바탕에 숫자/로마자(과학은 수식까지) 구간별 점자)
+        """
+        strategy_text = self._strategy_text(text, strategy)
+        encoder = self._strategy_encoder(strategy)
+        if encoder == 'math':
+            return math_to_unicode(strategy_text)
+        if encoder == 'english':
+            return english_to_unicode(strategy_text)
+        return mixed_to_unicode(strategy_text, formulas=encoder == 'mixed_math')
+    
+    def _convert_packed_with_strategy(self, text: str, strategy: str) -> bytes:
+        """
+        과목별 전략에 따라 텍스트를 패킹 셀로 변환
+        (NumPy가 있으면 벡터화 대량 변환, 없으면 순수 파이썬 경로, 수학은 수식 점자)
+        """
+        return encode_packed(self._strategy_text(text, strategy), self._strategy_encoder(strategy))
+    
+    def _convert_aligned_with_strategy(self, text: str, strategy: str) -> Tuple[bytes, bytes]:
+        """
+        과목별 전략에 따라 텍스트를 패킹 셀로 변환하고 원문-셀 정렬 바이트도 함께 계산
+        정렬은 NFC로 정규화한 단원 원문 기준 (전략에서 빠진 문자는 다음 구간의 시작 셀)
+        """
+        text = unicodedata.normalize('NFC', text or '')
+        strategy_text = self._strategy_text(text, strategy)
+        encoder = self._strategy_encoder(strategy)
+        packed = encode_packed(strategy_text, encoder)
+        alignment = self._project_alignment(text, strategy, encode_alignment(strategy_text, encoder))
+        return packed, alignment
     
-    def convert_textbook_to_braille(self, textbook_id: int) -> Dict:
+    def convert_textbook_to_braille(
+        self,
+        textbook_id: int,
+        fmt: str = 'cells',
+        force: bool = False,
+        workers: int = None,
+        chunk_chars: int = None,
+    ) -> Dict:
         """
         교재 전체를 점자로 변환
+        변환할 단원을 한 번에 임대한 뒤, 단원 텍스트를 문장 경계에서 나눠 프로세스 풀에서 병렬 변환
+        (여러 워커가 같은 교재를 동시에 변환해도 단원마다 한 워커만 변환)
+        fmt: 응답 셀 형식 ('cells' | 'packed' | 'unicode')
+        force: 완료된 단원도 다시 변환 (점자 테이블 갱신 후 재변환)
+        workers, chunk_chars: 워커 수와 조각 크기 (기본값은 BRAILLE_CONVERT_* 설정)
         """
-        from .models import Textbook
+        from utils.braille_parallel import ParallelBrailleConverter
         
         try:
             textbook = Textbook.objects.get(id=textbook_id)
         except Textbook.DoesNotExist:
             raise ValueError(f"Textbook {textbook_id} not found")
         
-        units = textbook.units.all()
-        results = []
+        units = list(textbook.units.all())
+        strategy = self._resolve_strategy(textbook.subject or 'korean')
+        contents = BrailleContent.objects.filter(unit__in=units, strategy=strategy)
         
-        for unit in units:
-            result = self.convert_unit_to_braille(unit.id, textbook.subject)
-            results.append(result)
+        # 행이 없는 단원은 대기 행부터 만들고 (단원·전략별 유일), 변환 대상을 한 번의 UPDATE로 임대
+        # 대상: 대기/실패 단원, 임대가 만료된 변환 중 단원, force면 완료 단원까지 (다른 워커가 변환 중인 단원은 제외)
+        existing = set(contents.values_list('unit_id', flat=True))
+        BrailleContent.objects.bulk_create(
+            [BrailleContent(unit=unit, strategy=strategy) for unit in units if unit.id not in existing],
+            ignore_conflicts=True,
+        )
+        owner = lease_owner()
+        self._claim(contents, owner, force=force)
+        contents = {content.unit_id: content for content in contents}
+        targets = [
+            (unit, contents[unit.id]) for unit in units
+            if contents[unit.id].status == 'converting' and contents[unit.id].lease_owner == owner
+        ]
+        
+        if targets:
+            with ParallelBrailleConverter(workers=workers, chunk_chars=chunk_chars) as converter:
+                batch_chars = converter.chunk_chars * converter.workers * 4
+                for batch in self._lease_batches(targets, batch_chars):
+                    # 묶음마다 임대를 연장하고 결과를 바로 저장 (단원별 진행 상황이 보이도록)
+                    self._heartbeat([content.id for _, content in batch], owner)
+                    self._convert_batch(converter, batch, strategy, owner)
+            contents = {
+                content.unit_id: content
+                for content in BrailleContent.objects.filter(unit__in=units, strategy=strategy)
+            }
+        
+        results = [self._content_result(unit.id, contents.get(unit.id), strategy, fmt) for unit in units]
         
         return {
             'textbook_id': textbook_id,
             'total_units': len(units),
+            'converted_units': len(targets),
             'results': results,
         }
     
-    def get_braille_status(self, unit_id: int) -> Optional[Dict]:
+    @staticmethod
+    def _lease_batches(targets: List[Tuple[Unit, BrailleContent]], batch_chars: int) -> Iterator[List[Tuple[Unit, BrailleContent]]]:
+        """변환 대상을 원문 길이 합이 batch_chars 안팎인 묶음으로 나눔"""
+        batch, size = [], 0
+        for unit, content in targets:
+            batch.append((unit, content))
+            size += len(unit.content or '')
+            if size >= batch_chars:
+                yield batch
+                batch, size = [], 0
+        if batch:
+            yield batch
+    
+    def _convert_batch(self, converter, batch: List[Tuple[Unit, BrailleContent]], strategy: str, owner: str) -> None:
+        """묶음 하나를 병렬 변환해 저장 (임대를 잃은 행은 저장하지 않음)"""
+        try:
+            sources = [unicodedata.normalize('NFC', unit.content or '') for unit, _ in batch]
+            converted = converter.convert_texts_aligned(
+                [self._strategy_text(source, strategy) for source in sources],
+                encoders=[self._strategy_encoder(strategy)] * len(batch),
+            )
+        except Exception as e:
+            for _, content in batch:
+                self._release(content.id, owner, status='failed', error_message=str(e))
+            return
+        
+        converted_at = timezone.now()
+        for (_, content), source, (packed, alignment) in zip(batch, sources, converted):
+            self._release(
+                content.id, owner,
+                packed_cells=packed,
+                alignment=self._project_alignment(source, strategy, alignment),
+                cells=[],
+                status='completed',
+                converted_at=converted_at,
+                error_message='',
+            )
+    
+    def _content_result(self, unit_id: int, content: Optional[BrailleContent], strategy: str, fmt: str) -> Dict:
+        """단원 변환 결과 응답 (convert_unit_to_braille와 같은 형식)"""
+        if content is None or content.status != 'completed':
+            result = {
+                'unit_id': unit_id,
+                'status': content.status if content else 'pending',
+                'cells': [],
+                'strategy': strategy,
+            }
+            if content is not None and content.status == 'failed':
+                result['error'] = content.error_message
+            return result
+        return {
+            'unit_id': unit_id,
+            'status': 'completed',
+            'cells': serialize_braille(self._stored_braille(content), fmt),
+            'format': fmt,
+            'strategy': content.strategy,
+            'converted_at': content.converted_at.isoformat() if content.converted_at else None,
+        }
+    
+    def get_braille_windows(
+        self,
+        unit_id: int,
+        width: int,
+        start: int = 0,
+        count: int = 1,
+        fmt: str = 'cells',
+    ) -> Dict:
+        """
+        저장된 단원 점자를 디스플레이 폭 단위 창으로 조회 (재변환 없음)
+        창 색인은 (변환 결과, 폭)별로 캐시되어 start번째 창을 바로 꺼냄
+        width: 디스플레이 셀 수 (3/20/40 등)
+        """
+        from utils.braille_paginator import cached_paginator, window_frames
+        
+        braille_content = BrailleContent.objects.filter(
+            unit_id=unit_id
+        ).order_by('-created_at').first()
+        
+        if not braille_content or braille_content.status != 'completed':
+            return {
+                'unit_id': unit_id,
+                'status': braille_content.status if braille_content else 'pending',
+                'width': width,
+                'total_windows': 0,
+                'windows': [],
+                'format': fmt,
+            }
+        
+        key = ('unit', braille_content.pk, braille_content.converted_at)
+        paginator = cached_paginator(key, width, lambda: self._stored_braille(braille_content))
+        return {
+            'unit_id': unit_id,
+            'status': 'completed',
+            'width': width,
+            'total_windows': len(paginator),
+            'windows': window_frames(paginator, start, count, lambda braille: serialize_braille(braille, fmt)),
+            'format': fmt,
+            'strategy': braille_content.strategy,
+        }
+    
+    def locate_braille(
+        self,
+        unit_id: int,
+        sentence: int = None,
+        word: int = None,
+        start: int = None,
+        end: int = None,
+        cell: int = None,
+    ) -> Dict:
+        """
+        단원 원문 위치 ↔ 점자 셀 위치 조회 (저장된 정렬 배열 사용, 재변환 없음)
+        sentence / word: 문장·어절 번호 → 셀 범위
+        start, end: 원문 문자 범위 → 셀 범위
+        cell: 셀 위치 → 원문 문자와 문장·어절 번호
+        Raises:
+            LookupError: 완료된 변환 결과나 정렬 정보가 없음
+            IndexError, ValueError: 범위를 벗어난 요청
+        """
+        from utils.braille_alignment import cached_alignment_index
+        
+        braille_content = BrailleContent.objects.select_related('unit').filter(
+            unit_id=unit_id, status='completed'
+        ).order_by('-created_at').first()
+        if not braille_content:
+            raise LookupError("완료된 점자 변환 결과가 없습니다")
+        if not braille_content.alignment:
+            raise LookupError("정렬 정보가 없습니다 (force 재변환 필요)")
+        
+        unit = braille_content.unit
+        key = ('unit', braille_content.pk, braille_content.converted_at, unit.updated_at)
+        index = cached_alignment_index(key, lambda: (
+            unicodedata.normalize('NFC', unit.content or ''),
+            bytes(braille_content.alignment),
+        ))
+        
+        if sentence is not None:
+            result = index.sentence(sentence)
+        elif word is not None:
+            result = index.word(word)
+        elif cell is not None:
+            result = index.cell(cell)
+        elif start is not None:
+            result = index.text_range(start, len(index.text) if end is None else end)
+        else:
+            raise ValueError("sentence, word, start, cell 중 하나가 필요합니다")
+        
+        return {
+            'unit_id': unit_id,
+            'strategy': braille_content.strategy,
+            'total_cells': index.total_cells,
+            'total_sentences': len(index.sentences),
+            **result,
+        }
+    
+    def get_braille_status(self, unit_id: int, fmt: str = 'cells') -> Optional[Dict]:
         """
         단원의 점자 변환 상태 조회
+        fmt: 응답 셀 형식 ('cells' | 'packed' | 'unicode')
         """
         try:
             braille_content = BrailleContent.objects.filter(
@@ -512,14 +845,19 @@ class BrailleConversionService:
                 return {
                     'unit_id': unit_id,
                     'status': 'pending',
-                    'cells': [],
+                    'cells': serialize_braille('', fmt),
+                    'format': fmt,
                     'strategy': None,
                 }
             
             return {
                 'unit_id': unit_id,
                 'status': braille_content.status,
-                'cells': braille_content.cells if braille_content.status == 'completed' else [],
+                'cells': serialize_braille(
+                    self._stored_braille(braille_content) if braille_content.status == 'completed' else '',
+                    fmt,
+                ),
+                'format': fmt,
                 'strategy': braille_content.strategy,
                 'converted_at': braille_content.converted_at.isoformat() if braille_content.converted_at else None,
                 'error_message': braille_content.error_message if braille_content.status == 'failed' else None,
@@ -0,0 +1,176 @@
+"""
+점자 변환 작업 큐 테스트
+"""
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.utils import timezone
+from apps.exam import jobs
+from apps.exam.models import BrailleContent, BrailleJob, Textbook, Unit
+from utils import pdf_cache
+from utils.braille_converter import text_to_packed
+
+
+class BrailleJobQueueTest(TestCase):
+    """작업 등록, 임대, 재시도"""
+
+    def setUp(self):
+        self.textbook = Textbook.objects.create(title="작업 교재", subject="국어")
+        self.units = [
+            Unit.objects.create(textbook=self.textbook, title=f"단원 {i}", order=i, content="나는 학생이다" * i)
+            for i in (1, 2)
+        ]
+
+    def test_enqueue_reuses_active_job(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        self.assertEqual(job.status, 'queued')
+        self.assertEqual(jobs.enqueue_textbook(self.textbook).id, job.id)
+
+    def test_claim_is_exclusive(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        claimed = jobs.claim_job('worker-a')
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual(claimed.status, 'running')
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNone(jobs.claim_job('worker-b'))
+
+    def test_queued_job_waits_for_run_after(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        BrailleJob.objects.filter(id=job.id).update(run_after=timezone.now() + timedelta(minutes=5))
+        self.assertIsNone(jobs.claim_job('worker-a'))
+
+    def test_expired_lease_is_reclaimed(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        jobs.claim_job('worker-a')
+        BrailleJob.objects.filter(id=job.id).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+        claimed = jobs.claim_job('worker-b')
+        self.assertEqual(claimed.lease_owner, 'worker-b')
+        self.assertEqual(claimed.attempts, 2)
+        # 임대를 잃은 워커는 하트비트와 결과 기록이 모두 거부됨
+        self.assertFalse(jobs.heartbeat(job.id, 'worker-a'))
+        self.assertEqual(jobs.run_job(claimed, 'worker-a'), '')
+
+    def test_expired_lease_without_attempts_fails(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        BrailleJob.objects.filter(id=job.id).update(
+            status='running', attempts=3, lease_owner='worker-a',
+            lease_expires_at=timezone.now() - timedelta(seconds=1),
+        )
+        self.assertIsNone(jobs.claim_job('worker-b'))
+        self.assertEqual(BrailleJob.objects.get(id=job.id).status, 'failed')
+
+    def test_run_job_converts_units(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        self.assertEqual(jobs.run_job(jobs.claim_job('worker-a'), 'worker-a'), 'completed')
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.lease_owner, '')
+        for unit in self.units:
+            content = BrailleContent.objects.get(unit=unit)
+            self.assertEqual(bytes(content.packed_cells), text_to_packed(unit.content))
+
+    def test_failure_is_retried_with_backoff(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        with patch.object(jobs.BrailleConversionService, 'convert_unit_to_braille', side_effect=RuntimeError('boom')):
+            self.assertEqual(jobs.run_job(jobs.claim_job('worker-a'), 'worker-a'), 'queued')
+        job.refresh_from_db()
+        self.assertEqual(job.error_message, 'boom')
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertEqual(jobs.retry_delay(2), 2 * jobs.retry_delay(1))
+
+        # 시도 횟수를 다 쓰면 실패
+        BrailleJob.objects.filter(id=job.id).update(run_after=timezone.now(), attempts=2)
+        with patch.object(jobs.BrailleConversionService, 'convert_unit_to_braille', side_effect=RuntimeError('boom')):
+            self.assertEqual(jobs.run_job(jobs.claim_job('worker-a'), 'worker-a'), 'failed')
+
+    def test_job_status_reports_units(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        status = jobs.get_job_status(job.id)
+        self.assertEqual(status['progress'], {'total': 2, 'completed': 0, 'converting': 0, 'failed': 0, 'pending': 2})
+
+        jobs.run_job(jobs.claim_job('worker-a'), 'worker-a')
+        status = jobs.get_job_status(job.id)
+        self.assertEqual(status['status'], 'completed')
+        self.assertEqual(status['progress']['completed'], 2)
+        self.assertEqual([unit['unit_id'] for unit in status['units']], [unit.id for unit in self.units])
+        self.assertIsNone(jobs.get_job_status(job.id + 100))
+
+    def test_worker_command_drains_queue(self):
+        job = jobs.enqueue_textbook(self.textbook)
+        call_command('braille_worker', once=True, stdout=StringIO())
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'completed')
+
+
+class BrailleJobViewTest(TestCase):
+    """PDF 업로드는 작업만 등록하고, 작업 상태는 별도 엔드포인트로 조회"""
+
+    def setUp(self):
+        self.client = Client()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = patch.object(pdf_cache, 'CACHE_DIR', Path(cache_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _upload(self, name, data=b"%PDF-1.4"):
+        class FakePage:
+            def extract_text(self):
+                return "1단원 나는 학생이다\n"
+
+        class FakeReader:
+            def __init__(self, stream):
+                self.pages = [FakePage()]
+
+        upload = SimpleUploadedFile(name, data, content_type="application/pdf")
+        with patch('apps.exam.views.PyPDF2.PdfReader', FakeReader):
+            response = self.client.post('/api/exam/textbook/upload-pdf/', {'pdf': upload})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_upload_returns_job(self):
+        data = self._upload("수능특강_국어_2024.pdf")
+        self.assertIn('job_id', data)
+        # 변환은 아직 하지 않음
+        self.assertFalse(BrailleContent.objects.exists())
+        unit = Unit.objects.get(textbook_id=data['textbook_id'])
+        self.assertEqual((unit.start_page, unit.end_page), (1, 1))
+
+        response = self.client.get(f"/api/exam/braille-job/{data['job_id']}/")
+        self.assertEqual(response.status_code, 200)
+        status = response.json()
+        self.assertEqual(status['status'], 'queued')
+        self.assertEqual(status['textbook_id'], data['textbook_id'])
+        self.assertEqual(status['progress']['total'], data['unit_count'])
+
+    def test_concurrent_identical_uploads(self):
+        """같은 파일이 동시에 해시 확인을 통과해도 교재와 작업은 하나"""
+        with patch('apps.exam.views.TextbookService.find_uploaded', return_value=None):
+            first = self._upload("수능특강_국어_2024.pdf")
+            second = self._upload("사본_국어_2024.pdf")
+        self.assertTrue(second['existing'])
+        self.assertEqual(second['textbook_id'], first['textbook_id'])
+        self.assertEqual(Textbook.objects.count(), 1)
+        self.assertEqual(BrailleJob.objects.count(), 1)
+
+    def test_missing_job(self):
+        self.assertEqual(self.client.get('/api/exam/braille-job/999/').status_code, 404)
+
+    def test_reupload_detected_by_content(self):
+        """같은 파일은 이름이 달라도 기존 교재, 제목/연도가 같아도 내용이 다르면 새 교재"""
+        first = self._upload("수능특강_국어_2024.pdf")
+        again = self._upload("사본_국어_2023.pdf")
+        self.assertTrue(again['existing'])
+        self.assertEqual(again['textbook_id'], first['textbook_id'])
+
+        revised = self._upload("수능특강_국어_2024.pdf", b"%PDF-1.4 revised")
+        self.assertNotIn('existing', revised)
+        self.assertNotEqual(revised['textbook_id'], first['textbook_id'])
+        self.assertEqual(Textbook.objects.get(id=first['textbook_id']).content_hash, pdf_cache.file_digest(b"%PDF-1.4"))
@@ -0,0 +1,61 @@
+"""
+PDF 추출 캐시 테스트
+"""
+import gzip
+import hashlib
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from apps.exam.models import Textbook
+from apps.exam.services import TextbookService
+from apps.exam.tests.test_pdf_extractor import make_pdf
+from utils import pdf_cache
+
+
+class PdfCacheTest(TestCase):
+    """파일 해시, 캐시 적중 시 PyPDF2 생략, 예전 교재 해시 채우기"""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = patch.object(pdf_cache, 'CACHE_DIR', Path(cache_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pdf = make_pdf(["First page", "", "Third page"])
+
+    def test_digest_is_streamed_sha256(self):
+        expected = hashlib.sha256(self.pdf).hexdigest()
+        self.assertEqual(pdf_cache.file_digest(self.pdf), expected)
+        upload = SimpleUploadedFile("book.pdf", self.pdf)
+        with patch.object(pdf_cache, 'HASH_CHUNK', 64):
+            self.assertEqual(pdf_cache.file_digest(upload), expected)
+        self.assertEqual(upload.read(), self.pdf)
+
+    def test_cache_hit_skips_pypdf2(self):
+        digest, first = pdf_cache.extract_pdf_cached(self.pdf, workers=1)
+        self.assertTrue(pdf_cache.cache_path(digest).exists())
+        with gzip.open(pdf_cache.cache_path(digest), 'rt', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['pages'], ["First page", "", "Third page"])
+
+        with patch.object(pdf_cache, 'PdfExtractor', side_effect=AssertionError('PyPDF2 호출')):
+            _, second = pdf_cache.extract_pdf_cached(self.pdf)
+        self.assertEqual(second, first)
+
+    def test_extractor_version_change_misses(self):
+        digest, _ = pdf_cache.extract_pdf_cached(self.pdf, workers=1)
+        with patch.object(pdf_cache.PyPDF2, '__version__', '0.0.0'):
+            self.assertIsNone(pdf_cache.load_pages(digest))
+        self.assertIsNone(pdf_cache.load_pages('0' * 64))
+
+    def test_find_uploaded_backfills_legacy_textbook(self):
+        legacy = Textbook.objects.create(title="수능특강 국어", year=2024)
+        service = TextbookService()
+        self.assertEqual(service.find_uploaded('a' * 64, "수능특강 국어", 2024), legacy)
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.content_hash, 'a' * 64)
+        # 해시가 채워진 뒤에는 내용으로만 찾음
+        self.assertIsNone(service.find_uploaded('b' * 64, "수능특강 국어", 2024))
+        self.assertEqual(service.find_uploaded('a' * 64, "다른 제목", None), legacy)
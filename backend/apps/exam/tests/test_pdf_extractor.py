@@ -0,0 +1,80 @@
+"""
+PDF 텍스트 추출 테스트
+"""
+from unittest.mock import patch
+from django.test import TestCase
+from utils import pdf_extractor
+from utils.pdf_extractor import PdfExtractor, extract_pdf, join_pages, unit_pages
+
+
+def make_pdf(pages):
+    """페이지별 ASCII 텍스트로 최소 PDF 바이트 생성 (빈 문자열은 빈 페이지)"""
+    count = len(pages)
+    kids = ' '.join(f"{4 + 2 * i} 0 R" for i in range(count))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {count} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode() if text else b""
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class PdfExtractorTest(TestCase):
+    """페이지 추출, 페이지 위치, 병렬 추출"""
+
+    def setUp(self):
+        self.pages = [f"Page {i} text" if i % 3 else "" for i in range(10)]
+        self.pdf = make_pdf(self.pages)
+
+    def test_extract_joins_pages_with_offsets(self):
+        pdf_text = extract_pdf(self.pdf, workers=1)
+        self.assertEqual(pdf_text.page_count, 10)
+        self.assertEqual(pdf_text.text, ''.join(page + "\n" for page in self.pages if page))
+        for index, page in enumerate(self.pages):
+            self.assertEqual(pdf_text.page_text(index).strip(), page)
+        self.assertEqual(pdf_text.failed_pages, [])
+
+    def test_page_of(self):
+        pdf_text = join_pages(["one", "", None, "three"])
+        self.assertEqual(pdf_text.text, "one\nthree\n")
+        self.assertEqual(pdf_text.offsets, [0, 4, 4, 4, 10])
+        self.assertEqual(pdf_text.failed_pages, [2])
+        self.assertEqual(pdf_text.page_of(0), 0)
+        self.assertEqual(pdf_text.page_of(5), 3)
+        self.assertEqual(unit_pages(pdf_text, {'start': 1, 'end': 6}), {'start_page': 1, 'end_page': 4})
+        self.assertEqual(unit_pages(pdf_text, {'content': '...'}), {})
+
+    def test_parallel_matches_serial(self):
+        serial = extract_pdf(self.pdf, workers=1)
+        with patch.object(pdf_extractor, 'PARALLEL_MIN_PAGES', 1), patch.object(pdf_extractor, 'MIN_PAGES_PER_TASK', 2):
+            with PdfExtractor(self.pdf, workers=2) as extractor:
+                parallel = extractor.extract()
+                spooled = extractor._spooled
+            self.assertEqual(parallel, serial)
+        # 메모리 PDF를 워커용으로 복사한 임시 파일은 정리
+        self.assertIsNotNone(spooled)
+        self.assertFalse(pdf_extractor.os.path.exists(spooled))
+
+    def test_page_ranges_cover_all_pages(self):
+        ranges = pdf_extractor.page_ranges(1000, 4)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], 1000)
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(ranges, ranges[1:])))
@@ -1,11 +1,16 @@
 """
 Service Layer Unit Tests
 """
+from datetime import timedelta
+from unittest.mock import patch
 from django.test import TestCase
-from apps.exam.models import Textbook, Unit, Question
+from django.utils import timezone
+from apps.exam.models import Textbook, Unit, Question, BrailleContent
 from apps.exam.services import (
-    TextbookService, UnitService, QuestionService, ExamSessionService
+    TextbookService, UnitService, QuestionService, ExamSessionService,
+    BrailleConversionService
 )
+from utils.braille_converter import packed_to_unicode, text_to_cells, text_to_packed, text_to_unicode, unpack_alignment
 
 
 class TextbookServiceTest(TestCase):
@@ -37,6 +42,28 @@ class TextbookServiceTest(TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result['id'], self.textbook.id)
         self.assertEqual(result['title'], "테스트 교재")
+    
+    def test_create_uploaded_once_per_hash(self):
+        """같은 해시로 두 번 만들면 두 번째는 기존 교재 (해시 없는 교재는 여럿 가능)"""
+        digest = "a" * 64
+        first, created = self.service.create_uploaded(digest, title="업로드 교재", year=2024)
+        self.assertTrue(created)
+        again, created = self.service.create_uploaded(digest, title="다른 이름", year=2023)
+        self.assertFalse(created)
+        self.assertEqual(again.id, first.id)
+        self.assertEqual(Textbook.objects.filter(content_hash=digest).count(), 1)
+        Textbook.objects.create(title="테스트 교재", year=2024)
+        self.assertEqual(Textbook.objects.filter(content_hash='').count(), 2)
+    
+    def test_backfill_loses_to_hashed_textbook(self):
+        """예전 교재에 해시를 채우다 충돌하면 그 해시의 교재"""
+        digest = "b" * 64
+        hashed, _ = self.service.create_uploaded(digest, title="새 교재", year=2025)
+        with patch.object(self.service.repo, 'get_by_content_hash', side_effect=[None, hashed]):
+            found = self.service.find_uploaded(digest, "테스트 교재", 2024)
+        self.assertEqual(found.id, hashed.id)
+        self.textbook.refresh_from_db()
+        self.assertEqual(self.textbook.content_hash, '')
 
 
 class UnitServiceTest(TestCase):
@@ -173,3 +200,156 @@ class ExamSessionServiceTest(TestCase):
         self.assertIsNotNone(result['ended_at'])
 
 
+class BrailleConversionServiceTest(TestCase):
+    """BrailleConversionService 테스트"""
+    
+    def setUp(self):
+        self.textbook = Textbook.objects.create(title="테스트 교재", subject="기타")
+        self.unit = Unit.objects.create(
+            textbook=self.textbook,
+            title="테스트 단원",
+            order=1,
+            content="나는 학생이다"
+        )
+        self.service = BrailleConversionService()
+    
+    def test_convert_unit_stores_packed(self):
+        """변환 결과는 패킹 형식으로 저장"""
+        result = self.service.convert_unit_to_braille(self.unit.id)
+        self.assertEqual(result['status'], 'completed')
+        self.assertEqual(result['cells'], text_to_cells("나는 학생이다"))
+        
+        content = BrailleContent.objects.get(unit=self.unit)
+        self.assertEqual(bytes(content.packed_cells), text_to_packed("나는 학생이다"))
+    
+    def test_status_formats(self):
+        """상태 조회 응답 형식"""
+        self.service.convert_unit_to_braille(self.unit.id)
+        status = self.service.get_braille_status(self.unit.id, fmt='unicode')
+        self.assertEqual(status['format'], 'unicode')
+        self.assertEqual(len(status['cells']), len(text_to_cells("나는 학생이다")))
+    
+    def test_legacy_cells_row(self):
+        """packed_cells가 없는 레거시 행은 cells JSON에서 읽음"""
+        cells = text_to_cells("사랑")
+        BrailleContent.objects.create(unit=self.unit, cells=cells, status='completed', strategy='korean')
+        status = self.service.get_braille_status(self.unit.id)
+        self.assertEqual(status['cells'], cells)
+    
+    def test_convert_textbook_parallel(self):
+        """교재 전체 병렬 변환 (조각을 나눠도 단원별 결과는 같음)"""
+        second = Unit.objects.create(
+            textbook=self.textbook, title="둘째 단원", order=2, content="오늘 날씨가 맑다. " * 50
+        )
+        result = self.service.convert_textbook_to_braille(self.textbook.id, workers=2, chunk_chars=40)
+        self.assertEqual(result['converted_units'], 2)
+        self.assertTrue(all(item['status'] == 'completed' for item in result['results']))
+        
+        content = BrailleContent.objects.get(unit=second)
+        expected = text_to_packed(self.service._strategy_text(second.content, content.strategy))
+        self.assertEqual(bytes(content.packed_cells), expected)
+    
+    def test_convert_textbook_force(self):
+        """완료된 단원은 force일 때만 다시 변환"""
+        self.service.convert_textbook_to_braille(self.textbook.id, workers=1)
+        self.assertEqual(self.service.convert_textbook_to_braille(self.textbook.id, workers=1)['converted_units'], 0)
+        result = self.service.convert_textbook_to_braille(self.textbook.id, force=True, workers=1)
+        self.assertEqual(result['converted_units'], 1)
+    
+    def test_braille_windows(self):
+        """저장된 점자를 디스플레이 폭 단위 창으로 조회 (어절 단위)"""
+        pending = self.service.get_braille_windows(self.unit.id, 40)
+        self.assertEqual(pending['status'], 'pending')
+        self.assertEqual(pending['windows'], [])
+        
+        self.service.convert_unit_to_braille(self.unit.id)
+        wide = self.service.get_braille_windows(self.unit.id, 40, fmt='unicode')
+        self.assertEqual(wide['total_windows'], 1)
+        self.assertEqual(wide['windows'][0]['cells'], text_to_unicode("나는 학생이다"))
+        
+        narrow = self.service.get_braille_windows(self.unit.id, len(text_to_unicode("학생이다")), count=5, fmt='unicode')
+        self.assertEqual(
+            [window['cells'] for window in narrow['windows']],
+            [text_to_unicode("나는"), text_to_unicode("학생이다")],
+        )
+    
+    def test_alignment_stored(self):
+        """변환 시 원문-셀 정렬 배열을 함께 저장 (문자별 셀 범위)"""
+        self.service.convert_unit_to_braille(self.unit.id)
+        content = BrailleContent.objects.get(unit=self.unit)
+        offsets = unpack_alignment(bytes(content.alignment))
+        self.assertEqual(len(offsets), len(self.unit.content) + 1)
+        self.assertEqual(offsets[-1], len(content.packed_cells))
+        braille = text_to_unicode(self.unit.content)
+        for index, ch in enumerate(self.unit.content):
+            self.assertEqual(braille[offsets[index]:offsets[index + 1]], text_to_unicode(ch))
+    
+    def test_locate_sentence_and_cell(self):
+        """문장 번호 → 셀 범위, 셀 위치 → 원문 문자"""
+        self.unit.content = "오늘 날씨가 맑다. 나는 학생이다"
+        self.unit.save()
+        self.textbook.subject = "국어"
+        self.textbook.save()
+        self.service.convert_unit_to_braille(self.unit.id)
+        content = BrailleContent.objects.get(unit=self.unit)
+        braille = packed_to_unicode(bytes(content.packed_cells))
+        
+        second = self.service.locate_braille(self.unit.id, sentence=1)
+        self.assertEqual(second['text'], "나는 학생이다")
+        self.assertEqual(braille[second['cell_start']:second['cell_end']], text_to_unicode("나는 학생이다"))
+        
+        located = self.service.locate_braille(self.unit.id, cell=second['cell_start'])
+        self.assertEqual(located['text'], "나")
+        self.assertEqual(located['sentence'], 1)
+        self.assertEqual(located['word'], 3)
+        
+        with self.assertRaises(IndexError):
+            self.service.locate_braille(self.unit.id, sentence=5)
+    
+    def test_textbook_alignment_matches_unit(self):
+        """교재 병렬 변환도 단원 변환과 같은 정렬 배열 저장"""
+        Unit.objects.create(textbook=self.textbook, title="둘째 단원", order=2, content="오늘 날씨가 맑다. " * 50)
+        self.service.convert_textbook_to_braille(self.textbook.id, workers=2, chunk_chars=40)
+        for content in BrailleContent.objects.filter(unit__textbook=self.textbook):
+            _, expected = self.service._convert_aligned_with_strategy(content.unit.content, content.strategy)
+            self.assertEqual(bytes(content.alignment), expected)
+    
+    def _lease_row(self, unit, expires_in):
+        """다른 워커가 임대한 변환 중 행"""
+        return BrailleContent.objects.create(
+            unit=unit, strategy='korean', status='converting', lease_owner='other-worker',
+            lease_expires_at=timezone.now() + timedelta(seconds=expires_in),
+        )
+    
+    def test_active_lease_is_not_converted_twice(self):
+        """다른 워커가 임대 중인 단원은 변환하지 않음"""
+        self._lease_row(self.unit, 60)
+        result = self.service.convert_unit_to_braille(self.unit.id)
+        self.assertEqual(result['status'], 'converting')
+        self.assertEqual(self.service.convert_textbook_to_braille(self.textbook.id, workers=1)['converted_units'], 0)
+        self.assertEqual(BrailleContent.objects.get(unit=self.unit).lease_owner, 'other-worker')
+    
+    def test_expired_lease_is_reclaimed(self):
+        """변환 중에 죽은 워커의 단원은 임대가 만료되면 다시 변환"""
+        self._lease_row(self.unit, -1)
+        result = self.service.convert_unit_to_braille(self.unit.id)
+        self.assertEqual(result['status'], 'completed')
+        
+        content = BrailleContent.objects.get(unit=self.unit)
+        self.assertEqual(content.lease_owner, '')
+        self.assertIsNone(content.lease_expires_at)
+        self.assertEqual(bytes(content.packed_cells), text_to_packed("나는 학생이다"))
+    
+    def test_legacy_converting_row_is_reclaimed(self):
+        """임대 정보가 없는 예전 변환 중 행도 다시 변환"""
+        BrailleContent.objects.create(unit=self.unit, strategy='korean', status='converting')
+        result = self.service.convert_textbook_to_braille(self.textbook.id, workers=1)
+        self.assertEqual(result['converted_units'], 1)
+        self.assertEqual(result['results'][0]['status'], 'completed')
+    
+    def test_lost_lease_does_not_overwrite(self):
+        """임대를 잃은 워커의 결과는 저장하지 않음"""
+        content = self._lease_row(self.unit, 60)
+        self.assertFalse(self.service._release(content.id, 'stale-worker', status='failed'))
+        self.assertEqual(self.service._heartbeat([content.id], 'stale-worker'), 0)
+        self.assertEqual(BrailleContent.objects.get(id=content.id).status, 'converting')
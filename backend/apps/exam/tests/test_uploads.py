@@ -0,0 +1,129 @@
+"""
+스트리밍 PDF 업로드 테스트
+"""
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from django.test import Client, TestCase
+from apps.exam import jobs, uploads
+from apps.exam.models import BrailleJob, PdfUpload, Unit
+from apps.exam.tests.test_pdf_extractor import make_pdf
+from utils import pdf_cache
+
+
+class PdfUploadViewTest(TestCase):
+    """업로드 등록 → 본문 전송 → 진행 상황 폴링/SSE"""
+
+    def setUp(self):
+        self.client = Client()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = patch.object(pdf_cache, 'CACHE_DIR', Path(cache_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pdf = make_pdf(["Chapter 1: " + "reading practice " * 5, "", "more text on page three"])
+
+    def _create(self, filename="수능특강_영어_2026.pdf", size=None):
+        body = {'filename': filename}
+        if size is not None:
+            body['size'] = size
+        response = self.client.post('/api/exam/textbook/uploads/', json.dumps(body), content_type='application/json')
+        return response
+
+    def _put(self, upload_id, data):
+        return self.client.put(f'/api/exam/textbook/uploads/{upload_id}/', data, content_type='application/pdf')
+
+    def test_upload_reports_progress(self):
+        created = self._create().json()
+        progress = self.client.get(created['progress_url']).json()
+        self.assertEqual(progress['status'], 'waiting')
+
+        with patch.object(uploads, 'SPOOL_CHUNK', 64), patch.object(uploads, 'PROGRESS_BYTES', 128):
+            response = self._put(created['upload_id'], self.pdf)
+        self.assertEqual(response.status_code, 200)
+        result = response.json()
+        self.assertEqual(result['status'], 'completed')
+        self.assertEqual(result['received_bytes'], len(self.pdf))
+        self.assertEqual((result['total_pages'], result['extracted_pages']), (3, 3))
+        self.assertGreaterEqual(result['units_created'], 1)
+        self.assertEqual(result['units_converted'], 0)
+        self.assertFalse(result['done'])
+
+        upload = PdfUpload.objects.get(id=created['upload_id'])
+        self.assertEqual(upload.content_hash, pdf_cache.file_digest(self.pdf))
+        self.assertEqual(Unit.objects.filter(textbook=upload.textbook).count(), result['units_created'])
+
+        # 변환 작업이 끝나면 변환한 단원 수가 채워지고 done
+        jobs.run_job(jobs.claim_job('worker-a'), 'worker-a')
+        progress = self.client.get(created['progress_url']).json()
+        self.assertEqual(progress['units_converted'], progress['unit_count'])
+        self.assertEqual(progress['job_status'], 'completed')
+        self.assertTrue(progress['done'])
+
+    def test_events_stream_until_done(self):
+        upload_id = self._create().json()['upload_id']
+        self._put(upload_id, self.pdf)
+        jobs.run_job(jobs.claim_job('worker-a'), 'worker-a')
+
+        response = self.client.get(f'/api/exam/textbook/uploads/{upload_id}/events/')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join(response.streaming_content).decode('utf-8')
+        self.assertTrue(body.startswith('data: '))
+        self.assertIn('event: done', body)
+
+    def test_events_keepalive_and_timeout(self):
+        upload_id = self._create().json()['upload_id']
+        frames = list(uploads.iter_progress_events(upload_id, interval=0, keepalive=0, timeout=0))
+        self.assertTrue(frames[0].startswith('data: '))
+        self.assertTrue(frames[-1].startswith('event: timeout'))
+
+    def test_reupload_is_existing(self):
+        first = self._create().json()['upload_id']
+        self._put(first, self.pdf)
+        second = self._create("다른 이름.pdf").json()['upload_id']
+        result = self._put(second, self.pdf).json()
+        self.assertTrue(result['existing'])
+        self.assertEqual(result['textbook_id'], PdfUpload.objects.get(id=first).textbook_id)
+
+    def test_concurrent_identical_uploads(self):
+        """두 업로드가 같은 파일로 해시 확인을 함께 통과해도 교재와 작업은 하나"""
+        first = self._create().json()['upload_id']
+        second = self._create("다른 이름.pdf").json()['upload_id']
+        with patch('apps.exam.views.TextbookService.find_uploaded', return_value=None):
+            self._put(first, self.pdf)
+            result = self._put(second, self.pdf).json()
+        self.assertTrue(result['existing'])
+        self.assertIsNone(result['job_id'])
+        self.assertEqual(result['textbook_id'], PdfUpload.objects.get(id=first).textbook_id)
+        self.assertEqual(BrailleJob.objects.count(), 1)
+
+    def test_body_only_once(self):
+        upload_id = self._create().json()['upload_id']
+        self._put(upload_id, self.pdf)
+        self.assertEqual(self._put(upload_id, self.pdf).status_code, 409)
+
+    def test_claim_is_exclusive(self):
+        """같은 업로드를 읽은 두 요청 중 하나만 본문을 받음 (읽은 상태가 둘 다 waiting이어도)"""
+        upload_id = self._create().json()['upload_id']
+        first, second = uploads.get_upload(upload_id), uploads.get_upload(upload_id)
+        self.assertTrue(uploads.claim_upload(first))
+        self.assertEqual(second.status, 'waiting')
+        self.assertFalse(uploads.claim_upload(second))
+        self.assertEqual(self._put(upload_id, self.pdf).status_code, 409)
+
+    def test_size_limit(self):
+        with patch.object(uploads, 'max_upload_bytes', return_value=100):
+            self.assertEqual(self._create(size=101).status_code, 413)
+            upload_id = self._create().json()['upload_id']
+            self.assertEqual(self._put(upload_id, self.pdf).status_code, 413)
+        self.assertEqual(PdfUpload.objects.get(id=upload_id).status, 'failed')
+
+    def test_invalid_pdf(self):
+        upload_id = self._create().json()['upload_id']
+        self.assertEqual(self._put(upload_id, b"not a pdf").status_code, 400)
+        self.assertEqual(self.client.get(f'/api/exam/textbook/uploads/{upload_id}/').json()['status'], 'failed')
+
+    def test_missing_upload(self):
+        self.assertEqual(self.client.get('/api/exam/textbook/uploads/999/').status_code, 404)
+        self.assertEqual(self._create(filename='').status_code, 400)
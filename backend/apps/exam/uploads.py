@@ -0,0 +1,206 @@
+"""
+스트리밍 PDF 업로드
+요청 본문을 조각으로 읽어 임시 파일에 쓰면서 해시를 계산하고, 진행 상황(받은 바이트, 추출한 페이지,
+만든 단원, 변환한 단원)을 PdfUpload 행에 기록
+진행 상황은 GET 폴링 또는 SSE(iter_progress_events)로 조회
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from django.conf import settings
+from django.utils import timezone
+from utils.pdf_cache import load_pages, save_pages
+from utils.pdf_extractor import PdfExtractor
+from .models import BrailleContent, PdfUpload
+from .services import BrailleConversionService
+
+# 요청 본문을 한 번에 읽는 크기
+SPOOL_CHUNK = 256 * 1024
+
+# 진행 상황 기록 간격 (받은 바이트, 추출 시간)
+PROGRESS_BYTES = 1 << 20
+PROGRESS_SECONDS = 0.5
+
+# SSE: 확인 간격, 변화가 없을 때 연결 유지 주석 간격, 최대 연결 시간 (초)
+EVENT_INTERVAL = 0.5
+EVENT_KEEPALIVE = 15
+EVENT_TIMEOUT = 30 * 60
+
+
+class UploadTooLarge(ValueError):
+    """업로드 크기 제한 초과"""
+
+
+def max_upload_bytes() -> int:
+    """업로드 최대 크기 (PDF_UPLOAD_MAX_BYTES)"""
+    return getattr(settings, 'PDF_UPLOAD_MAX_BYTES', 200 * 1024 * 1024)
+
+
+def create_upload(filename: str, total_bytes: Optional[int] = None) -> PdfUpload:
+    """업로드 등록 (본문은 아직 받지 않음)"""
+    if total_bytes is not None and total_bytes > max_upload_bytes():
+        raise UploadTooLarge(f"파일은 {max_upload_bytes()}바이트 이하여야 합니다")
+    return PdfUpload.objects.create(filename=filename, total_bytes=total_bytes)
+
+
+def get_upload(upload_id: int) -> Optional[PdfUpload]:
+    return PdfUpload.objects.select_related('job', 'textbook').filter(id=upload_id).first()
+
+
+def update_upload(upload: PdfUpload, **fields) -> None:
+    """진행 상황 기록 (객체와 행을 함께 갱신, 다른 필드는 건드리지 않음)"""
+    for name, value in fields.items():
+        setattr(upload, name, value)
+    PdfUpload.objects.filter(id=upload.id).update(updated_at=timezone.now(), **fields)
+
+
+def claim_upload(upload: PdfUpload) -> bool:
+    """
+    본문 받기 시작 (waiting → receiving 조건부 UPDATE)
+    같은 업로드에 본문이 동시에 두 번 와도 한 요청만 True
+    """
+    claimed = PdfUpload.objects.filter(id=upload.id, status='waiting').update(
+        status='receiving', updated_at=timezone.now(),
+    ) == 1
+    if claimed:
+        upload.status = 'receiving'
+    return claimed
+
+
+def spool_upload(upload: PdfUpload, stream, length: int) -> Tuple[str, str]:
+    """
+    요청 본문을 조각으로 읽어 임시 파일에 쓰면서 SHA-256 계산 (claim_upload로 먼저 업로드를 차지해야 함)
+    받은 바이트는 PROGRESS_BYTES마다 기록
+
+    Returns:
+        (임시 파일 경로, 해시) - 임시 파일은 호출한 쪽에서 지움
+    Raises:
+        UploadTooLarge: 크기 제한 초과
+    """
+    limit = max_upload_bytes()
+    if length > limit:
+        raise UploadTooLarge(f"파일은 {limit}바이트 이하여야 합니다")
+    update_upload(upload, total_bytes=length)
+
+    digest = hashlib.sha256()
+    received = reported = 0
+    fd, path = tempfile.mkstemp(suffix='.pdf')
+    try:
+        with os.fdopen(fd, 'wb') as spool:
+            for chunk in iter(lambda: stream.read(SPOOL_CHUNK), b''):
+                received += len(chunk)
+                if received > limit:
+                    raise UploadTooLarge(f"파일은 {limit}바이트 이하여야 합니다")
+                digest.update(chunk)
+                spool.write(chunk)
+                if received - reported >= PROGRESS_BYTES:
+                    update_upload(upload, received_bytes=received)
+                    reported = received
+        update_upload(upload, received_bytes=received, content_hash=digest.hexdigest())
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path, digest.hexdigest()
+
+
+def extract_upload_pages(upload: PdfUpload, path: str, digest: str) -> List[Optional[str]]:
+    """
+    임시 파일에서 페이지별 텍스트 추출 (추출한 페이지 수를 PROGRESS_SECONDS마다 기록)
+    같은 파일을 추출한 적이 있으면 캐시에서 읽음
+    """
+    pages = load_pages(digest)
+    if pages is not None:
+        update_upload(upload, status='extracting', total_pages=len(pages), extracted_pages=len(pages))
+        return pages
+
+    with PdfExtractor(path) as extractor:
+        update_upload(upload, status='extracting', total_pages=extractor.page_count)
+        pages = []
+        reported = time.monotonic()
+        for page_text in extractor.iter_pages():
+            pages.append(page_text)
+            if time.monotonic() - reported >= PROGRESS_SECONDS:
+                update_upload(upload, extracted_pages=len(pages))
+                reported = time.monotonic()
+    update_upload(upload, extracted_pages=len(pages))
+    try:
+        save_pages(digest, pages)
+    except OSError:
+        pass
+    return pages
+
+
+def upload_progress(upload: PdfUpload) -> Dict:
+    """
+    업로드 진행 상황
+    units_converted는 교재 단원 중 점자 변환이 끝난 수, done은 더 바뀔 것이 없는지
+    (실패했거나, 완료 후 변환 작업도 끝남)
+    """
+    job = upload.job
+    unit_count = units_converted = 0
+    if upload.textbook_id:
+        strategy = BrailleConversionService._resolve_strategy(upload.textbook.subject or 'korean')
+        unit_count = upload.textbook.units.count()
+        units_converted = BrailleContent.objects.filter(
+            unit__textbook_id=upload.textbook_id, strategy=strategy, status='completed',
+        ).count()
+
+    done = upload.status == 'failed' or (
+        upload.status == 'completed' and (job is None or job.status in ('completed', 'failed'))
+    )
+    return {
+        'upload_id': upload.id,
+        'filename': upload.filename,
+        'status': upload.status,
+        'total_bytes': upload.total_bytes,
+        'received_bytes': upload.received_bytes,
+        'total_pages': upload.total_pages,
+        'extracted_pages': upload.extracted_pages,
+        'units_created': upload.units_created,
+        'unit_count': unit_count,
+        'units_converted': units_converted,
+        'textbook_id': upload.textbook_id,
+        'existing': upload.existing,
+        'job_id': upload.job_id,
+        'job_status': job.status if job else None,
+        'error_message': upload.error_message or None,
+        'done': done,
+    }
+
+
+def iter_progress_events(
+    upload_id: int,
+    interval: float = EVENT_INTERVAL,
+    keepalive: float = EVENT_KEEPALIVE,
+    timeout: float = EVENT_TIMEOUT,
+) -> Iterator[str]:
+    """
+    진행 상황 SSE 프레임
+    바뀔 때마다 data: 프레임, 변화가 없으면 keepalive초마다 주석(프록시 연결 유지),
+    끝나면 event: done (timeout초가 지나면 event: timeout)
+    """
+    started = quiet = time.monotonic()
+    last = None
+    while True:
+        upload = get_upload(upload_id)
+        if upload is None:
+            yield f"event: error\ndata: {json.dumps({'error': '업로드를 찾을 수 없습니다'}, ensure_ascii=False)}\n\n"
+            return
+        progress = upload_progress(upload)
+        now = time.monotonic()
+        if progress != last:
+            yield f"data: {json.dumps(progress, ensure_ascii=False)}\n\n"
+            last, quiet = progress, now
+        elif now - quiet >= keepalive:
+            yield ": keep-alive\n\n"
+            quiet = now
+        if progress['done']:
+            yield f"event: done\ndata: {json.dumps(progress, ensure_ascii=False)}\n\n"
+            return
+        if now - started >= timeout:
+            yield f"event: timeout\ndata: {json.dumps(progress, ensure_ascii=False)}\n\n"
+            return
+        time.sleep(interval)
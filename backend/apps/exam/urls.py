@@ -10,9 +10,15 @@ urlpatterns = [
     # New Jeomgeuli-Suneung endpoints
     path('textbook/', views.list_textbooks, name='list_textbooks'),
     path('textbook/upload-pdf/', views.upload_pdf, name='upload_pdf'),
+    path('textbook/uploads/', views.create_pdf_upload, name='create_pdf_upload'),
+    path('textbook/uploads/<int:upload_id>/', views.pdf_upload, name='pdf_upload'),
+    path('textbook/uploads/<int:upload_id>/events/', views.pdf_upload_events, name='pdf_upload_events'),
     path('textbook/<int:textbook_id>/units/', views.list_units, name='list_units'),
     path('unit/<int:unit_id>/', views.get_unit, name='get_unit'),
+    path('braille-job/<int:job_id>/', views.get_braille_job, name='get_braille_job'),
     path('unit/<int:unit_id>/braille-status/', views.get_braille_status, name='get_braille_status'),
+    path('unit/<int:unit_id>/braille-windows/', views.get_braille_windows, name='get_braille_windows'),
+    path('unit/<int:unit_id>/braille-locate/', views.locate_braille, name='locate_braille'),
     path('question/<int:question_id>/', views.get_question, name='get_question'),
     path('submit/', views.submit_answer, name='submit_answer'),
     path('start/', views.start_exam, name='start_exam'),
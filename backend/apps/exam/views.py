@@ -1,4 +1,5 @@
-from django.http import JsonResponse
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 import PyPDF2
 import io
@@ -6,38 +7,43 @@ import os
 import json
 import re
 from pathlib import Path
-from utils.braille_converter import text_to_cells
+from urllib.parse import quote
+from utils.braille_converter import (
+    CELL_FORMATS, text_to_unicode, serialize_braille, iter_braille_chunks,
+)
+from utils.braille_vectorized import bulk_text_to_packed
+from utils.braille_output import BRAILLE_FILE_FORMATS, LINE_CELLS, cells_to_unicode, iter_braille_file
+from utils.braille_paginator import parse_window_range
+from utils.pdf_cache import extract_pdf_cached, file_digest
+from utils.pdf_extractor import PdfExtractor, join_pages, unit_pages
+from apps.braille.streaming import STREAM_MODES, braille_stream_response, parse_chunk_width
 import google.generativeai as genai
 from .models import Textbook, Unit, Question, QuestionAttempt, GraphTableItem
 from .services import (
     TextbookService, UnitService, QuestionService, GraphAnalysisService,
     ExamSessionService, BrailleConversionService
 )
+from .jobs import enqueue_textbook, get_job_status
+from .uploads import (
+    UploadTooLarge, claim_upload, create_upload, extract_upload_pages, get_upload, iter_progress_events,
+    spool_upload, update_upload, upload_progress,
+)
 
 
 def convert_cells_to_brl(cells):
     """
-    점자 셀 배열을 .brl 형식 텍스트로 변환 (간단한 버전)
-    실제로는 점자 유니코드 매핑이 필요하지만, 여기서는 기본 구현만 제공
+    점자 셀 배열을 .brl 형식(점자 유니코드) 텍스트로 변환
+    64개 점형 전체를 U+2800 + 비트마스크로 계산 (빈 셀은 U+2800)
     """
-    # 점자 유니코드 기본 매핑 (일부만 구현, 실제로는 전체 매핑 필요)
-    braille_unicode_map = {
-        (1, 0, 0, 0, 0, 0): '⠁', (1, 1, 0, 0, 0, 0): '⠃', (1, 0, 0, 1, 0, 0): '⠉',
-        (1, 0, 0, 1, 1, 0): '⠙', (1, 0, 0, 0, 1, 0): '⠑', (1, 1, 0, 1, 0, 0): '⠋',
-        (1, 1, 0, 1, 1, 0): '⠛', (1, 1, 0, 0, 1, 0): '⠓', (0, 1, 0, 1, 0, 0): '⠊',
-        (0, 1, 0, 1, 1, 0): '⠚', (1, 0, 1, 0, 0, 0): '⠅', (1, 0, 1, 1, 0, 0): '⠇',
-        (1, 0, 0, 0, 0, 1): '⠍', (1, 0, 1, 0, 1, 0): '⠝', (1, 0, 1, 1, 1, 0): '⠕',
-        (1, 0, 0, 0, 1, 1): '⠏', (1, 1, 1, 0, 0, 0): '⠟', (1, 1, 1, 0, 1, 0): '⠗',
-        (1, 1, 0, 0, 0, 1): '⠎', (0, 1, 1, 1, 0, 0): '⠞', (1, 1, 1, 1, 0, 0): '⠥',
-        (1, 1, 1, 1, 1, 0): '⠧', (1, 0, 1, 1, 0, 1): '⠺', (0, 1, 0, 1, 1, 1): '⠭',
-        (1, 1, 1, 1, 0, 1): '⠽', (1, 0, 0, 1, 0, 1): '⠵', (0, 0, 0, 0, 0, 0): ' ',
-    }
-    
-    result = []
-    for cell in cells:
-        key = tuple(cell)
-        result.append(braille_unicode_map.get(key, ' '))
-    return ''.join(result)
+    return cells_to_unicode(cells)
+
+
+def _iter_page_texts(extractor):
+    """PDF 페이지별 텍스트를 순서대로 생성 (빈 페이지 제외), 다 읽으면 추출기 정리"""
+    try:
+        yield from extractor.iter_texts()
+    finally:
+        extractor.close()
 
 
 @csrf_exempt
@@ -45,7 +51,13 @@ def convert_textbook(request):
     """
     PDF 교재 → 점자 변환
     POST /api/exam/convert-textbook/
-    FormData: { pdf: File }
+    FormData: {
+        pdf: File, format?: 'cells' | 'packed' | 'unicode',
+        stream?: 'ndjson' | 'sse', width?: number, output?: 'brl' | 'brf'
+    }
+    format=packed 이고 Accept: application/octet-stream 이면 셀당 1바이트 바이너리로 응답
+    stream을 지정하면 페이지 단위로 추출/변환하면서 width 셀 청크를 바로 전송
+    output을 지정하면 .brl(점자 유니코드) / .brf(ASCII 점자) 파일을 줄 단위로 스트리밍 다운로드
     """
     if request.method != 'POST':
         return JsonResponse({'error': 'POST만 지원'}, status=405)
@@ -54,31 +66,68 @@ def convert_textbook(request):
     if not pdf_file:
         return JsonResponse({'error': 'PDF 파일이 필요합니다'}, status=400)
     
+    fmt = request.POST.get('format', 'cells')
+    if fmt not in CELL_FORMATS:
+        return JsonResponse({'error': f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+    
+    output = request.POST.get('output')
+    if output:
+        if output not in BRAILLE_FILE_FORMATS:
+            return JsonResponse({'error': f"output은 {', '.join(BRAILLE_FILE_FORMATS)} 중 하나여야 합니다"}, status=400)
+        try:
+            extractor = PdfExtractor(pdf_file)
+        except PyPDF2.errors.PdfReadError:
+            return JsonResponse({'error': 'PDF 파일이 손상되었거나 읽을 수 없습니다'}, status=400)
+        
+        chunks = iter_braille_chunks(_iter_page_texts(extractor), LINE_CELLS)
+        resp = StreamingHttpResponse(
+            iter_braille_file(chunks, output),
+            content_type='text/plain; charset=utf-8' if output == 'brl' else 'text/plain; charset=us-ascii',
+        )
+        filename = Path(pdf_file.name or 'textbook').stem or 'textbook'
+        resp['Content-Disposition'] = f'attachment; filename="{quote(filename)}.{output}"'
+        return resp
+    
+    stream = request.POST.get('stream')
+    if stream:
+        if stream not in STREAM_MODES:
+            return JsonResponse({'error': f"stream은 {', '.join(STREAM_MODES)} 중 하나여야 합니다"}, status=400)
+        try:
+            width = parse_chunk_width(request.POST.get('width'))
+            extractor = PdfExtractor(pdf_file)
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except PyPDF2.errors.PdfReadError:
+            return JsonResponse({'error': 'PDF 파일이 손상되었거나 읽을 수 없습니다'}, status=400)
+        
+        return braille_stream_response(iter_braille_chunks(_iter_page_texts(extractor), width), fmt, stream)
+    
     try:
-        # PDF → 텍스트 추출
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
+        # PDF → 텍스트 추출 (같은 파일은 캐시, 없으면 페이지 범위별 병렬 추출)
+        _, pdf_text = extract_pdf_cached(pdf_file)
+        text = pdf_text.text
         
         if not text.strip():
             return JsonResponse({'error': 'PDF에서 텍스트를 추출할 수 없습니다'}, status=400)
         
+        if fmt == 'packed' and 'application/octet-stream' in request.headers.get('Accept', ''):
+            # 바이너리 응답은 벡터화 대량 변환으로 바로 패킹
+            return HttpResponse(bulk_text_to_packed(text), content_type='application/octet-stream')
+        
         # 텍스트 → 점자 변환
-        braille_cells = text_to_cells(text)
+        braille = text_to_unicode(text)
         
-        # 점자 텍스트 생성 (선택적, .brl 형식)
-        braille_text = convert_cells_to_brl(braille_cells)
+        # 점자 텍스트 (.brl 형식) = 점자 유니코드 문자열 그대로
+        braille_text = braille
         
         return JsonResponse({
-            'braille_cells': braille_cells,
+            'braille_cells': serialize_braille(braille, fmt),
+            'format': fmt,
             'braille_text': braille_text,
             'original_text': text[:1000],  # 처음 1000자만 반환 (전체는 너무 큼)
             'text_length': len(text),
-            'cells_count': len(braille_cells),
-            'pages_count': len(pdf_reader.pages),
+            'cells_count': len(braille),
+            'pages_count': pdf_text.page_count,
         })
     except PyPDF2.errors.PdfReadError:
         return JsonResponse({'error': 'PDF 파일이 손상되었거나 읽을 수 없습니다'}, status=400)
@@ -439,7 +488,9 @@ def extract_units_from_text(text: str) -> list:
                 units.append({
                     'order': order,
                     'title': f"{order}단원",
-                    'content': content
+                    'content': content,
+                    'start': match.start(2),  # 원문 위치 (페이지 번호 계산용)
+                    'end': match.end(2),
                 })
     
     # 중복 제거 (order 기준)
@@ -454,10 +505,53 @@ def extract_units_from_text(text: str) -> list:
     return units
 
 
+def _create_textbook(textbook_info: dict, content_hash: str, pdf_text) -> tuple:
+    """
+    추출한 PDF 텍스트로 Textbook/Unit 생성 (단원을 찾지 못하면 앞부분 전체를 한 단원으로)
+    제목/연도가 같아도 파일이 다르면 새 교재, 같은 파일로 그사이 다른 요청이 만든 교재가 있으면 그 교재
+    Returns:
+        (Textbook, Unit 리스트 (만들지 않았으면 빈 리스트), 새로 만들었는지)
+    """
+    text = pdf_text.text
+    units_data = extract_units_from_text(text)
+    if not units_data:
+        units_data = [{
+            'order': 1,
+            'title': '전체',
+            'content': text[:5000],  # 처음 5000자
+            'start': 0,
+            'end': min(len(text), 5000),
+        }]
+    
+    # 교재와 단원을 한 트랜잭션으로 (같은 파일을 동시에 올린 요청은 단원까지 만들어진 교재를 받음)
+    with transaction.atomic():
+        textbook, created = TextbookService().create_uploaded(
+            content_hash,
+            title=textbook_info['title'],
+            year=textbook_info['year'],
+            publisher=textbook_info['publisher'],
+            subject=textbook_info['subject'],
+        )
+        if not created:
+            return textbook, [], False
+        units = Unit.objects.bulk_create([
+            Unit(
+                textbook=textbook,
+                title=unit_data['title'],
+                order=unit_data['order'],
+                content=unit_data['content'],
+                **unit_pages(pdf_text, unit_data),
+            )
+            for unit_data in units_data
+        ])
+    return textbook, units, True
+
+
 @csrf_exempt
 def upload_pdf(request):
     """
-    PDF 업로드 → 텍스트 추출 → 단원 분리 → Textbook/Unit 생성 → 백그라운드 점자 변환
+    PDF 업로드 → 텍스트 추출 → 단원 분리 → Textbook/Unit 생성 → 점자 변환 작업 등록
+    변환 진행 상황은 GET /api/exam/braille-job/{job_id}/
     POST /api/exam/textbook/upload-pdf/
     FormData: { pdf: File }
     """
@@ -469,47 +563,30 @@ def upload_pdf(request):
         return JsonResponse({'error': 'PDF 파일이 필요합니다'}, status=400)
     
     try:
-        # PDF 텍스트 추출
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            try:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            except Exception as e:
-                print(f"[upload_pdf] 페이지 추출 실패: {e}")
-                continue
-        
-        if not text.strip():
-            return JsonResponse({'error': 'PDF에서 텍스트를 추출할 수 없습니다'}, status=400)
-        
-        # 교재 정보 추출
+        # 같은 파일로 만든 교재가 있으면 추출 없이 바로 응답 (파일 해시로 판단)
         textbook_info = extract_textbook_info(pdf_file.name)
+        content_hash = file_digest(pdf_file)
+        textbook = TextbookService().find_uploaded(content_hash, textbook_info['title'], textbook_info['year'])
+        if textbook is not None:
+            return JsonResponse({
+                'ok': True,
+                'textbook_id': textbook.id,
+                'unit_count': 0,
+                'message': '이미 존재하는 교재입니다.',
+                'existing': True,
+            })
         
-        # 단원 추출
-        units_data = extract_units_from_text(text)
-        
-        if not units_data:
-            # 단원을 찾지 못한 경우 전체를 하나의 단원으로
-            units_data = [{
-                'order': 1,
-                'title': '전체',
-                'content': text[:5000]  # 처음 5000자
-            }]
+        # PDF 텍스트 추출 (같은 파일을 추출한 적이 있으면 캐시, 없으면 페이지 범위별 병렬 추출)
+        _, pdf_text = extract_pdf_cached(pdf_file, digest=content_hash)
+        text = pdf_text.text
+        if pdf_text.failed_pages:
+            print(f"[upload_pdf] 페이지 추출 실패: {[page + 1 for page in pdf_text.failed_pages]}")
         
-        # Textbook 생성 또는 조회
-        textbook, created = Textbook.objects.get_or_create(
-            title=textbook_info['title'],
-            year=textbook_info['year'],
-            defaults={
-                'publisher': textbook_info['publisher'],
-                'subject': textbook_info['subject'],
-            }
-        )
+        if not text.strip():
+            return JsonResponse({'error': 'PDF에서 텍스트를 추출할 수 없습니다'}, status=400)
         
+        textbook, units, created = _create_textbook(textbook_info, content_hash, pdf_text)
         if not created:
-            # 이미 존재하는 교재인 경우
             return JsonResponse({
                 'ok': True,
                 'textbook_id': textbook.id,
@@ -518,33 +595,15 @@ def upload_pdf(request):
                 'existing': True,
             })
         
-        # Unit 생성
-        unit_ids = []
-        for unit_data in units_data:
-            unit = Unit.objects.create(
-                textbook=textbook,
-                title=unit_data['title'],
-                order=unit_data['order'],
-                content=unit_data['content']
-            )
-            unit_ids.append(unit.id)
-        
-        # 백그라운드 점자 변환 시작 (동기적으로 실행 - 나중에 Celery로 변경 가능)
-        conversion_service = BrailleConversionService()
-        for unit_id in unit_ids:
-            try:
-                # 비동기로 실행하려면 여기서 Celery 태스크를 호출
-                # 현재는 동기적으로 실행 (나중에 개선)
-                conversion_service.convert_unit_to_braille(unit_id, textbook.subject)
-            except Exception as e:
-                print(f"[upload_pdf] 점자 변환 실패 (unit_id={unit_id}): {e}")
-                # 변환 실패해도 계속 진행
+        # 점자 변환은 작업 큐에 등록만 하고 바로 응답 (manage.py braille_worker가 처리)
+        job = enqueue_textbook(textbook)
         
         return JsonResponse({
             'ok': True,
             'textbook_id': textbook.id,
-            'unit_count': len(unit_ids),
-            'message': 'PDF 업로드 및 점자 변환 완료',
+            'unit_count': len(units),
+            'job_id': job.id,
+            'message': 'PDF 업로드 완료, 점자 변환 대기 중',
         })
         
     except PyPDF2.errors.PdfReadError:
@@ -555,18 +614,145 @@ def upload_pdf(request):
         return JsonResponse({'error': f'처리 중 오류: {str(e)}'}, status=500)
 
 
+
+@csrf_exempt
+def create_pdf_upload(request):
+    """
+    스트리밍 PDF 업로드 등록 (본문은 PUT /api/exam/textbook/uploads/<upload_id>/ 로 전송)
+    POST /api/exam/textbook/uploads/
+    Body: { filename: string, size?: number }
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST만 지원'}, status=405)
+    
+    try:
+        data = json.loads(request.body.decode('utf-8') or '{}')
+        filename = (data.get('filename') or '').strip()
+        if not filename:
+            return JsonResponse({'error': 'filename이 필요합니다'}, status=400)
+        size = data.get('size')
+        upload = create_upload(filename, int(size) if size is not None else None)
+    except UploadTooLarge as e:
+        return JsonResponse({'error': str(e)}, status=413)
+    except (json.JSONDecodeError, ValueError, TypeError):
+        return JsonResponse({'error': '잘못된 JSON 형식입니다'}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+    
+    base = f"/api/exam/textbook/uploads/{upload.id}/"
+    return JsonResponse({
+        'ok': True,
+        'upload_id': upload.id,
+        'upload_url': base,
+        'progress_url': base,
+        'events_url': base + 'events/',
+    })
+
+
+@csrf_exempt
+def pdf_upload(request, upload_id):
+    """
+    스트리밍 PDF 업로드
+    PUT /api/exam/textbook/uploads/<upload_id>/  (본문 = PDF 바이트, Content-Length 필요)
+        본문을 조각으로 임시 파일에 받으며 해시 계산 → 페이지 추출 → Textbook/Unit 생성 → 점자 변환 작업 등록
+    GET /api/exam/textbook/uploads/<upload_id>/
+        진행 상황 (받은 바이트, 추출한 페이지, 만든 단원, 변환한 단원)
+    """
+    upload = get_upload(upload_id)
+    if upload is None:
+        return JsonResponse({'error': '업로드를 찾을 수 없습니다'}, status=404)
+    
+    if request.method == 'GET':
+        return JsonResponse({'ok': True, **upload_progress(upload)})
+    if request.method not in ('PUT', 'POST'):
+        return JsonResponse({'error': 'GET, PUT만 지원'}, status=405)
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        length = 0
+    if length <= 0:
+        return JsonResponse({'error': 'Content-Length가 필요합니다'}, status=411)
+    if not claim_upload(upload):
+        return JsonResponse({'error': '이미 본문을 받은 업로드입니다'}, status=409)
+    
+    try:
+        path, content_hash = spool_upload(upload, request, length)
+    except UploadTooLarge as e:
+        update_upload(upload, status='failed', error_message=str(e))
+        return JsonResponse({'error': str(e)}, status=413)
+    except Exception as e:
+        update_upload(upload, status='failed', error_message=str(e))
+        return JsonResponse({'error': f'업로드 수신 중 오류: {str(e)}'}, status=500)
+    
+    try:
+        # 같은 파일로 만든 교재가 있으면 추출 없이 완료
+        textbook_info = extract_textbook_info(upload.filename)
+        textbook = TextbookService().find_uploaded(content_hash, textbook_info['title'], textbook_info['year'])
+        if textbook is not None:
+            update_upload(upload, status='completed', textbook=textbook, existing=True)
+            return JsonResponse({'ok': True, **upload_progress(upload)})
+        
+        pdf_text = join_pages(extract_upload_pages(upload, path, content_hash))
+        if not pdf_text.text.strip():
+            update_upload(upload, status='failed', error_message='PDF에서 텍스트를 추출할 수 없습니다')
+            return JsonResponse({'error': upload.error_message}, status=400)
+        
+        textbook, units, created = _create_textbook(textbook_info, content_hash, pdf_text)
+        if not created:
+            update_upload(upload, status='completed', textbook=textbook, existing=True)
+            return JsonResponse({'ok': True, **upload_progress(upload)})
+        update_upload(upload, textbook=textbook, units_created=len(units))
+        
+        # 점자 변환은 작업 큐에 등록 (변환한 단원 수는 진행 상황에서 계속 갱신)
+        job = enqueue_textbook(textbook)
+        update_upload(upload, status='completed', job=job)
+        return JsonResponse({'ok': True, **upload_progress(upload)})
+    except PyPDF2.errors.PdfReadError:
+        update_upload(upload, status='failed', error_message='PDF 파일이 손상되었거나 읽을 수 없습니다')
+        return JsonResponse({'error': upload.error_message}, status=400)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        update_upload(upload, status='failed', error_message=str(e))
+        return JsonResponse({'error': f'처리 중 오류: {str(e)}'}, status=500)
+    finally:
+        os.unlink(path)
+
+
+@csrf_exempt
+def pdf_upload_events(request, upload_id):
+    """
+    스트리밍 PDF 업로드 진행 상황 SSE
+    GET /api/exam/textbook/uploads/<upload_id>/events/
+    바뀔 때마다 data: 프레임 (GET 진행 상황과 같은 형식), 점자 변환까지 끝나면 event: done
+    """
+    if request.method != 'GET':
+        return JsonResponse({'error': 'GET만 지원'}, status=405)
+    if get_upload(upload_id) is None:
+        return JsonResponse({'error': '업로드를 찾을 수 없습니다'}, status=404)
+    
+    resp = StreamingHttpResponse(iter_progress_events(upload_id), content_type='text/event-stream')
+    resp["Cache-Control"] = "no-cache"
+    resp["X-Accel-Buffering"] = "no"  # 프록시(ngrok 등) 버퍼링 방지
+    return resp
+
+
 @csrf_exempt
 def get_braille_status(request, unit_id):
     """
     단원의 점자 변환 상태 조회
-    GET /api/exam/unit/<unit_id>/braille-status/
+    GET /api/exam/unit/<unit_id>/braille-status/?format=cells|packed|unicode
     """
     if request.method != 'GET':
         return JsonResponse({'error': 'GET만 지원'}, status=405)
     
+    fmt = request.GET.get('format', 'cells')
+    if fmt not in CELL_FORMATS:
+        return JsonResponse({'error': f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+    
     try:
         service = BrailleConversionService()
-        status = service.get_braille_status(unit_id)
+        status = service.get_braille_status(unit_id, fmt=fmt)
         
         if not status:
             return JsonResponse({'error': '단원을 찾을 수 없습니다'}, status=404)
@@ -578,3 +764,87 @@ def get_braille_status(request, unit_id):
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+
+@csrf_exempt
+def get_braille_job(request, job_id):
+    """
+    교재 점자 변환 작업 상태와 단원별 진행 상황
+    GET /api/exam/braille-job/<job_id>/
+    """
+    if request.method != 'GET':
+        return JsonResponse({'error': 'GET만 지원'}, status=405)
+    
+    try:
+        job = get_job_status(job_id)
+        if not job:
+            return JsonResponse({'error': '작업을 찾을 수 없습니다'}, status=404)
+        return JsonResponse({
+            'ok': True,
+            **job,
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+
+@csrf_exempt
+def get_braille_windows(request, unit_id):
+    """
+    단원 점자를 디스플레이 폭 단위 창으로 조회 (어절 단위로 나눔)
+    GET /api/exam/unit/<unit_id>/braille-windows/?width=3|20|40&start=0&count=1&format=cells|packed|unicode
+    """
+    if request.method != 'GET':
+        return JsonResponse({'error': 'GET만 지원'}, status=405)
+    
+    fmt = request.GET.get('format', 'cells')
+    if fmt not in CELL_FORMATS:
+        return JsonResponse({'error': f"format은 {', '.join(CELL_FORMATS)} 중 하나여야 합니다"}, status=400)
+    try:
+        width = parse_chunk_width(request.GET.get('width'))
+        start, count = parse_window_range(request.GET.get('start'), request.GET.get('count'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    
+    try:
+        service = BrailleConversionService()
+        result = service.get_braille_windows(unit_id, width, start=start, count=count, fmt=fmt)
+        return JsonResponse({
+            'ok': True,
+            **result,
+        })
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@csrf_exempt
+def locate_braille(request, unit_id):
+    """
+    단원 원문 위치 ↔ 점자 셀 위치 조회 (TTS/점자 동기화, 문장 반복·이동)
+    GET /api/exam/unit/<unit_id>/braille-locate/?sentence=k | ?word=k | ?start=i&end=j | ?cell=n
+    -> { unit_id, text_start, text_end, cell_start, cell_end, text, ... }
+    """
+    if request.method != 'GET':
+        return JsonResponse({'error': 'GET만 지원'}, status=405)
+    
+    params = {}
+    try:
+        for name in ('sentence', 'word', 'start', 'end', 'cell'):
+            value = request.GET.get(name)
+            if value not in (None, ''):
+                params[name] = int(value)
+    except ValueError:
+        return JsonResponse({'error': f'{name}는 정수여야 합니다'}, status=400)
+    
+    try:
+        service = BrailleConversionService()
+        result = service.locate_braille(unit_id, **params)
+        return JsonResponse({
+            'ok': True,
+            **result,
+        })
+    except (IndexError, ValueError) as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    except LookupError as e:
+        return JsonResponse({'error': str(e)}, status=404)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
@@ -158,4 +158,23 @@ if "CACHES" not in globals():
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "jeomgeuli-cache",
         }
-    }
\ No newline at end of file
+    }
+
+# 점자 변환 / 변환 작업 큐 / PDF 업로드 - 성능 관련 설정 (모두 환경변수로 조정)
+# 교재 단위 대량 변환은 NumPy로 벡터화 (requirements.txt, 설치되지 않았으면 순수 파이썬 경로로 변환)
+# 교재 전체 점자 변환 병렬화 (워커 수 0 = CPU 수, 조각 크기는 문자 수)
+BRAILLE_CONVERT_WORKERS = int(os.getenv("BRAILLE_CONVERT_WORKERS", "0"))
+BRAILLE_CONVERT_CHUNK_CHARS = int(os.getenv("BRAILLE_CONVERT_CHUNK_CHARS", "200000"))
+# 단원 변환 임대 시간 (초, 변환 중에 죽은 워커의 단원은 만료 뒤 다른 워커가 다시 변환)
+BRAILLE_CONVERT_LEASE_SECONDS = int(os.getenv("BRAILLE_CONVERT_LEASE_SECONDS", "600"))
+# 교재 점자 변환 작업 큐 (manage.py braille_worker)
+# 임대 시간(초) 안에 하트비트가 없으면 다른 워커가 작업을 다시 가져가고, 재시도 대기는 RETRY_SECONDS부터 두 배씩
+BRAILLE_JOB_LEASE_SECONDS = int(os.getenv("BRAILLE_JOB_LEASE_SECONDS", "300"))
+BRAILLE_JOB_MAX_ATTEMPTS = int(os.getenv("BRAILLE_JOB_MAX_ATTEMPTS", "3"))
+BRAILLE_JOB_RETRY_SECONDS = int(os.getenv("BRAILLE_JOB_RETRY_SECONDS", "30"))
+# PDF 텍스트 추출 병렬화 (워커 수 0 = CPU 수, 페이지가 적은 PDF는 프로세스 풀 없이 추출)
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", "0"))
+# 스트리밍 PDF 업로드 최대 크기 (바이트)
+PDF_UPLOAD_MAX_BYTES = int(os.getenv("PDF_UPLOAD_MAX_BYTES", str(200 * 1024 * 1024)))
+# 증분 변환 세션을 보관할 캐시 (CACHES 별칭, 워커 프로세스가 여럿이면 공유 캐시여야 함)
+BRAILLE_SESSION_CACHE = os.getenv("BRAILLE_SESSION_CACHE", "default")
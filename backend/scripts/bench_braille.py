@@ -0,0 +1,110 @@
+"""
+점자 변환기 벤치마크 / 차분 검증 스크립트
+작업 묶음별 처리량(문자/초, 셀/초)과 최대 메모리를 재고, 학습 데이터에 적힌 셀과 결과를 비교
+변환기를 고치기 전후에 --save / --compare로 수치를 남겨 비교
+
+사용법:
+    python scripts/bench_braille.py                              # text_to_cells
+    python scripts/bench_braille.py --converter unicode --repeat 5
+    python scripts/bench_braille.py --units                      # DB 단원 본문으로 측정
+    python scripts/bench_braille.py --save before.json
+    python scripts/bench_braille.py --compare before.json --strict
+"""
+import os
+import sys
+import json
+import django
+
+# Django 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jeomgeuli_backend.settings')
+django.setup()
+
+from utils.braille_benchmark import (
+    SYNTHETIC_BYTES, build_workloads, default_converters, run_benchmark, run_differential,
+)
+
+
+def _unit_texts(limit):
+    from apps.exam.models import Unit
+    return list(Unit.objects.exclude(content='').order_by('id').values_list('content', flat=True)[:limit])
+
+
+def _mismatch_count(differential):
+    return sum(len(entry['mismatches']) for entry in differential.values())
+
+
+def run(converter='cells', repeat=3, corpus_bytes=SYNTHETIC_BYTES, units=None, verbose=False):
+    """벤치마크와 차분 검증을 실행하고 결과 딕셔너리 반환"""
+    convert = default_converters()[converter]
+    workloads = build_workloads(_unit_texts(units) if units else None, corpus_bytes)
+
+    print(f"변환기: {converter} (반복 {repeat}회, 최솟값)")
+    print(f"{'작업':<12}{'텍스트':>8}{'문자':>12}{'셀':>12}{'문자/초':>14}{'셀/초':>14}{'최대 메모리':>14}")
+    benchmarks = {}
+    for name, texts in workloads.items():
+        result = run_benchmark(name, convert, texts, repeat)
+        benchmarks[name] = result.as_dict()
+        print(
+            f"{name:<12}{result.texts:>8}{result.chars:>12,}{result.cells:>12,}"
+            f"{result.chars_per_sec:>14,.0f}{result.cells_per_sec:>14,.0f}{result.peak_bytes / 1024:>12,.0f}KB"
+        )
+
+    differential = run_differential(default_converters()['unicode'] if converter in ('cells', 'packed') else convert)
+    print("\n차분 검증 (학습 데이터에 적힌 셀과 비교)")
+    for dataset, entry in differential.items():
+        print(f"  {dataset:<18}{entry['matched']:>4}/{entry['total']:<4} 일치")
+        if verbose:
+            for mismatch in entry['mismatches']:
+                print(f"    {mismatch['text']!r}: 기대 {mismatch['expected']} / 결과 {mismatch['actual']} (위치 {mismatch['index']})")
+
+    return {'converter': converter, 'benchmarks': benchmarks, 'differential': differential}
+
+
+def compare(result, baseline):
+    """이전 결과 대비 처리량 변화와 새로 생긴 불일치 출력, 불일치가 늘었으면 True"""
+    print(f"\n비교 기준: {baseline.get('converter')}")
+    for name, current in result['benchmarks'].items():
+        before = baseline.get('benchmarks', {}).get(name)
+        if not before or not before.get('chars_per_sec'):
+            continue
+        change = (current['chars_per_sec'] / before['chars_per_sec'] - 1) * 100
+        print(f"  {name:<12}{before['chars_per_sec']:>14,} → {current['chars_per_sec']:>14,} 문자/초 ({change:+.1f}%)")
+
+    regressed = False
+    for dataset, entry in result['differential'].items():
+        before = {m['text'] for m in baseline.get('differential', {}).get(dataset, {}).get('mismatches', [])}
+        new = [m['text'] for m in entry['mismatches'] if m['text'] not in before]
+        if new:
+            regressed = True
+            print(f"  [새 불일치] {dataset}: {', '.join(new)}")
+    before_total = _mismatch_count(baseline.get('differential', {}))
+    print(f"  불일치: {before_total} → {_mismatch_count(result['differential'])}")
+    return regressed
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='점자 변환기 벤치마크 / 차분 검증')
+    parser.add_argument('--converter', default='cells', choices=sorted(default_converters()), help='측정할 변환기 (기본 cells = text_to_cells)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 사용)')
+    parser.add_argument('--corpus-bytes', type=int, default=SYNTHETIC_BYTES, help='합성 말뭉치 크기 (UTF-8 바이트)')
+    parser.add_argument('--units', type=int, nargs='?', const=50, help='DB 단원 본문 N개로 단원 작업 측정 (기본 50개)')
+    parser.add_argument('--verbose', action='store_true', help='불일치 항목 출력')
+    parser.add_argument('--save', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--compare', help='이전에 저장한 결과와 비교')
+    parser.add_argument('--strict', action='store_true', help='--compare에서 새 불일치가 있으면 종료 코드 1')
+
+    args = parser.parse_args()
+
+    result = run(args.converter, args.repeat, args.corpus_bytes, args.units, args.verbose)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n[OK] 결과 저장: {args.save}")
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressed = compare(result, json.load(f))
+        if regressed and args.strict:
+            sys.exit(1)
@@ -5,6 +5,7 @@ backend/data/pdfs/ 폴더의 모든 PDF 파일을 처리하여 Textbook/Unit 데
 사용법:
     python scripts/import_pdfs.py           # 기본 모드 (패턴 매칭)
     python scripts/import_pdfs.py --ai     # AI 모드 (OpenAI API 기본, 환경변수로 변경 가능)
+    python scripts/import_pdfs.py --braille  # 임포트한 단원을 바로 점자로 변환
 """
 import os
 import sys
@@ -21,7 +22,10 @@ django.setup()
 
 from apps.exam.models import Textbook, Unit
 from apps.exam.repositories import TextbookRepository, UnitRepository
+from apps.exam.services import BrailleConversionService, TextbookService
 from core.ai.factory import AIClientFactory
+from utils.pdf_cache import file_digest, load_pages, save_pages
+from utils.pdf_extractor import PdfExtractor, join_pages, unit_pages
 
 # PDF 폴더 경로
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -107,7 +111,9 @@ def extract_units_from_text(text: str, ai_client=None) -> list:
                 units.append({
                     'order': order,
                     'title': f"{order}단원",
-                    'content': content
+                    'content': content,
+                    'start': match.start(2),  # 원문 위치 (페이지 번호 계산용)
+                    'end': match.end(2),
                 })
     
     # 중복 제거 (order 기준)
@@ -160,26 +166,34 @@ def process_pdf_file(pdf_path: Path, ai_client=None) -> dict:
     print(f"\n처리 중: {pdf_path.name}")
     
     try:
-        # PDF 읽기
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            text = ""
-            page_count = len(pdf_reader.pages)
-            
-            print(f"  페이지 수: {page_count}")
-            
-            for i, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+        # 파일 해시 (같은 파일을 추출한 적이 있으면 캐시에서 읽고 PyPDF2는 건너뜀)
+        content_hash = file_digest(pdf_path)
+        pages = load_pages(content_hash)
+        if pages is not None:
+            page_count = len(pages)
+            print(f"  페이지 수: {page_count} (캐시)")
+        else:
+            # PDF 읽기 (페이지 범위별 병렬 추출)
+            with PdfExtractor(pdf_path) as extractor:
+                page_count = extractor.page_count
+                print(f"  페이지 수: {page_count}")
+                
+                pages = []
+                for page_text in extractor.iter_pages():
+                    pages.append(page_text)
+                    if page_text is None:
+                        print(f"  [경고] 페이지 {len(pages)} 추출 실패")
                     
                     # 진행 상황 표시 (10페이지마다)
-                    if (i + 1) % 10 == 0:
-                        print(f"  진행: {i + 1}/{page_count} 페이지")
-                except Exception as e:
-                    print(f"  [경고] 페이지 {i + 1} 추출 실패: {e}")
-                    continue
+                    if len(pages) % 10 == 0:
+                        print(f"  진행: {len(pages)}/{page_count} 페이지")
+            try:
+                save_pages(content_hash, pages)
+            except OSError as e:
+                print(f"  [경고] 추출 캐시 저장 실패: {e}")
+        
+        pdf_text = join_pages(pages)
+        text = pdf_text.text
         
         if not text.strip():
             print(f"  [오류] 텍스트를 추출할 수 없습니다")
@@ -203,16 +217,23 @@ def process_pdf_file(pdf_path: Path, ai_client=None) -> dict:
             units = [{
                 'order': 1,
                 'title': '전체',
-                'content': text[:5000]  # 처음 5000자
+                'content': text[:5000],  # 처음 5000자
+                'start': 0,
+                'end': min(len(text), 5000),
             }]
         
+        # 단원 페이지 범위 (원문 위치가 있는 단원만)
+        for unit in units:
+            unit.update(unit_pages(pdf_text, unit))
+        
         print(f"  추출된 단원 수: {len(units)}개")
         
         return {
             'textbook': textbook_info,
             'units': units,
             'text_length': len(text),
-            'page_count': page_count
+            'page_count': page_count,
+            'content_hash': content_hash,
         }
         
     except PyPDF2.errors.PdfReadError as e:
@@ -225,9 +246,10 @@ def process_pdf_file(pdf_path: Path, ai_client=None) -> dict:
         return None
 
 
-def import_pdfs(use_ai: bool = False):
+def import_pdfs(use_ai: bool = False, convert_braille: bool = False):
     """
     PDF 폴더의 모든 PDF 파일을 처리하여 데이터베이스에 저장
+    convert_braille: 생성한 교재의 단원을 바로 점자로 변환 (NumPy가 있으면 벡터화 경로)
     """
     # PDF 폴더 확인
     if not PDF_DIR.exists():
@@ -278,17 +300,23 @@ def import_pdfs(use_ai: bool = False):
             error_count += 1
             continue
         
-        # Textbook 생성 또는 조회
+        # Textbook 생성 또는 조회 (같은 파일인지는 파일 해시로 판단)
         try:
-            textbook, created = Textbook.objects.get_or_create(
+            textbook = TextbookService(textbook_repo).find_uploaded(
+                result['content_hash'], result['textbook']['title'], result['textbook']['year'],
+            )
+            if textbook is not None:
+                print(f"  [-] {textbook.title} 이미 존재 (건너뜀)")
+                skip_count += 1
+                continue
+            
+            textbook, created = TextbookService(textbook_repo).create_uploaded(
+                result['content_hash'],
                 title=result['textbook']['title'],
                 year=result['textbook']['year'],
-                defaults={
-                    'publisher': result['textbook']['publisher'],
-                    'subject': result['textbook']['subject'],
-                }
+                publisher=result['textbook']['publisher'],
+                subject=result['textbook']['subject'],
             )
-            
             if not created:
                 print(f"  [-] {textbook.title} 이미 존재 (건너뜀)")
                 skip_count += 1
@@ -301,13 +329,20 @@ def import_pdfs(use_ai: bool = False):
                     textbook=textbook,
                     title=unit_data['title'],
                     order=unit_data['order'],
-                    content=unit_data['content']
+                    content=unit_data['content'],
+                    start_page=unit_data.get('start_page'),
+                    end_page=unit_data.get('end_page'),
                 )
                 unit_count += 1
             
             print(f"  [OK] {textbook.title} 생성 완료 ({unit_count}개 단원)")
             success_count += 1
             
+            if convert_braille:
+                result = BrailleConversionService().convert_textbook_to_braille(textbook.id, fmt='packed')
+                completed = sum(1 for item in result['results'] if item['status'] == 'completed')
+                print(f"  [점자] {completed}/{result['total_units']}개 단원 변환 완료")
+            
         except Exception as e:
             print(f"  [오류] 데이터베이스 저장 실패: {e}")
             error_count += 1
@@ -328,6 +363,7 @@ if __name__ == '__main__':
 예시:
   python scripts/import_pdfs.py           # 기본 모드 (패턴 매칭)
   python scripts/import_pdfs.py --ai     # AI 모드 (OpenAI API 기본, 환경변수로 변경 가능)
+  python scripts/import_pdfs.py --braille  # 임포트 후 단원 점자 변환
   
 파일명 규칙:
   - 수능특강_국어_2024.pdf
@@ -341,9 +377,11 @@ AI 제공자 설정:
     )
     parser.add_argument('--ai', action='store_true', 
                        help='AI를 사용하여 단원 추출 (기본: OpenAI, 환경변수로 변경 가능)')
+    parser.add_argument('--braille', action='store_true',
+                       help='임포트한 단원을 바로 점자로 변환')
     
     args = parser.parse_args()
     
-    import_pdfs(use_ai=args.ai)
+    import_pdfs(use_ai=args.ai, convert_braille=args.braille)
 
 
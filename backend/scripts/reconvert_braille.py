@@ -0,0 +1,53 @@
+"""
+교재 점자 재변환 스크립트
+점자 테이블(ko_braille.json)을 고친 뒤 교재 전체를 프로세스 풀에서 다시 변환
+
+사용법:
+    python scripts/reconvert_braille.py                  # 모든 교재
+    python scripts/reconvert_braille.py --textbook 3     # 특정 교재
+    python scripts/reconvert_braille.py --workers 8 --chunk-chars 100000
+"""
+import os
+import sys
+import time
+import django
+
+# Django 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jeomgeuli_backend.settings')
+django.setup()
+
+from apps.exam.models import Textbook
+from apps.exam.services import BrailleConversionService
+
+
+def reconvert(textbook_ids=None, workers=None, chunk_chars=None):
+    """교재별로 완료된 단원까지 모두 다시 변환"""
+    textbooks = Textbook.objects.all().order_by('id')
+    if textbook_ids:
+        textbooks = textbooks.filter(id__in=textbook_ids)
+    
+    service = BrailleConversionService()
+    for textbook in textbooks:
+        started = time.perf_counter()
+        result = service.convert_textbook_to_braille(
+            textbook.id, fmt='packed', force=True, workers=workers, chunk_chars=chunk_chars,
+        )
+        failed = sum(1 for item in result['results'] if item['status'] == 'failed')
+        print(
+            f"[OK] {textbook.title}: {result['converted_units']}/{result['total_units']}개 단원 "
+            f"({time.perf_counter() - started:.2f}초, 실패 {failed}개)"
+        )
+
+
+if __name__ == '__main__':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='교재 점자 재변환')
+    parser.add_argument('--textbook', type=int, action='append', help='교재 ID (여러 번 지정 가능)')
+    parser.add_argument('--workers', type=int, help='워커 프로세스 수 (기본: BRAILLE_CONVERT_WORKERS, 0이면 CPU 수)')
+    parser.add_argument('--chunk-chars', type=int, help='조각 크기 (문자 수, 기본: BRAILLE_CONVERT_CHUNK_CHARS)')
+    
+    args = parser.parse_args()
+    
+    reconvert(args.textbook, workers=args.workers, chunk_chars=args.chunk_chars)
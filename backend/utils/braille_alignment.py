@@ -0,0 +1,128 @@
+"""
+원문-셀 정렬 색인
+저장된 정렬 배열(원문 문자별 셀 시작 위치 누적합)로 문장/어절/문자 범위 ↔ 셀 범위를 바로 찾음
+(재변환이나 점자 재탐색 없이 TTS 위치 동기화, 문장 반복, 이동에 사용)
+"""
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from utils.braille_converter import unpack_alignment
+from utils.content_extractor import sentence_spans, word_spans
+
+# 정렬 색인 캐시 크기 (단원 수)
+ALIGNMENT_CACHE_SIZE = 128
+
+
+class AlignmentIndex:
+    """
+    단원 원문과 정렬 배열의 색인
+    - offsets[i]: 원문 i번째 문자의 셀 시작 위치, offsets[len(text)]: 전체 셀 수
+    - 문장/어절 위치는 처음 조회할 때 한 번만 계산
+    """
+
+    def __init__(self, text: str, offsets):
+        if len(offsets) != len(text) + 1:
+            raise ValueError("정렬 배열 길이가 원문과 맞지 않습니다 (변환 이후 단원 내용이 바뀌었을 수 있습니다)")
+        self.text = text
+        self.offsets = offsets
+        self._sentences: Optional[List[Tuple[int, int]]] = None
+        self._words: Optional[List[Tuple[int, int]]] = None
+
+    @classmethod
+    def from_bytes(cls, text: str, data: bytes) -> 'AlignmentIndex':
+        return cls(text, unpack_alignment(data))
+
+    @property
+    def sentences(self) -> List[Tuple[int, int]]:
+        if self._sentences is None:
+            self._sentences = sentence_spans(self.text)
+        return self._sentences
+
+    @property
+    def words(self) -> List[Tuple[int, int]]:
+        if self._words is None:
+            self._words = word_spans(self.text)
+        return self._words
+
+    @property
+    def total_cells(self) -> int:
+        return self.offsets[-1]
+
+    def text_range(self, start: int, end: int) -> Dict:
+        """원문 문자 범위 [start, end) → 셀 범위"""
+        length = len(self.text)
+        if not 0 <= start <= end <= length:
+            raise IndexError(f"원문 범위는 0 <= start <= end <= {length} 이어야 합니다")
+        return {
+            'text_start': start,
+            'text_end': end,
+            'cell_start': self.offsets[start],
+            'cell_end': self.offsets[end],
+            'text': self.text[start:end],
+        }
+
+    def sentence(self, index: int) -> Dict:
+        """index번째 문장 → 셀 범위"""
+        start, end = _span_at(self.sentences, index, '문장')
+        return {'sentence': index, **self.text_range(start, end)}
+
+    def word(self, index: int) -> Dict:
+        """index번째 어절 → 셀 범위"""
+        start, end = _span_at(self.words, index, '어절')
+        return {'word': index, **self.text_range(start, end)}
+
+    def cell(self, position: int) -> Dict:
+        """
+        셀 위치 → 그 셀을 만든 원문 문자와 그 문자가 속한 문장/어절
+        (셀 시작 위치가 position 이하인 마지막 문자, 셀이 없는 문자는 건너뜀)
+        """
+        if not 0 <= position < self.total_cells:
+            raise IndexError(f"셀 위치는 0~{self.total_cells - 1} 범위여야 합니다")
+        index = bisect_right(self.offsets, position) - 1
+        result = {'cell': position, **self.text_range(index, index + 1)}
+        result['sentence'] = _span_index(self.sentences, index)
+        result['word'] = _span_index(self.words, index)
+        return result
+
+
+def _span_at(spans: List[Tuple[int, int]], index: int, name: str) -> Tuple[int, int]:
+    if not 0 <= index < len(spans):
+        raise IndexError(f"{name} 번호는 0~{len(spans) - 1} 범위여야 합니다")
+    return spans[index]
+
+
+def _span_index(spans: List[Tuple[int, int]], position: int) -> Optional[int]:
+    """position을 포함하는 구간 번호 (없으면 None)"""
+    index = bisect_right(spans, (position, float('inf'))) - 1
+    if index >= 0 and spans[index][0] <= position < spans[index][1]:
+        return index
+    return None
+
+
+_CACHE: 'OrderedDict[Hashable, AlignmentIndex]' = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def cached_alignment_index(key: Hashable, load: Callable[[], Tuple[str, bytes]]) -> AlignmentIndex:
+    """
+    단원 정렬 색인 (key별로 캐시, 없을 때만 load()로 (원문, 정렬 바이트)를 읽어 생성)
+    key에는 변환 시각 등 정렬이 바뀌면 달라지는 값을 포함해야 함
+    """
+    with _CACHE_LOCK:
+        index = _CACHE.get(key)
+        if index is not None:
+            _CACHE.move_to_end(key)
+            return index
+
+    index = AlignmentIndex.from_bytes(*load())
+    with _CACHE_LOCK:
+        _CACHE[key] = index
+        while len(_CACHE) > ALIGNMENT_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return index
+
+
+def clear_alignment_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
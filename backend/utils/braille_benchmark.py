@@ -0,0 +1,196 @@
+"""
+점자 변환기 벤치마크 / 차분 검증
+- 작업 묶음(짧은 낱말, 학습 문장, 단원 전체, 1MB 합성 말뭉치)별 처리량(문자/초, 셀/초)과 최대 메모리
+- 학습 데이터(lesson_words/lesson_sentences/lesson_chars, ko_braille_core)에 적힌 셀과 변환 결과 비교
+실행은 scripts/bench_braille.py
+"""
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+from utils.data_loader import load_json
+from utils.braille_converter import cells_to_unicode, dot_numbers_to_unicode, text_to_cells, text_to_unicode
+
+# 합성 말뭉치 기본 크기 (UTF-8 바이트)
+SYNTHETIC_BYTES = 1 << 20
+
+# 학습 문장이 없을 때 쓰는 단원 본문 문장
+_FALLBACK_SENTENCES = ('나는 학생이다.', '오늘 날씨가 맑다.', '책을 읽습니다.')
+
+# 합성 말뭉치에 섞는 숫자/로마자 어절 (혼합 텍스트 경로도 측정되도록)
+_MIXED_WORDS = ('2024년', '3.5배', 'DNA', 'pH', 'New', 'York', '100%', 'x²')
+
+
+def _as_text(braille) -> str:
+    """변환 결과(점자 문자열, 셀 배열, 패킹 바이트)를 비교용 점자 문자열로"""
+    if isinstance(braille, str):
+        return braille
+    if isinstance(braille, (bytes, bytearray)):
+        return ''.join(chr(0x2800 + value) for value in braille)
+    return cells_to_unicode(braille)
+
+
+def lesson_words() -> List[str]:
+    words = [item['word'] for item in load_json("lesson_words.json", {}).get('items', []) if item.get('word')]
+    words += [item['word'] for item in load_json("ko_braille_core.json", {}).get('words', []) if item.get('word')]
+    return words
+
+
+def lesson_sentences() -> List[str]:
+    sentences = [
+        item['sentence'] for item in load_json("lesson_sentences.json", {}).get('items', []) if item.get('sentence')
+    ]
+    sentences += [item['text'] for item in load_json("ko_braille_core.json", {}).get('sentences', []) if item.get('text')]
+    return sentences or list(_FALLBACK_SENTENCES)
+
+
+def synthetic_corpus(target_bytes: int = SYNTHETIC_BYTES, seed: int = 0) -> str:
+    """
+    학습 낱말/문장과 숫자·로마자 어절을 섞은 합성 말뭉치 (UTF-8로 target_bytes 이상, 같은 seed면 같은 결과)
+    """
+    rng = random.Random(seed)
+    words = lesson_words() + [word for sentence in lesson_sentences() for word in sentence.split()]
+    mixed = list(_MIXED_WORDS)
+    parts, size = [], 0
+    while size < target_bytes:
+        count = rng.randint(4, 12)
+        sentence = ' '.join(
+            rng.choice(mixed) if rng.random() < 0.05 else rng.choice(words) for _ in range(count)
+        )
+        sentence = sentence.rstrip('.') + '. '
+        parts.append(sentence)
+        size += len(sentence.encode('utf-8'))
+    return ''.join(parts)
+
+
+def build_workloads(unit_texts: Optional[Sequence[str]] = None, corpus_bytes: int = SYNTHETIC_BYTES) -> Dict[str, List[str]]:
+    """
+    작업 묶음 이름 → 텍스트 리스트
+    unit_texts: 단원 본문 (없으면 학습 문장을 이어 붙인 약 20,000자 본문 하나)
+    """
+    sentences = lesson_sentences()
+    if not unit_texts:
+        body = ' '.join(sentences)
+        unit_texts = [(body + ' ') * (20000 // (len(body) + 1) + 1)]
+    return {
+        'words': lesson_words(),
+        'sentences': sentences,
+        'units': [text for text in unit_texts if text],
+        'synthetic': [synthetic_corpus(corpus_bytes)],
+    }
+
+
+class BenchResult(NamedTuple):
+    """작업 묶음 하나의 측정 결과 (seconds는 반복 중 최솟값, first_seconds는 첫 실행)"""
+    name: str
+    texts: int
+    chars: int
+    cells: int
+    seconds: float
+    first_seconds: float
+    peak_bytes: int
+
+    @property
+    def chars_per_sec(self) -> float:
+        return self.chars / self.seconds if self.seconds else 0.0
+
+    @property
+    def cells_per_sec(self) -> float:
+        return self.cells / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            **self._asdict(),
+            'chars_per_sec': round(self.chars_per_sec),
+            'cells_per_sec': round(self.cells_per_sec),
+        }
+
+
+def run_benchmark(name: str, convert: Callable, texts: Sequence[str], repeat: int = 3) -> BenchResult:
+    """
+    texts 전체를 repeat번 변환해 시간 측정, 마지막에 tracemalloc으로 한 번 더 돌려 최대 메모리 측정
+    (tracemalloc은 느려지므로 시간 측정과 따로 실행)
+    """
+    chars = sum(len(text) for text in texts)
+    timings, cells = [], 0
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        cells = sum(len(convert(text)) for text in texts)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        for text in texts:
+            convert(text)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchResult(name, len(texts), chars, cells, min(timings), timings[0], peak)
+
+
+class DiffCase(NamedTuple):
+    """차분 검증 항목 (데이터 이름, 원문, 데이터에 적힌 점자)"""
+    dataset: str
+    text: str
+    expected: str
+
+
+def differential_cases() -> Iterator[DiffCase]:
+    """학습 데이터에 셀이 적힌 항목 전부"""
+    for item in load_json("lesson_words.json", {}).get('items', []):
+        if item.get('word') and item.get('cells'):
+            yield DiffCase('lesson_words', item['word'], cells_to_unicode(item['cells']))
+    for item in load_json("lesson_sentences.json", {}).get('items', []):
+        if item.get('sentence') and item.get('cells'):
+            yield DiffCase('lesson_sentences', item['sentence'], cells_to_unicode(item['cells']))
+    for item in load_json("lesson_chars.json", {}).get('items', []):
+        if item.get('char') and item.get('cell'):
+            yield DiffCase('lesson_chars', item['char'], cells_to_unicode([item['cell']]))
+    for item in load_json("ko_braille_core.json", {}).get('chars', []):
+        if item.get('char') and item.get('dots'):
+            yield DiffCase('ko_braille_core', item['char'], dot_numbers_to_unicode([item['dots']]))
+
+
+def _first_difference(expected: str, actual: str) -> int:
+    for index, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            return index
+    return min(len(expected), len(actual))
+
+
+def run_differential(convert: Callable = text_to_unicode, cases: Optional[Sequence[DiffCase]] = None) -> Dict:
+    """
+    데이터에 적힌 점자와 변환 결과 비교
+    Returns:
+        {데이터 이름: {'total', 'matched', 'mismatches': [{'text', 'expected', 'actual', 'index'}]}}
+    """
+    report: Dict[str, Dict] = {}
+    for case in (differential_cases() if cases is None else cases):
+        entry = report.setdefault(case.dataset, {'total': 0, 'matched': 0, 'mismatches': []})
+        entry['total'] += 1
+        actual = _as_text(convert(case.text))
+        if actual == case.expected:
+            entry['matched'] += 1
+        else:
+            entry['mismatches'].append({
+                'text': case.text,
+                'expected': case.expected,
+                'actual': actual,
+                'index': _first_difference(case.expected, actual),
+            })
+    return report
+
+
+def default_converters() -> Dict[str, Callable]:
+    """벤치마크할 수 있는 변환기 (이름 → 텍스트 하나를 받는 함수)"""
+    from utils.braille_contraction import contracted_text_to_unicode
+    from utils.braille_vectorized import bulk_text_to_packed
+    from utils.mixed_braille import mixed_to_unicode
+
+    return {
+        'cells': text_to_cells,
+        'unicode': text_to_unicode,
+        'packed': bulk_text_to_packed,
+        'mixed': mixed_to_unicode,
+        'contracted': contracted_text_to_unicode,
+    }
@@ -0,0 +1,208 @@
+"""
+한국 점자 약자/약어 변환
+braille_catalog.json의 규칙으로 트라이와 음절 테이블을 미리 만들어 두고
+어절마다 음절열에서 최장 일치로 약어를 적용
+"""
+import time
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from utils.data_loader import DATA_DIR, load_json
+from utils.braille_converter import (
+    CHOSEONG, JUNGSEONG, JONGSEONG, HANGUL_FIRST, HANGUL_COUNT, DOUBLE_FINALS,
+    WORD_MEMO_SIZE, WORD_MEMO_MAX_CHARS, char_to_unicode, dot_numbers_to_unicode, table_version,
+)
+from utils.braille_registry import TABLE_CHECK_INTERVAL
+
+CATALOG_FILE = "braille_catalog.json"
+
+# 트라이 노드에서 규칙 끝을 나타내는 키
+_END = ''
+
+
+def _decompose(ch: str) -> Optional[Tuple[int, int, int]]:
+    """한글 음절 → (초성, 중성, 종성) 인덱스"""
+    base = ord(ch) - HANGUL_FIRST
+    if not 0 <= base < HANGUL_COUNT:
+        return None
+    return base // (21 * 28), (base % (21 * 28)) // 28, base % 28
+
+
+class ContractionRules:
+    """
+    미리 컴파일된 약자/약어 규칙
+    - trie: 음절 단위 트라이, 끝 노드에 (점자, 어절 첫머리 전용 여부)
+    - syllables: 한글 음절 11,172자 전부의 약자 적용 결과
+    - plain: 모음 앞에서 약자를 쓰지 않는 음절의 풀어 쓴 결과
+    """
+
+    def __init__(self, catalog: Dict):
+        abbr_syllables = {
+            item['char']: item for item in catalog.get('abbrSyllables', [])
+            if item.get('char') and item.get('dots')
+        }
+        self.trie: Dict = {}
+        for item in catalog.get('abbrWords', []):
+            if item.get('word') and item.get('dots'):
+                self._insert(item['word'], dot_numbers_to_unicode(item['dots']), word_start=True)
+
+        # 초성 ㅇ은 적지 않음 (제1장 제1절 [다만 1])
+        initials = [char_to_unicode(c) if c != 'ㅇ' else '' for c in CHOSEONG]
+        medials = [char_to_unicode(c) for c in JUNGSEONG]
+        finals = [''] + [
+            ''.join(char_to_unicode(c) for c in DOUBLE_FINALS.get(f, f)) for f in JONGSEONG[1:]
+        ]
+
+        # 약자를 종류별로 분류: 음절 전체 / 초성+중성(받침 붙음) / 중성+종성(초성 붙음)
+        whole, open_syllables, rimes = {}, {}, {}
+        ieung = CHOSEONG.index('ㅇ')
+        for ch, item in abbr_syllables.items():
+            parts = _decompose(ch)
+            if not parts:
+                continue
+            cells = dot_numbers_to_unicode(item['dots'])
+            whole[ch] = cells
+            initial, medial, final = parts
+            if final == 0:
+                open_syllables[(initial, medial)] = cells
+            elif initial == ieung:
+                rimes[(medial, final)] = cells
+
+        self.syllables: Dict[str, str] = {}
+        for base in range(HANGUL_COUNT):
+            ch = chr(HANGUL_FIRST + base)
+            initial, medial, final = base // (21 * 28), (base % (21 * 28)) // 28, base % 28
+            if ch in whole:
+                cells = whole[ch]
+            elif (initial, medial) in open_syllables:
+                cells = open_syllables[(initial, medial)] + finals[final]
+            elif (medial, final) in rimes:
+                cells = initials[initial] + rimes[(medial, final)]
+            else:
+                cells = initials[initial] + medials[medial] + finals[final]
+            self.syllables[ch] = cells
+
+        # '나, 다, 마, ...' 뒤에 모음이 이어지면 약자를 쓰지 않음 (제2장 제6절 [다만])
+        self.plain: Dict[str, str] = {}
+        for ch, item in abbr_syllables.items():
+            parts = _decompose(ch)
+            if parts and parts[2] == 0 and item.get('beforeVowel') is False:
+                self.plain[ch] = initials[parts[0]] + medials[parts[1]]
+
+    def _insert(self, word: str, cells: str, word_start: bool) -> None:
+        node = self.trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[_END] = (cells, word_start)
+
+    def contract_word(self, word: str) -> str:
+        """어절 하나에 약자/약어를 적용 (최장 일치)"""
+        out = []
+        i, length = 0, len(word)
+        while i < length:
+            # 트라이에서 가장 긴 약어 찾기
+            node, j, match = self.trie, i, None
+            while j < length and word[j] in node:
+                node = node[word[j]]
+                j += 1
+                rule = node.get(_END)
+                if rule and (i == 0 or not rule[1]):
+                    match = (j, rule[0])
+            if match:
+                i, cells = match
+                out.append(cells)
+                continue
+
+            ch = word[i]
+            if ch in self.plain and i + 1 < length and _starts_with_vowel(word[i + 1]):
+                out.append(self.plain[ch])
+            else:
+                cells = self.syllables.get(ch)
+                out.append(cells if cells is not None else char_to_unicode(ch))
+            i += 1
+        return ''.join(out)
+
+
+def _starts_with_vowel(ch: str) -> bool:
+    """초성 ㅇ으로 시작하는 음절(모음으로 시작)인지"""
+    parts = _decompose(ch)
+    return bool(parts) and CHOSEONG[parts[0]] == 'ㅇ'
+
+
+def catalog_file_version() -> Optional[Tuple[int, int]]:
+    """braille_catalog.json 버전 (수정 시각, 크기)"""
+    try:
+        stat = (DATA_DIR / CATALOG_FILE).stat()
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+_RULES: Optional[ContractionRules] = None
+_RULES_VERSION = None
+_catalog_version = None
+_last_check = 0.0
+
+
+def rules_version() -> Tuple:
+    """
+    규칙 버전 (ko_braille.json 버전, braille_catalog.json 버전)
+    카탈로그 파일은 레지스트리와 같이 TABLE_CHECK_INTERVAL마다 확인
+    """
+    global _catalog_version, _last_check
+    now = time.monotonic()
+    if _RULES is None or now - _last_check >= TABLE_CHECK_INTERVAL:
+        _last_check = now
+        _catalog_version = catalog_file_version()
+    return (table_version(), _catalog_version)
+
+
+def get_rules() -> ContractionRules:
+    """컴파일된 규칙 (ko_braille.json이나 braille_catalog.json이 바뀌면 다시 컴파일)"""
+    global _RULES, _RULES_VERSION
+    version = rules_version()
+    if _RULES is None or version != _RULES_VERSION:
+        _RULES = ContractionRules(load_json(CATALOG_FILE, {}))
+        _RULES_VERSION = version
+        _memo_contracted_word.cache_clear()
+    return _RULES
+
+
+def invalidate() -> None:
+    """다음 get_rules() 호출에서 카탈로그 파일 버전을 다시 확인하도록 표시"""
+    global _last_check
+    _last_check = 0.0
+
+
+@lru_cache(maxsize=WORD_MEMO_SIZE)
+def _memo_contracted_word(word: str) -> str:
+    return _RULES.contract_word(word)
+
+
+def _contract_word(word: str) -> str:
+    if len(word) > WORD_MEMO_MAX_CHARS:
+        return _RULES.contract_word(word)
+    return _memo_contracted_word(word)
+
+
+def contracted_word_to_unicode(word: str) -> str:
+    """
+    정규화된(NFC) 공백 없는 어절 하나를 약자 점자로 (메모된 결과 사용)
+    호출하는 쪽에서 get_rules()로 규칙을 먼저 확인해야 함
+    """
+    return _contract_word(word)
+
+
+def contracted_text_to_unicode(text: str) -> str:
+    """
+    텍스트를 약자/약어를 적용한 점자 유니코드 문자열로 변환
+
+    Args:
+        text: 변환할 텍스트
+
+    Returns:
+        점자 유니코드 문자열 (문자 하나가 셀 하나)
+    """
+    get_rules()
+    normalized_text = unicodedata.normalize("NFC", text or "")
+    return char_to_unicode(' ').join(map(_contract_word, normalized_text.split(' ')))
@@ -1,95 +1,445 @@
 """
 점자 변환 유틸리티
 """
-import json
+import base64
+import re
+import sys
 import unicodedata
-from pathlib import Path
-from django.conf import settings
-from typing import List
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from utils import braille_registry
+from utils.braille_registry import (  # noqa: F401 (하위 호환 재노출)
+    BRAILLE_BASE, BLANK_CELL, CHOSEONG, JUNGSEONG, JONGSEONG, DOUBLE_FINALS,
+    HANGUL_FIRST, HANGUL_COUNT, TABLE_CHECK_INTERVAL, DATA_DIR,
+)
 
-DATA_DIR = Path(settings.BASE_DIR) / "data"
+# 6점 비트마스크(0~63) → 점 배열 (점1 = bit0 ... 점6 = bit5)
+MASK_DOTS = tuple(tuple((mask >> i) & 1 for i in range(6)) for mask in range(64))
+_CHAR_DOTS = {chr(BRAILLE_BASE + mask): dots for mask, dots in enumerate(MASK_DOTS)}
 
-# 전역 점자 매핑 캐시
-_BRAILLE_MAP = None
+# 패킹 형식: 셀 하나 = 1바이트 (하위 6비트가 점 마스크)
+_UNICODE_TO_BYTE = {BRAILLE_BASE + mask: mask for mask in range(64)}
+_BYTE_TO_UNICODE = {mask: BRAILLE_BASE + mask for mask in range(64)}
+
+# 6점 점자 유니코드 문자열 검증용
+_BRAILLE_RE = re.compile('[\u2800-\u283f]*')
+
+# 원문-셀 정렬 배열 원소 형식 (uint32)
+ALIGNMENT_TYPECODE = 'I'
+
+# 응답 셀 형식: cells(레거시 [[0|1 x 6], ...]), packed(base64 바이트), unicode(점자 문자열)
+CELL_FORMATS = ('cells', 'packed', 'unicode')
+
+# 단어(어절) 메모 크기와 메모 대상 최대 길이
+WORD_MEMO_SIZE = 8192
+WORD_MEMO_MAX_CHARS = 32
+
+# 일괄 변환 시 텍스트 구분자 (변환 테이블에서 자기 자신으로 매핑)
+_BATCH_SEPARATOR = braille_registry.BATCH_SEPARATOR
+
+# 레지스트리에서 받아 온 현재 테이블 (핫 경로에서 속성 조회를 줄이려고 전역에 바인딩)
+_TABLE = None
+_TRANSLATE_TABLE = None
+_BATCH_TABLE = None
+_SPACE_CELLS = BLANK_CELL
+_TABLE_VERSION = None
+
+
+def _bind_table(table: braille_registry.CompiledBrailleTable) -> None:
+    """레지스트리 테이블을 모듈 전역에 바인딩하고 단어 메모를 비움"""
+    global _TABLE, _TRANSLATE_TABLE, _BATCH_TABLE, _SPACE_CELLS, _TABLE_VERSION
+    _TABLE = table
+    _TRANSLATE_TABLE = table.translate
+    _BATCH_TABLE = table.batch_translate
+    _SPACE_CELLS = table.space
+    _TABLE_VERSION = table.version
+    _memo_word.cache_clear()
 
 
 def _load_braille_map() -> dict:
-    """점자 매핑 테이블을 안전하게 로드 (캐시 사용)"""
-    global _BRAILLE_MAP
-    if _BRAILLE_MAP is not None:
-        return _BRAILLE_MAP
-    
-    try:
-        data_path = DATA_DIR / "ko_braille.json"
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            _BRAILLE_MAP = data
-            return data
-    except Exception:
-        _BRAILLE_MAP = {}
-        return {}
+    """점자 매핑 테이블 (문자 → 점 배열, 레지스트리 원본의 사본)"""
+    return {ch: list(dots) for ch, dots in braille_registry.get_table().source.items()}
+
+
+def reload_braille_table() -> None:
+    """ko_braille.json을 다시 컴파일해 레지스트리에 등록하고 단어 메모를 비움"""
+    _bind_table(braille_registry.compile_table())
+
+
+def _check_table_version() -> None:
+    """레지스트리 테이블이 바뀌었으면 다시 바인딩 (변경 확인 주기는 레지스트리가 관리)"""
+    table = braille_registry.get_table()
+    if table is not _TABLE:
+        _bind_table(table)
+
+
+@lru_cache(maxsize=WORD_MEMO_SIZE)
+def _memo_word(word: str) -> str:
+    """정규화된 어절 → 점자 유니코드 문자열 (LRU 메모)"""
+    return word.translate(_TRANSLATE_TABLE)
+
+
+def _word_to_unicode(word: str) -> str:
+    if len(word) > WORD_MEMO_MAX_CHARS:
+        return word.translate(_TRANSLATE_TABLE)
+    return _memo_word(word)
+
+
+def word_to_unicode(word: str) -> str:
+    """
+    정규화된(NFC) 공백 없는 어절 하나를 점자 유니코드 문자열로 (메모된 결과 사용)
+    호출하는 쪽에서 table_version()으로 테이블을 먼저 확인해야 함
+    """
+    return _word_to_unicode(word)
+
+
+def memo_stats() -> Dict:
+    """단어 메모 적중/미스 통계"""
+    info = _memo_word.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'maxsize': info.maxsize,
+        'table_version': _TABLE_VERSION,
+    }
+
+
+def table_version() -> Optional[Tuple[int, int]]:
+    """현재 변환 테이블의 ko_braille.json 버전 (변경 시 갱신)"""
+    _check_table_version()
+    return _TABLE_VERSION
+
+
+def char_to_unicode(ch: str) -> str:
+    """문자 하나(자모/음절/문장부호)의 기본 점자 유니코드 문자열"""
+    return _TRANSLATE_TABLE[ord(ch)]
+
+
+_check_table_version()
+
+
+def text_to_unicode(text: str) -> str:
+    """
+    텍스트를 점자 유니코드 문자열로 변환
+    어절(공백 단위)별로 메모된 변환 결과를 재사용
+
+    Args:
+        text: 변환할 텍스트
+
+    Returns:
+        점자 유니코드 문자열 (U+2800 ~ U+283F, 문자 하나가 셀 하나)
+    """
+    _check_table_version()
+    # 유니코드 정규화로 조합형/분해형 통일 (NFC로 조합형 유지)
+    normalized_text = unicodedata.normalize("NFC", text or "")
+    return _SPACE_CELLS.join(map(_word_to_unicode, normalized_text.split(' ')))
+
+
+def text_alignment(text: str) -> array:
+    """
+    텍스트 → 원문-셀 정렬 배열 (원문 문자별 셀 수의 누적합)
+    offsets[i]는 text_to_unicode(text)에서 i번째 문자(NFC 기준)가 시작하는 셀 위치,
+    offsets[len] 은 전체 셀 수 (문자 i의 셀 범위는 offsets[i]:offsets[i + 1])
+    """
+    _check_table_version()
+    normalized = unicodedata.normalize("NFC", text or "")
+    offsets = array(ALIGNMENT_TYPECODE, [0])
+    translate = _TRANSLATE_TABLE
+    offsets.extend(accumulate(len(translate[ord(ch)]) for ch in normalized))
+    return offsets
+
+
+def word_alignment(
+    text: str,
+    encode_word: Callable[[str], str],
+    split_words: Optional[Callable[[str], List[str]]] = None,
+) -> array:
+    """
+    어절 단위 정렬 배열 (문자별 점자가 순서대로 대응하지 않는 수식/영어 약자용)
+    공백으로 나눈 어절 안의 문자는 모두 어절 시작 셀을 가리키고, 공백 하나는 빈 셀 하나
+
+    Args:
+        text: 원문
+        encode_word: 어절 → 점자 유니코드 문자열 (변환 시 쓴 것과 같은 함수)
+        split_words: 원문 → 어절 리스트 (' '로 이으면 원문, 기본은 모든 공백에서 나눔)
+    """
+    words = split_words(text) if split_words else text.split(' ')
+    offsets = array(ALIGNMENT_TYPECODE)
+    position = 0
+    for index, word in enumerate(words):
+        if index:
+            offsets.append(position)
+            position += 1
+        offsets.extend([position] * len(word))
+        position += len(encode_word(word))
+    offsets.append(position)
+    return offsets
+
+
+def project_alignment(offsets, spans: List[Tuple[int, int]], separator_len: int, length: int) -> array:
+    """
+    원문 일부 구간만 이어 붙여 변환했을 때의 정렬 배열을 원문 기준으로 옮김
+    offsets는 구간들을 separator(길이 separator_len)로 이은 텍스트의 정렬 배열,
+    구간 밖 원문 문자는 다음 구간의 시작 셀(마지막 구간 뒤는 끝 셀)을 가리킴
+
+    Args:
+        offsets: 이어 붙인 텍스트의 정렬 배열
+        spans: 원문 구간 [(start, end), ...] (오름차순, 겹치지 않음)
+        separator_len: 구간 사이 구분자 문자 수
+        length: 원문 길이
+    """
+    projected = array(ALIGNMENT_TYPECODE)
+    cursor = base = 0
+    for index, (start, end) in enumerate(spans):
+        if index:
+            base += separator_len
+        projected.extend([offsets[base]] * (start - cursor))
+        projected.extend(offsets[base:base + end - start])
+        base += end - start
+        cursor = end
+    projected.extend([offsets[base]] * (length - cursor + 1))
+    return projected
+
+
+def pack_alignment(offsets) -> bytes:
+    """정렬 배열을 저장용 바이트로 변환 (원소당 uint32 리틀엔디언)"""
+    packed = array(ALIGNMENT_TYPECODE, offsets)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_alignment(data: bytes) -> array:
+    """저장된 정렬 바이트를 정렬 배열로 변환"""
+    offsets = array(ALIGNMENT_TYPECODE)
+    offsets.frombytes(bytes(data or b''))
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+    return offsets
+
+
+def word_cells(word: str) -> Tuple[Tuple[int, ...], ...]:
+    """
+    어절을 점 배열 튜플로 변환 (메모된 결과 사용, 불변 튜플을 공유)
+    """
+    _check_table_version()
+    normalized = unicodedata.normalize("NFC", word or "")
+    return tuple(map(_CHAR_DOTS.__getitem__, _word_to_unicode(normalized)))
+
+
+def texts_to_unicode(texts: List[str]) -> List[str]:
+    """
+    여러 텍스트를 한 번에 점자 유니코드 문자열로 변환
+    구분자로 이어 붙여 정규화/변환을 한 번씩만 수행한 뒤 다시 나눔
+
+    Args:
+        texts: 변환할 텍스트 리스트
+
+    Returns:
+        텍스트별 점자 유니코드 문자열 리스트 (입력 순서 유지)
+    """
+    if not texts:
+        return []
+    _check_table_version()
+    # 입력에 포함된 구분자는 단건 변환과 같이 빈 셀이 되도록 공백으로 치환
+    joined = _BATCH_SEPARATOR.join((text or '').replace(_BATCH_SEPARATOR, ' ') for text in texts)
+    normalized = unicodedata.normalize("NFC", joined)
+    return normalized.translate(_BATCH_TABLE).split(_BATCH_SEPARATOR)
+
+
+# 스트리밍 변환 시 한 번에 처리할 입력 블록 크기 (문자 수)
+STREAM_BLOCK_CHARS = 4096
+
+
+def _joins_previous(ch: str) -> bool:
+    """앞 글자와 합쳐지는 문자인지 (결합 문자, 조합형 한글의 중성/종성)"""
+    return (
+        unicodedata.combining(ch) != 0
+        or '\u1160' <= ch <= '\u11ff'
+        or '\ud7b0' <= ch <= '\ud7ff'
+    )
+
+
+def iter_text_blocks(text: str, block_chars: int = STREAM_BLOCK_CHARS) -> Iterator[str]:
+    """
+    긴 텍스트를 공백 경계에서 블록 단위로 나눔
+    (공백 뒤에서 자르므로 블록별 NFC 정규화 결과가 전체 정규화와 같음)
+    공백이 없는 구간은 글자 경계로 물러나서 자름 (NFD 음절의 자모나 결합 문자를 나누지 않음)
+    """
+    text = text or ''
+    start, length = 0, len(text)
+    while start < length:
+        end = min(start + block_chars, length)
+        if end < length:
+            cut = text.rfind(' ', start, end)
+            if cut > start:
+                end = cut + 1
+            else:
+                boundary = end
+                while boundary > start and _joins_previous(text[boundary]):
+                    boundary -= 1
+                if boundary > start:
+                    end = boundary
+        yield text[start:end]
+        start = end
+
+
+def iter_braille_chunks(
+    blocks: Iterable[str], width: int, convert: Optional[Callable[[str], str]] = None,
+) -> Iterator[str]:
+    """
+    텍스트 블록을 순서대로 변환하면서 표시 폭(width) 단위 점자 청크를 생성
+    마지막 청크만 width보다 짧을 수 있음 (메모리 사용량은 블록 크기에만 비례)
+
+    Args:
+        blocks: 텍스트 블록 이터러블 (iter_text_blocks, PDF 페이지 등)
+        width: 청크당 셀 수 (점자 디스플레이 폭)
+        convert: 블록 변환 함수 (기본 text_to_unicode)
+
+    Yields:
+        점자 유니코드 문자열 청크
+    """
+    if width < 1:
+        raise ValueError("width는 1 이상이어야 합니다")
+
+    convert = convert or text_to_unicode
+    pending = ''
+    for block in blocks:
+        pending += convert(block)
+        cut = len(pending) - len(pending) % width
+        for start in range(0, cut, width):
+            yield pending[start:start + width]
+        pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def iter_cells(text: str) -> Iterator[List[int]]:
+    """텍스트를 블록 단위로 변환하며 점 배열을 하나씩 생성"""
+    for block in iter_text_blocks(text):
+        yield from unicode_to_cells(text_to_unicode(block))
+
+
+def unicode_to_cells(braille: str) -> List[List[int]]:
+    """점자 유니코드 문자열을 점 배열 리스트로 변환"""
+    return list(map(list, map(_CHAR_DOTS.__getitem__, braille)))
 
 
 def text_to_cells(text: str) -> List[List[int]]:
     """
     텍스트를 점자 셀로 변환 (한글 자음+모음 분해 포함)
-    
+
     Args:
         text: 변환할 텍스트
-    
+
     Returns:
         점자 셀 리스트 [[0|1 x 6], ...]
     """
     try:
-        # 유니코드 정규화로 조합형/분해형 통일 (NFC로 조합형 유지)
-        normalized_text = unicodedata.normalize("NFC", text or "")
-        braille_map = _load_braille_map()
-        
-        res = []
-        for ch in normalized_text:
-            # 먼저 완전한 글자로 매핑 시도
-            arr = braille_map.get(ch)
-            if isinstance(arr, list) and len(arr) == 6:
-                res.append([1 if int(x) else 0 for x in arr])
-                continue
-            elif isinstance(arr, list) and len(arr) == 12:
-                # 12개 점이면 2개 셀로 분할
-                res.append([1 if int(x) else 0 for x in arr[:6]])
-                res.append([1 if int(x) else 0 for x in arr[6:]])
-                continue
-            
-            # 한글인 경우 자음+모음으로 분해
-            if '가' <= ch <= '힣':
-                base = ord(ch) - ord('가')
-                initial = base // (21 * 28)  # 초성
-                medial = (base % (21 * 28)) // 28  # 중성
-                final = base % 28  # 종성
-                
-                consonants = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-                vowels = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
-                
-                if initial < len(consonants):
-                    initial_char = consonants[initial]
-                    initial_arr = braille_map.get(initial_char)
-                    if isinstance(initial_arr, list) and len(initial_arr) == 6:
-                        res.append([1 if int(x) else 0 for x in initial_arr])
-                
-                if medial < len(vowels):
-                    medial_char = vowels[medial]
-                    medial_arr = braille_map.get(medial_char)
-                    if isinstance(medial_arr, list) and len(medial_arr) == 6:
-                        res.append([1 if int(x) else 0 for x in medial_arr])
-                
-                if final > 0 and final < len(consonants):
-                    final_char = consonants[final]
-                    final_arr = braille_map.get(final_char)
-                    if isinstance(final_arr, list) and len(final_arr) == 6:
-                        res.append([1 if int(x) else 0 for x in final_arr])
-            else:
-                # 알 수 없는 문자는 공백으로 처리
-                res.append([0, 0, 0, 0, 0, 0])
-        
-        return res
+        return unicode_to_cells(text_to_unicode(text))
     except Exception:
         return []
 
+
+def cell_to_mask(cell) -> int:
+    """[0|1 x 6] 점 배열을 6비트 마스크로 변환"""
+    mask = 0
+    for i, dot in enumerate(cell[:6]):
+        if dot:
+            mask |= 1 << i
+    return mask
+
+
+def dot_numbers_to_unicode(dots: List[List[int]]) -> str:
+    """[[점 번호 1..6], ...] 을 점자 유니코드 문자열로 변환 (데이터 파일의 dots 표기)"""
+    return ''.join(chr(BRAILLE_BASE + sum(1 << (dot - 1) for dot in cell)) for cell in dots)
+
+
+def cells_to_unicode(cells: List[List[int]]) -> str:
+    """점 배열 리스트를 점자 유니코드 문자열로 변환 (U+2800 + 비트마스크)"""
+    return ''.join([chr(BRAILLE_BASE + cell_to_mask(cell)) for cell in cells])
+
+
+def unicode_to_packed(braille: str) -> bytes:
+    """점자 유니코드 문자열을 패킹 바이트로 변환 (셀당 1바이트)"""
+    return braille.translate(_UNICODE_TO_BYTE).encode('latin-1')
+
+
+def packed_to_unicode(data: bytes) -> str:
+    """패킹 바이트를 점자 유니코드 문자열로 변환"""
+    if data and max(data) > 63:
+        raise ValueError("패킹 셀 값은 0~63 범위여야 합니다")
+    return bytes(data).decode('latin-1').translate(_BYTE_TO_UNICODE)
+
+
+def cells_to_packed(cells: List[List[int]]) -> bytes:
+    """점 배열 리스트를 패킹 바이트로 변환"""
+    return bytes(cell_to_mask(cell) for cell in cells)
+
+
+def packed_to_cells(data: bytes) -> List[List[int]]:
+    """패킹 바이트를 점 배열 리스트로 변환"""
+    return unicode_to_cells(packed_to_unicode(data))
+
+
+def text_to_packed(text: str) -> bytes:
+    """텍스트를 패킹 바이트로 변환"""
+    return unicode_to_packed(text_to_unicode(text))
+
+
+def serialize_braille(braille: str, fmt: str = 'cells') -> Union[List[List[int]], str]:
+    """
+    점자 유니코드 문자열을 응답 형식으로 직렬화
+
+    Args:
+        braille: 점자 유니코드 문자열
+        fmt: 'cells' | 'packed' | 'unicode'
+
+    Returns:
+        cells: [[0|1 x 6], ...], packed: base64 문자열, unicode: 점자 문자열
+    """
+    if fmt == 'packed':
+        return base64.b64encode(unicode_to_packed(braille)).decode('ascii')
+    if fmt == 'unicode':
+        return braille
+    if fmt == 'cells':
+        return unicode_to_cells(braille)
+    raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+
+
+def deserialize_braille(value, fmt: str = 'cells') -> str:
+    """
+    응답 형식의 점자를 점자 유니코드 문자열로 역직렬화 (serialize_braille의 역)
+
+    Args:
+        value: cells: [[0|1 x 6], ...], packed: base64 문자열, unicode: 점자 문자열
+        fmt: 'cells' | 'packed' | 'unicode'
+
+    Returns:
+        점자 유니코드 문자열
+
+    Raises:
+        ValueError: 형식에 맞지 않는 값
+    """
+    if fmt == 'packed':
+        if not isinstance(value, str):
+            raise ValueError("packed 형식은 base64 문자열이어야 합니다")
+        try:
+            data = base64.b64decode(value, validate=True)
+        except ValueError:
+            raise ValueError("잘못된 base64 문자열입니다")
+        return packed_to_unicode(data)
+    if fmt == 'unicode':
+        if not isinstance(value, str):
+            raise ValueError("unicode 형식은 문자열이어야 합니다")
+        if not _BRAILLE_RE.fullmatch(value):
+            raise ValueError("6점 점자 유니코드(U+2800~U+283F)만 허용됩니다")
+        return value
+    if fmt == 'cells':
+        if not isinstance(value, list) or not all(isinstance(cell, list) and len(cell) == 6 for cell in value):
+            raise ValueError("cells 형식은 [[0|1 x 6], ...] 배열이어야 합니다")
+        return cells_to_unicode(value)
+    raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
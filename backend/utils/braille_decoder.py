@@ -0,0 +1,145 @@
+"""
+점자 역변환 (점자 셀 → 한글 텍스트)
+- 역색인: 셀 마스크 → 후보 자모/문장부호
+- 음절 색인: 레지스트리에 미리 계산된 11,172 음절의 점자 → 음절
+- 어절마다 음절 격자(lattice)를 따라가며 가장 짧은 분해를 선택
+
+ko_braille.json은 여러 자모에 같은 점형을 쓰므로(ㅅ/ㅡ, ㅇ/ㅗ, ㄷ/ㅌ 등)
+한 셀씩 자모를 확정하는 상태 기계로는 풀 수 없고, 음절 경계를 함께 결정해야 함
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from utils import braille_registry
+from utils.braille_converter import BLANK_CELL, BRAILLE_BASE, HANGUL_FIRST, text_to_unicode
+
+# 어절 메모 크기와 메모 대상 최대 길이 (셀 수)
+DECODE_MEMO_SIZE = 8192
+DECODE_MEMO_MAX_CELLS = 64
+
+# 한 셀짜리 조각(문장부호, 낱자모) 비용: 음절 두 개로 분해되는 경우보다 불리하게
+_SINGLE_COST = 2
+
+
+def _single_rank(ch: str) -> Tuple[int, int]:
+    """낱셀 후보 우선순위: 문장부호 > 호환 자모 > 조합형 자모"""
+    code = ord(ch)
+    if 0x3131 <= code <= 0x318E:
+        return (1, code)
+    if 0x1100 <= code <= 0x11FF:
+        return (2, code)
+    return (0, code)
+
+
+class BrailleDecoder:
+    """
+    컴파일된 역변환 테이블
+    - candidates: 셀 마스크(0~63) → 후보 문자 튜플 (우선순위 순)
+    - syllables: 점자 문자열 → 음절 (충돌 시 코드 순서가 앞선 음절)
+    """
+
+    def __init__(self, table: braille_registry.CompiledBrailleTable):
+        candidates: Dict[int, List[str]] = {}
+        for ch, encoded in table.jamo.items():
+            if len(encoded) == 1 and len(ch) == 1:
+                candidates.setdefault(ord(encoded) - BRAILLE_BASE, []).append(ch)
+        self.candidates = tuple(
+            tuple(sorted(candidates.get(mask, ()), key=_single_rank)) for mask in range(64)
+        )
+
+        # 낱셀 기본값: 빈 셀은 공백, 알 수 없는 점형은 점자 문자 그대로
+        singles = {}
+        for mask, chars in enumerate(self.candidates):
+            singles[chr(BRAILLE_BASE + mask)] = chars[0] if chars else chr(BRAILLE_BASE + mask)
+        singles[BLANK_CELL] = ' '
+        self.singles = singles
+
+        syllables: Dict[str, str] = {}
+        for base, encoded in enumerate(table.syllables):
+            if encoded:
+                syllables.setdefault(encoded, chr(HANGUL_FIRST + base))
+        self.syllables = syllables
+        self.max_len = max(map(len, syllables), default=1)
+
+    def decode_word(self, cells: str) -> str:
+        """
+        공백 없는 점자 어절을 텍스트로 역변환
+        음절 색인에 있는 조각은 비용 1, 낱셀은 _SINGLE_COST로 두고 최소 비용 분해를 선택
+        """
+        length = len(cells)
+        if not length:
+            return ''
+        syllables, singles, max_len = self.syllables, self.singles, self.max_len
+        inf = length * _SINGLE_COST + 1
+        best = [inf] * (length + 1)
+        back: List[Optional[Tuple[int, str]]] = [None] * (length + 1)
+        best[0] = 0
+        for i in range(length):
+            cost = best[i]
+            if cost == inf:
+                continue
+            single_cost = cost + _SINGLE_COST
+            if single_cost < best[i + 1]:
+                best[i + 1] = single_cost
+                back[i + 1] = (i, singles[cells[i]])
+            step = cost + 1
+            for end in range(i + 1, min(i + max_len, length) + 1):
+                if step < best[end]:
+                    text = syllables.get(cells[i:end])
+                    if text is not None:
+                        best[end] = step
+                        back[end] = (i, text)
+
+        out = []
+        pos = length
+        while pos:
+            pos, text = back[pos]
+            out.append(text)
+        return ''.join(reversed(out))
+
+
+_DECODER: Optional[BrailleDecoder] = None
+_DECODER_TABLE = None
+
+
+def get_decoder() -> BrailleDecoder:
+    """컴파일된 역변환기 (레지스트리 점자 테이블이 바뀌면 다시 컴파일)"""
+    global _DECODER, _DECODER_TABLE
+    table = braille_registry.get_table()
+    if _DECODER is None or _DECODER_TABLE is not table:
+        _DECODER = BrailleDecoder(table)
+        _DECODER_TABLE = table
+        _memo_decode_word.cache_clear()
+    return _DECODER
+
+
+@lru_cache(maxsize=DECODE_MEMO_SIZE)
+def _memo_decode_word(cells: str) -> str:
+    return _DECODER.decode_word(cells)
+
+
+def unicode_to_text(braille: str) -> str:
+    """
+    점자 유니코드 문자열을 텍스트로 역변환 (약자 없는 풀어 쓴 점자)
+
+    Args:
+        braille: 점자 유니코드 문자열 (빈 셀 U+2800은 공백)
+
+    Returns:
+        역변환한 텍스트 (같은 점형을 쓰는 자모는 코드 순서가 앞선 쪽으로 복원)
+    """
+    decoder = get_decoder()
+    out = []
+    for word in (braille or '').split(BLANK_CELL):
+        if len(word) > DECODE_MEMO_MAX_CELLS:
+            out.append(decoder.decode_word(word))
+        else:
+            out.append(_memo_decode_word(word))
+    return ' '.join(out)
+
+
+def verify_braille(braille: str) -> bool:
+    """
+    점자 문자열 왕복 검증: 역변환한 텍스트를 다시 변환하면 같은 점자가 되는지
+    (같은 점형을 쓰는 자모 때문에 원문 대신 점자끼리 비교)
+    """
+    return text_to_unicode(unicode_to_text(braille)) == braille
@@ -0,0 +1,172 @@
+"""
+증분 점자 변환
+문서를 어절 목록과 어절별 점자로 들고 있다가, 편집이 들어오면 편집 범위에 걸친 어절만 다시 변환하고
+셀 차이(시작 위치, 지운 셀 수, 넣은 셀)를 돌려줌
+어절 목록은 블록으로 나누어 두어 위치 찾기도 문서 길이가 아니라 블록 수에 비례
+(어절끼리 독립적으로 변환되는 한글 기본/약자 변환에만 사용)
+"""
+import unicodedata
+from typing import Callable, List, NamedTuple, Tuple
+from utils.braille_converter import BLANK_CELL, table_version, word_to_unicode
+
+# 블록당 어절 수 (편집 후 두 배를 넘으면 나눔)
+BLOCK_WORDS = 256
+
+
+class CellDiff(NamedTuple):
+    """셀 차이: braille[start:start + deleted]를 inserted로 바꿈"""
+    start: int
+    deleted: int
+    inserted: str
+
+
+class _Block:
+    """어절 묶음 (블록 안 어절 사이와 블록 사이는 공백 하나 = 빈 셀 하나)"""
+
+    __slots__ = ('words', 'cells', 'chars', 'cell_count')
+
+    def __init__(self, words: List[str], cells: List[str]):
+        self.words = words
+        self.cells = cells
+        self.chars = sum(map(len, words)) + len(words) - 1
+        self.cell_count = sum(map(len, cells)) + len(cells) - 1
+
+
+def _word_converter(contracted: bool) -> Callable[[str], str]:
+    """어절 변환 함수 (테이블/규칙 변경을 먼저 확인)"""
+    if contracted:
+        from utils.braille_contraction import contracted_word_to_unicode, get_rules
+        get_rules()
+        return contracted_word_to_unicode
+    table_version()
+    return word_to_unicode
+
+
+def _common_affixes(old: str, new: str) -> Tuple[int, int]:
+    """두 문자열의 공통 접두/접미 길이 (겹치지 않게)"""
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+class IncrementalBraille:
+    """
+    증분 점자 변환 문서
+
+    사용 예:
+        doc = IncrementalBraille("나는 학생이다")
+        diff = doc.edit(3, 3, "착한 ")   # 3번째 문자 위치에 삽입
+        braille = braille[:diff.start] + diff.inserted + braille[diff.start + diff.deleted:]
+    """
+
+    def __init__(self, text: str = '', contracted: bool = False):
+        self.contracted = contracted
+        self._version = None
+        self._blocks: List[_Block] = []
+        self.replace(text)
+
+    def replace(self, text: str) -> CellDiff:
+        """문서 전체를 바꿈 (전체 셀 차이)"""
+        deleted = self.cell_count if self._blocks else 0
+        convert = _word_converter(self.contracted)
+        self._version = self._table_version()
+        words = unicodedata.normalize("NFC", text or '').split(' ')
+        self._blocks = self._make_blocks(words, [convert(word) for word in words])
+        return CellDiff(0, deleted, self.braille)
+
+    def _table_version(self):
+        if self.contracted:
+            from utils.braille_contraction import rules_version
+            return (rules_version(), True)
+        return (table_version(), False)
+
+    @staticmethod
+    def _make_blocks(words: List[str], cells: List[str]) -> List[_Block]:
+        return [
+            _Block(words[i:i + BLOCK_WORDS], cells[i:i + BLOCK_WORDS])
+            for i in range(0, max(len(words), 1), BLOCK_WORDS)
+        ]
+
+    @property
+    def text(self) -> str:
+        return ' '.join(' '.join(block.words) for block in self._blocks)
+
+    @property
+    def braille(self) -> str:
+        return BLANK_CELL.join(BLANK_CELL.join(block.cells) for block in self._blocks)
+
+    def __len__(self) -> int:
+        return sum(block.chars for block in self._blocks) + len(self._blocks) - 1
+
+    @property
+    def cell_count(self) -> int:
+        return sum(block.cell_count for block in self._blocks) + len(self._blocks) - 1
+
+    def _locate(self, position: int) -> Tuple[int, int, int, int]:
+        """
+        문자 위치가 속한 어절 (어절 끝 바로 뒤 공백 위치도 그 어절)
+        Returns:
+            (블록 번호, 블록 안 어절 번호, 어절 시작 문자 위치, 어절 시작 셀 위치)
+        """
+        char_base = cell_base = 0
+        last = len(self._blocks) - 1
+        for index, block in enumerate(self._blocks):
+            if position <= char_base + block.chars or index == last:
+                for word_index, (word, cells) in enumerate(zip(block.words, block.cells)):
+                    if position <= char_base + len(word) or word_index == len(block.words) - 1:
+                        return index, word_index, char_base, cell_base
+                    char_base += len(word) + 1
+                    cell_base += len(cells) + 1
+            char_base += block.chars + 1
+            cell_base += block.cell_count + 1
+        raise IndexError(position)
+
+    def edit(self, start: int, end: int, insert: str = '') -> CellDiff:
+        """
+        text[start:end]를 insert로 바꾸고 셀 차이를 돌려줌
+        편집 범위에 걸친 어절만 다시 변환 (점자 테이블이 바뀌었으면 전체 재변환)
+
+        Raises:
+            IndexError: 0 <= start <= end <= len(text)가 아님
+        """
+        length = len(self)
+        if not 0 <= start <= end <= length:
+            raise IndexError(f"편집 범위는 0 <= start <= end <= {length} 이어야 합니다")
+        if self._table_version() != self._version:
+            text = self.text
+            return self.replace(text[:start] + (insert or '') + text[end:])
+
+        first_block, first_word, seg_start, cell_start = self._locate(start)
+        last_block, last_word, _, _ = self._locate(end)
+
+        # 편집에 걸친 블록들을 어절 목록 하나로 펼침
+        blocks = self._blocks[first_block:last_block + 1]
+        words = [word for block in blocks for word in block.words]
+        cells = [cell for block in blocks for cell in block.cells]
+        last_word += sum(len(block.words) for block in blocks[:-1])
+
+        old_words = words[first_word:last_word + 1]
+        old_cells = BLANK_CELL.join(cells[first_word:last_word + 1])
+        segment = ' '.join(old_words)
+        segment = segment[:start - seg_start] + (insert or '') + segment[end - seg_start:]
+        new_words = unicodedata.normalize("NFC", segment).split(' ')
+        convert = _word_converter(self.contracted)
+        new_cells = [convert(word) for word in new_words]
+
+        words[first_word:last_word + 1] = new_words
+        cells[first_word:last_word + 1] = new_cells
+        self._blocks[first_block:last_block + 1] = self._make_blocks(words, cells)
+
+        # 다시 변환한 어절 안에서도 바뀐 셀만 돌려줌
+        inserted = BLANK_CELL.join(new_cells)
+        prefix, suffix = _common_affixes(old_cells, inserted)
+        return CellDiff(
+            cell_start + prefix,
+            len(old_cells) - prefix - suffix,
+            inserted[prefix:len(inserted) - suffix],
+        )
@@ -0,0 +1,78 @@
+"""
+점자 출력 형식 변환 (.brl 유니코드 / BRF ASCII 점자)
+64개 점형 전체를 비트마스크 연산으로 인코딩하고, 큰 교재는 줄 단위로 스트리밍
+"""
+from typing import IO, Iterable, Iterator
+from utils.braille_converter import BRAILLE_BASE, cells_to_unicode, packed_to_unicode  # noqa: F401
+
+# 북미 ASCII 점자(BRF) 테이블: 인덱스 = 6비트 점 마스크 (점1 = bit0 ... 점6 = bit5)
+BRF_CHARS = " A1B'K2L@CIF/MSP\"E3H9O6R^DJG>NTQ,*5<-U8V.%[$+X!&;:4\\0Z7(_?W]#Y)="
+_UNICODE_TO_BRF = {BRAILLE_BASE + mask: ch for mask, ch in enumerate(BRF_CHARS)}
+
+# 점자 파일 형식: brl(점자 유니코드, UTF-8), brf(ASCII 점자)
+BRAILLE_FILE_FORMATS = ('brl', 'brf')
+
+# BRF 기본 쪽 크기 (한 줄 40칸, 한 쪽 25줄)
+LINE_CELLS = 40
+PAGE_LINES = 25
+
+
+def unicode_to_brf(braille: str) -> str:
+    """점자 유니코드 문자열을 ASCII 점자(BRF) 문자열로 변환"""
+    return braille.translate(_UNICODE_TO_BRF)
+
+
+def packed_to_brf(data: bytes) -> str:
+    """패킹 셀을 ASCII 점자(BRF) 문자열로 변환"""
+    return unicode_to_brf(packed_to_unicode(data))
+
+
+def iter_braille_file(
+    chunks: Iterable[str],
+    file_format: str = 'brl',
+    line_cells: int = LINE_CELLS,
+    page_lines: int = PAGE_LINES,
+) -> Iterator[str]:
+    """
+    점자 유니코드 청크를 파일 줄 단위로 생성 (전체를 메모리에 올리지 않음)
+
+    Args:
+        chunks: 점자 유니코드 문자열 청크 (길이 무관)
+        file_format: 'brl' (유니코드, LF) | 'brf' (ASCII, CRLF, 쪽마다 폼피드)
+        line_cells: 한 줄 셀 수
+        page_lines: 한 쪽 줄 수 (brf)
+
+    Yields:
+        줄바꿈이 포함된 한 줄
+    """
+    if file_format not in BRAILLE_FILE_FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_format}")
+    brf = file_format == 'brf'
+    newline = '\r\n' if brf else '\n'
+
+    line_count = 0
+    pending = ''
+    for chunk in chunks:
+        pending += unicode_to_brf(chunk) if brf else chunk
+        cut = len(pending) - len(pending) % line_cells
+        for start in range(0, cut, line_cells):
+            line_count += 1
+            page_break = brf and line_count % page_lines == 0
+            yield pending[start:start + line_cells] + newline + ('\f' if page_break else '')
+        pending = pending[cut:]
+    if pending:
+        yield pending + newline
+
+
+def write_braille_file(chunks: Iterable[str], out: IO[str], file_format: str = 'brl', **kwargs) -> int:
+    """
+    점자 청크를 파일 객체에 줄 단위로 기록
+
+    Returns:
+        기록한 줄 수
+    """
+    lines = 0
+    for line in iter_braille_file(chunks, file_format, **kwargs):
+        out.write(line)
+        lines += 1
+    return lines
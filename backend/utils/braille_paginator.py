@@ -0,0 +1,140 @@
+"""
+점자 디스플레이 창 나누기
+점자 문자열을 디스플레이 폭(3/20/40셀 등)의 창으로 나누되 가능하면 어절을 자르지 않음
+창 시작/끝 위치 색인을 한 번 계산해 두고 k번째 창을 O(1)로 조회
+"""
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterator, List
+from utils.braille_converter import BLANK_CELL, text_to_unicode
+
+# 자주 쓰는 디스플레이 폭 (3셀 학습 기기, 20/40셀 점자 디스플레이)
+DISPLAY_WIDTHS = (3, 20, 40)
+
+# 저장된 점자의 창 색인 캐시 크기 (단원 × 폭)
+PAGINATOR_CACHE_SIZE = 256
+
+# 요청 한 번에 돌려주는 최대 창 수
+MAX_WINDOWS_PER_REQUEST = 200
+
+
+def parse_window_range(start, count) -> tuple:
+    """요청 값에서 (시작 창 번호, 창 수)를 읽고 검증"""
+    start = int(start) if start not in (None, '') else 0
+    count = int(count) if count not in (None, '') else 1
+    if start < 0:
+        raise ValueError("start는 0 이상이어야 합니다")
+    if not 1 <= count <= MAX_WINDOWS_PER_REQUEST:
+        raise ValueError(f"count는 1~{MAX_WINDOWS_PER_REQUEST} 범위여야 합니다")
+    return start, count
+
+
+class BraillePaginator:
+    """
+    점자 문자열의 디스플레이 창 색인
+    - starts[k], ends[k]: k번째 창의 셀 범위 (창 앞뒤의 빈 셀은 제외)
+    - 어절(빈 셀로 구분)이 창에 다 들어가면 자르지 않고 다음 창으로 넘기고,
+      창보다 긴 어절만 폭 단위로 나눔
+    """
+
+    __slots__ = ('braille', 'width', 'starts', 'ends')
+
+    def __init__(self, braille: str, width: int):
+        if width < 1:
+            raise ValueError("width는 1 이상이어야 합니다")
+        self.braille = braille
+        self.width = width
+        self.starts = array('L')
+        self.ends = array('L')
+        self._build()
+
+    def _build(self) -> None:
+        braille, width = self.braille, self.width
+        length = len(braille)
+        pos = 0
+        while True:
+            # 창 앞의 빈 셀 건너뛰기
+            while pos < length and braille[pos] == BLANK_CELL:
+                pos += 1
+            if pos >= length:
+                break
+            end = pos + width
+            if end < length and braille[end] != BLANK_CELL:
+                # 창 끝이 어절 중간이면 창 안의 마지막 어절 경계에서 자름 (경계가 없으면 폭에서 자름)
+                cut = braille.rfind(BLANK_CELL, pos + 1, end)
+                if cut > pos:
+                    end = cut
+            end = min(end, length)
+            while braille[end - 1] == BLANK_CELL:
+                end -= 1
+            self.starts.append(pos)
+            self.ends.append(end)
+            pos = end
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def window(self, index: int) -> str:
+        """k번째 창의 점자 (음수는 뒤에서부터)"""
+        return self.braille[self.starts[index]:self.ends[index]]
+
+    def windows(self, start: int = 0, count: int = None) -> Iterator[str]:
+        """start번째 창부터 count개 (None이면 끝까지)"""
+        stop = len(self) if count is None else min(len(self), start + count)
+        for index in range(start, stop):
+            yield self.window(index)
+
+    def window_at(self, offset: int) -> int:
+        """셀 위치 offset이 들어 있는(또는 바로 앞의) 창 번호"""
+        return max(0, bisect_right(self.starts, offset) - 1)
+
+
+def paginate_text(text: str, width: int) -> BraillePaginator:
+    """텍스트를 점자로 변환해 창 색인 생성"""
+    return BraillePaginator(text_to_unicode(text), width)
+
+
+_CACHE: 'OrderedDict[Hashable, BraillePaginator]' = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def cached_paginator(key: Hashable, width: int, load: Callable[[], str]) -> BraillePaginator:
+    """
+    저장된 점자의 창 색인 (key와 폭별로 캐시, 없을 때만 load()로 점자를 읽어 색인 생성)
+    key에는 변환 시각 등 점자가 바뀌면 달라지는 값을 포함해야 함
+    """
+    cache_key = (key, width)
+    with _CACHE_LOCK:
+        paginator = _CACHE.get(cache_key)
+        if paginator is not None:
+            _CACHE.move_to_end(cache_key)
+            return paginator
+
+    paginator = BraillePaginator(load(), width)
+    with _CACHE_LOCK:
+        _CACHE[cache_key] = paginator
+        while len(_CACHE) > PAGINATOR_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return paginator
+
+
+def clear_paginator_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def window_frames(paginator: BraillePaginator, start: int, count: int, serialize: Callable[[str], object]) -> List[Dict]:
+    """창 응답 프레임 [{index, offset, length, cells}] (스트리밍 청크와 같은 필드)"""
+    frames = []
+    stop = min(len(paginator), start + count)
+    for index in range(start, stop):
+        offset = paginator.starts[index]
+        frames.append({
+            'index': index,
+            'offset': offset,
+            'length': paginator.ends[index] - offset,
+            'cells': serialize(paginator.window(index)),
+        })
+    return frames
@@ -0,0 +1,283 @@
+"""
+프로세스 풀 병렬 점자 변환 (교재 전체 재변환용)
+텍스트를 문장 경계에서 조각으로 나누어 워커 프로세스에서 변환한 뒤 순서대로 다시 합침
+한글 외 인코더는 어절/수식/로마자 구간 상태가 끊기지 않는 위치에서만 자름 (cut_points)
+워커는 시작할 때 점자 테이블을 미리 컴파일해 둠
+"""
+import os
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+from django.conf import settings
+from utils.braille_converter import ALIGNMENT_TYPECODE, pack_alignment, unicode_to_packed, unpack_alignment
+from utils.braille_vectorized import bulk_text_alignment, bulk_text_to_packed
+
+# 조각 나눌 때 우선하는 경계 (문장 끝 → 줄바꿈 → 공백)
+_SENTENCE_ENDS = ('. ', '? ', '! ', '\n')
+
+# 문장 끝 문자 (cut_points로 자를 때 이 문자 + 공백 뒤를 우선)
+_SENTENCE_MARKS = '.?!'
+
+# 혼합 텍스트 인코더 → 수식 구간 변환 여부
+_MIXED_ENCODERS = {'mixed': False, 'mixed_math': True}
+
+
+def default_workers() -> int:
+    """설정된 워커 수 (BRAILLE_CONVERT_WORKERS, 0이면 CPU 수)"""
+    workers = getattr(settings, 'BRAILLE_CONVERT_WORKERS', 0)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def default_chunk_chars() -> int:
+    """설정된 조각 크기 (BRAILLE_CONVERT_CHUNK_CHARS, 문자 수)"""
+    return getattr(settings, 'BRAILLE_CONVERT_CHUNK_CHARS', 200000)
+
+
+def cut_points(text: str, encoder: str = 'text') -> Optional[List[int]]:
+    """
+    조각마다 따로 변환해도 한 번에 변환한 것과 같은 점자/정렬이 나오는 자르는 위치 (오름차순)
+    text는 문자 단위라 어디서 잘라도 같으므로 None, 나머지는 공백 바로 뒤 위치 중
+    - english: 모든 공백 (낱말 단위 변환)
+    - math: 묶음({…}, (…), […]) 밖 공백
+    - mixed: 로마자 구간이 다음 어절로 이어지지 않는 공백, mixed_math는 수식 구간 밖만
+    """
+    if encoder == 'text':
+        return None
+    if encoder == 'math':
+        from utils.math_braille import split_words
+        words = split_words(text)
+    else:
+        words = text.split(' ')
+
+    if encoder in _MIXED_ENCODERS:
+        from utils.mixed_braille import roman_continues
+        keep = [not roman_continues(word, following) for word, following in zip(words, words[1:])]
+    else:
+        keep = [True] * (len(words) - 1)
+
+    points, position = [], 0
+    for word, ok in zip(words, keep):
+        position += len(word) + 1
+        if ok:
+            points.append(position)
+
+    if _MIXED_ENCODERS.get(encoder):
+        from utils.content_extractor import iter_formulas
+        formulas = iter_formulas(text)
+        formula = next(formulas, None)
+        kept = []
+        for point in points:
+            while formula is not None and formula.end <= point:
+                formula = next(formulas, None)
+            if formula is None or point <= formula.start:
+                kept.append(point)
+        points = kept
+    return points
+
+
+def _split_at_points(text: str, chunk_chars: int, points: List[int]) -> Iterator[str]:
+    """자르는 위치 points에서만 chunk_chars 안팎으로 나눔 (문장 끝 뒤 위치 우선, 없으면 조각이 길어짐)"""
+    start, length = 0, len(text)
+    while start < length:
+        end = start + chunk_chars
+        if end >= length:
+            yield text[start:]
+            return
+        first = bisect_right(points, start)
+        last = bisect_right(points, end)
+        window = bisect_right(points, start + chunk_chars // 2)
+        cut = None
+        for index in range(last - 1, max(first, window) - 1, -1):
+            if points[index] >= 2 and text[points[index] - 2] in _SENTENCE_MARKS:
+                cut = points[index]
+                break
+        if cut is None:
+            if last > first:
+                cut = points[last - 1]
+            elif last < len(points):
+                cut = points[last]
+            else:
+                cut = length
+        yield text[start:cut]
+        start = cut
+
+
+def split_text(text: str, chunk_chars: int, points: Optional[List[int]] = None) -> Iterator[str]:
+    """
+    텍스트를 chunk_chars 안팎의 조각으로 나눔
+    문장 끝, 줄바꿈, 공백 순으로 경계를 찾고 (조각을 이어 붙이면 원문)
+    points: 자를 수 있는 위치 (cut_points 결과, 주면 이 위치에서만 자름)
+    """
+    if points is not None:
+        yield from _split_at_points(text, chunk_chars, points)
+        return
+    start, length = 0, len(text)
+    while start < length:
+        end = min(start + chunk_chars, length)
+        if end < length:
+            # 조각 뒤쪽 절반에서 가장 늦은 문장 끝을 찾고, 없으면 공백에서 자름
+            window_start = start + chunk_chars // 2
+            cut = -1
+            for mark in _SENTENCE_ENDS:
+                pos = text.rfind(mark, window_start, end)
+                if pos >= 0:
+                    cut = max(cut, pos + len(mark))
+            if cut > start:
+                end = cut
+            else:
+                space = text.rfind(' ', start, end)
+                if space > start:
+                    end = space + 1
+        yield text[start:end]
+        start = end
+
+
+def _init_worker(settings_module: str) -> None:
+    """워커 프로세스 초기화: Django 설정 후 점자 테이블 미리 컴파일"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    import django
+    django.setup()
+    from utils import braille_registry
+    braille_registry.compile_table()
+
+
+def encode_packed(text: str, encoder: str = 'text') -> bytes:
+    """
+    인코더 이름으로 텍스트를 패킹 셀로 변환
+    text: 한글 점자 (벡터화 대량 변환), math: 수식 점자, english: 영어 점자 (UEB 2종),
+    mixed: 한글 바탕 혼합 텍스트 (숫자/로마자 구간별 변환), mixed_math: mixed + 수식 구간은 수식 점자
+    (mixed 계열도 로마자/숫자가 없으면 벡터화 대량 변환)
+    """
+    if encoder in _MIXED_ENCODERS:
+        from utils.mixed_braille import mixed_to_unicode
+        from utils.script_segmenter import needs_dispatch
+        if not needs_dispatch(text):
+            return bulk_text_to_packed(text)
+        return unicode_to_packed(mixed_to_unicode(text, formulas=_MIXED_ENCODERS[encoder]))
+    if encoder == 'math':
+        from utils.math_braille import math_to_unicode
+        return unicode_to_packed(math_to_unicode(text))
+    if encoder == 'english':
+        from utils.english_braille import english_to_unicode
+        return unicode_to_packed(english_to_unicode(text))
+    if encoder == 'text':
+        return bulk_text_to_packed(text)
+    raise ValueError(f"지원하지 않는 인코더입니다: {encoder}")
+
+
+def encode_alignment(text: str, encoder: str = 'text') -> bytes:
+    """
+    인코더 이름으로 텍스트의 원문-셀 정렬 배열을 계산 (pack_alignment 형식 바이트)
+    """
+    if encoder in _MIXED_ENCODERS:
+        from utils.mixed_braille import mixed_alignment
+        from utils.script_segmenter import needs_dispatch
+        if not needs_dispatch(text):
+            return bulk_text_alignment(text)
+        return pack_alignment(mixed_alignment(text, formulas=_MIXED_ENCODERS[encoder]))
+    if encoder == 'math':
+        from utils.math_braille import math_alignment
+        return pack_alignment(math_alignment(text))
+    if encoder == 'english':
+        from utils.english_braille import english_alignment
+        return pack_alignment(english_alignment(text))
+    if encoder == 'text':
+        return bulk_text_alignment(text)
+    raise ValueError(f"지원하지 않는 인코더입니다: {encoder}")
+
+
+def _convert_piece(piece: Tuple[int, str, str, bool]) -> Tuple[int, bytes, Optional[bytes]]:
+    index, encoder, text, aligned = piece
+    return index, encode_packed(text, encoder), encode_alignment(text, encoder) if aligned else None
+
+
+def _join_alignments(parts: List[Tuple[int, bytes]]) -> bytes:
+    """조각별 (셀 수, 정렬 바이트)를 이어 붙인 텍스트의 정렬 바이트로 합침"""
+    joined = array(ALIGNMENT_TYPECODE, [0])
+    shift = 0
+    for cells, data in parts:
+        offsets = unpack_alignment(data)
+        joined.pop()
+        joined.extend([offset + shift for offset in offsets])
+        shift += cells
+    return pack_alignment(joined)
+
+
+class ParallelBrailleConverter:
+    """
+    텍스트 여러 개를 프로세스 풀에서 패킹 셀로 변환
+
+    사용 예:
+        with ParallelBrailleConverter(workers=4) as converter:
+            packed_list = converter.convert_texts(texts)
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_chars: Optional[int] = None):
+        self.workers = workers if workers and workers > 0 else default_workers()
+        self.chunk_chars = chunk_chars if chunk_chars and chunk_chars > 0 else default_chunk_chars()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(os.environ.get('DJANGO_SETTINGS_MODULE', 'jeomgeuli_backend.settings'),),
+            )
+        return self._executor
+
+    def convert_texts(self, texts: Sequence[str], encoders: Optional[Sequence[str]] = None) -> List[bytes]:
+        """
+        텍스트별 패킹 셀 리스트 (입력 순서 유지)
+        encoders: 텍스트별 인코더 이름 (기본 'text', encode_packed 참고)
+        전체가 조각 하나 크기 이하이거나 워커가 1개면 프로세스 풀 없이 변환
+        """
+        return [packed for packed, _ in self._convert(texts, encoders, aligned=False)]
+
+    def convert_texts_aligned(
+        self, texts: Sequence[str], encoders: Optional[Sequence[str]] = None,
+    ) -> List[Tuple[bytes, bytes]]:
+        """
+        텍스트별 (패킹 셀, 정렬 바이트) 리스트
+        정렬 배열도 워커에서 조각별로 계산한 뒤 셀 위치를 옮겨 이어 붙임
+        """
+        return self._convert(texts, encoders, aligned=True)
+
+    def _convert(self, texts: Sequence[str], encoders: Optional[Sequence[str]], aligned: bool):
+        pieces, owners = [], []
+        for owner, text in enumerate(texts):
+            encoder = encoders[owner] if encoders else 'text'
+            text = text or ''
+            points = cut_points(text, encoder) if len(text) > self.chunk_chars else None
+            for piece in split_text(text, self.chunk_chars, points):
+                pieces.append((len(pieces), encoder, piece, aligned))
+                owners.append(owner)
+
+        if self.workers <= 1 or len(pieces) <= 1:
+            results = map(_convert_piece, pieces)
+        else:
+            chunksize = max(1, len(pieces) // (self.workers * 4))
+            results = self._get_executor().map(_convert_piece, pieces, chunksize=chunksize)
+
+        packed = [bytearray() for _ in texts]
+        alignments = [[] for _ in texts]
+        for index, data, alignment in results:
+            packed[owners[index]] += data
+            if aligned:
+                alignments[owners[index]].append((len(data), alignment))
+        return [
+            (bytes(data), _join_alignments(parts) if aligned else None)
+            for data, parts in zip(packed, alignments)
+        ]
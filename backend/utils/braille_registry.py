@@ -0,0 +1,178 @@
+"""
+점자 테이블 레지스트리
+ko_braille.json을 프로세스당 한 번(BrailleConfig.ready) 컴파일해 불변 조회 테이블로 공유
+apps.braille / apps.exam / 레거시 /api/api/ 경로가 모두 같은 테이블을 사용
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+from django.conf import settings
+
+DATA_DIR = Path(settings.BASE_DIR) / "data"
+TABLE_FILE = "ko_braille.json"
+
+# 점자 유니코드 블록 (U+2800 ~ U+283F, 6점 점자)
+BRAILLE_BASE = 0x2800
+BLANK_CELL = chr(BRAILLE_BASE)
+
+# 한글 음절 분해용 자모 테이블 (유니코드 순서)
+CHOSEONG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+JUNGSEONG = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 겹받침은 두 자음으로 나누어 적음
+DOUBLE_FINALS = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+
+HANGUL_FIRST = 0xAC00
+HANGUL_COUNT = 11172
+
+# 일괄 변환 시 텍스트 구분자 (일괄 변환 테이블에서 자기 자신으로 매핑)
+BATCH_SEPARATOR = '\x1f'
+
+# ko_braille.json 변경 확인 주기 (초)
+TABLE_CHECK_INTERVAL = 2.0
+
+
+class _TranslateTable(dict):
+    """str.translate용 변환 테이블 (매핑 없는 문자는 빈 셀)"""
+
+    def __missing__(self, key):
+        return BLANK_CELL
+
+
+def _dots_to_unicode(arr) -> str:
+    """[0|1 x 6] 또는 [0|1 x 12] 점 배열을 점자 유니코드 문자열로 변환"""
+    if not isinstance(arr, (list, tuple)) or len(arr) not in (6, 12):
+        return ''
+
+    out = []
+    for offset in range(0, len(arr), 6):
+        mask = 0
+        for i, dot in enumerate(arr[offset:offset + 6]):
+            if int(dot):
+                mask |= 1 << i
+        out.append(chr(BRAILLE_BASE + mask))
+    return ''.join(out)
+
+
+class CompiledBrailleTable:
+    """
+    컴파일된 점자 테이블 (불변)
+    - source: 문자 → 점 배열 튜플 (ko_braille.json 원본)
+    - jamo: 자모/문장부호 → 점자 유니코드 문자열
+    - syllables: 한글 음절 11,172자의 점자 (코드 - HANGUL_FIRST 인덱스 튜플)
+    - translate / batch_translate: str.translate용 읽기 전용 테이블
+    """
+
+    __slots__ = ('version', 'source', 'jamo', 'syllables', 'translate', 'batch_translate', 'space')
+
+    def __init__(self, braille_map: Mapping, version: Optional[Tuple[int, int]] = None):
+        table = _TranslateTable()
+
+        # ASCII 범위는 미리 빈 셀로 채워 __missing__ 호출을 피함
+        for code in range(128):
+            table[code] = BLANK_CELL
+
+        source, jamo = {}, {}
+        for ch, arr in braille_map.items():
+            encoded = _dots_to_unicode(arr)
+            if encoded and len(ch) == 1:
+                source[ch] = tuple(int(dot) for dot in arr)
+                table[ord(ch)] = encoded
+                jamo[ch] = encoded
+
+        for final, pair in DOUBLE_FINALS.items():
+            jamo.setdefault(final, ''.join(jamo.get(c, '') for c in pair))
+
+        syllables = []
+        for base in range(HANGUL_COUNT):
+            code = HANGUL_FIRST + base
+            if code not in table:
+                initial = CHOSEONG[base // (21 * 28)]
+                medial = JUNGSEONG[(base % (21 * 28)) // 28]
+                final = JONGSEONG[base % 28]
+                table[code] = jamo.get(initial, '') + jamo.get(medial, '') + jamo.get(final, '')
+            syllables.append(table[code])
+
+        batch_table = _TranslateTable(table)
+        batch_table[ord(BATCH_SEPARATOR)] = BATCH_SEPARATOR
+
+        self.version = version
+        self.source = MappingProxyType(source)
+        self.jamo = MappingProxyType(jamo)
+        self.syllables = tuple(syllables)
+        self.translate = MappingProxyType(table)
+        self.batch_translate = MappingProxyType(batch_table)
+        self.space = table[ord(' ')]
+
+    def char(self, ch: str) -> str:
+        """문자 하나의 기본 점자 유니코드 문자열 (없으면 빈 셀)"""
+        return self.translate[ord(ch)]
+
+    def syllable(self, ch: str) -> Optional[str]:
+        """한글 음절 하나의 점자 (음절이 아니면 None)"""
+        base = ord(ch) - HANGUL_FIRST
+        if 0 <= base < HANGUL_COUNT:
+            return self.syllables[base]
+        return None
+
+
+def table_file_version() -> Optional[Tuple[int, int]]:
+    """ko_braille.json 버전 (수정 시각, 크기)"""
+    try:
+        stat = (DATA_DIR / TABLE_FILE).stat()
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def _read_table_file() -> Dict:
+    try:
+        with open(DATA_DIR / TABLE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+_TABLE: Optional[CompiledBrailleTable] = None
+_lock = threading.Lock()
+_last_check = 0.0
+
+
+def compile_table() -> CompiledBrailleTable:
+    """ko_braille.json을 읽어 테이블을 다시 컴파일하고 등록"""
+    global _TABLE, _last_check
+    with _lock:
+        version = table_file_version()
+        _TABLE = CompiledBrailleTable(_read_table_file(), version)
+        _last_check = time.monotonic()
+        return _TABLE
+
+
+def get_table() -> CompiledBrailleTable:
+    """
+    현재 등록된 점자 테이블
+    앱 시작 시 컴파일된 테이블을 반환하고, TABLE_CHECK_INTERVAL마다 파일 변경을 확인해 재컴파일
+    """
+    global _last_check
+    table = _TABLE
+    if table is None:
+        return compile_table()
+    now = time.monotonic()
+    if now - _last_check >= TABLE_CHECK_INTERVAL:
+        _last_check = now
+        if table_file_version() != table.version:
+            return compile_table()
+    return table
+
+
+def invalidate() -> None:
+    """다음 get_table() 호출에서 파일 버전을 다시 확인하도록 표시"""
+    global _last_check
+    _last_check = 0.0
@@ -0,0 +1,120 @@
+"""
+NumPy 벡터화 점자 변환 (교재 단위 대량 변환용)
+코드포인트 배열을 미리 계산한 조회 배열에 통과시켜 문자별 파이썬 루프 없이 변환
+NumPy가 없으면 utils.braille_converter의 순수 파이썬 경로를 사용
+"""
+import unicodedata
+from typing import Optional
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from utils import braille_registry
+from utils.braille_converter import BRAILLE_BASE, pack_alignment, text_alignment, text_to_packed
+
+# 조회 배열이 다루는 코드포인트 범위 (BMP), 그 밖의 문자는 마지막 칸(빈 셀)으로 모음
+_CODEPOINT_LIMIT = 0x10000
+
+
+class VectorizedTable:
+    """
+    레지스트리 테이블을 배열로 펼친 조회 테이블
+    - lengths[cp]: 문자 cp의 셀 수
+    - offsets[cp]: masks 안에서 문자 cp의 셀 시작 위치
+    - masks: 모든 문자의 셀 마스크를 이어 붙인 배열 (masks[0]은 빈 셀)
+    - dots: 마스크(0~63) → (6,) 점 배열
+    """
+
+    def __init__(self, table: braille_registry.CompiledBrailleTable):
+        lengths = np.ones(_CODEPOINT_LIMIT + 1, dtype=np.uint8)
+        offsets = np.zeros(_CODEPOINT_LIMIT + 1, dtype=np.intp)
+        flat = [braille_registry.BLANK_CELL]
+        position = 1
+        for code, encoded in table.translate.items():
+            if code >= _CODEPOINT_LIMIT:
+                continue
+            lengths[code] = len(encoded)
+            offsets[code] = position
+            flat.append(encoded)
+            position += len(encoded)
+
+        self.table = table
+        self.lengths = lengths
+        self.offsets = offsets
+        self.masks = (np.frombuffer(''.join(flat).encode('utf-32-le'), dtype=np.uint32) - BRAILLE_BASE).astype(np.uint8)
+        self.dots = ((np.arange(64, dtype=np.uint8)[:, None] >> np.arange(6, dtype=np.uint8)) & 1).astype(np.uint8)
+
+    def packed(self, text: str) -> 'np.ndarray':
+        """정규화된 텍스트 → 셀 마스크 uint8 벡터"""
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        if not codes.size:
+            return np.zeros(0, dtype=np.uint8)
+        codes = np.minimum(codes, _CODEPOINT_LIMIT)
+        lengths = self.lengths[codes]
+        offsets = self.offsets[codes]
+
+        # 문자마다 셀 lengths[i]개를 masks[offsets[i]:]에서 가져오는 인덱스
+        total = int(lengths.sum(dtype=np.int64))
+        ends = np.cumsum(lengths, dtype=np.intp)
+        shift = np.repeat(offsets - (ends - lengths), lengths)
+        index = np.arange(total, dtype=np.intp) + shift
+        return self.masks[index]
+
+
+_VECTOR_TABLE: Optional['VectorizedTable'] = None
+
+
+def get_vector_table() -> 'VectorizedTable':
+    """레지스트리 테이블에 맞춘 조회 배열 (테이블이 바뀌면 다시 생성)"""
+    global _VECTOR_TABLE
+    table = braille_registry.get_table()
+    if _VECTOR_TABLE is None or _VECTOR_TABLE.table is not table:
+        _VECTOR_TABLE = VectorizedTable(table)
+    return _VECTOR_TABLE
+
+
+def text_to_packed_array(text: str) -> 'np.ndarray':
+    """
+    텍스트를 셀 마스크 uint8 벡터로 변환 (셀당 1원소, 하위 6비트가 점 마스크)
+    text_to_packed와 같은 결과를 ndarray로 반환
+    """
+    normalized = unicodedata.normalize("NFC", text or "")
+    return get_vector_table().packed(normalized)
+
+
+def text_to_cell_array(text: str) -> 'np.ndarray':
+    """텍스트를 (N, 6) uint8 점 배열로 변환"""
+    return get_vector_table().dots[text_to_packed_array(text)]
+
+
+def text_alignment_array(text: str) -> 'np.ndarray':
+    """
+    텍스트 → 원문-셀 정렬 uint32 벡터 (text_alignment와 같은 값)
+    문자별 셀 수 조회 배열의 누적합
+    """
+    normalized = unicodedata.normalize("NFC", text or "")
+    codes = np.minimum(np.frombuffer(normalized.encode('utf-32-le'), dtype=np.uint32), _CODEPOINT_LIMIT)
+    offsets = np.zeros(codes.size + 1, dtype='<u4')
+    np.cumsum(get_vector_table().lengths[codes], dtype=np.uint32, out=offsets[1:])
+    return offsets
+
+
+def bulk_text_alignment(text: str) -> bytes:
+    """
+    대량 텍스트 → 저장용 정렬 바이트 (pack_alignment 형식)
+    NumPy가 있으면 벡터화 경로, 없으면 순수 파이썬 경로
+    """
+    if NUMPY_AVAILABLE:
+        return text_alignment_array(text).tobytes()
+    return pack_alignment(text_alignment(text))
+
+
+def bulk_text_to_packed(text: str) -> bytes:
+    """
+    대량 텍스트 → 패킹 셀 (NumPy가 있으면 벡터화 경로, 없으면 순수 파이썬 경로)
+    """
+    if NUMPY_AVAILABLE:
+        return text_to_packed_array(text).tobytes()
+    return text_to_packed(text)
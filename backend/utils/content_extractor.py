@@ -3,47 +3,164 @@
 수식, 키워드, 핵심 문장 등을 추출
 """
 import re
-from typing import List
+from typing import Iterator, List, NamedTuple, Tuple
+
+
+class FormulaSpan(NamedTuple):
+    """텍스트 안의 수식 (원문, 시작/끝 위치)"""
+    text: str
+    start: int
+    end: int
+
+
+# 수식 원자: LaTeX 명령, 수, 1~2글자 로마자(변수), 연산/관계/집합 기호, 위/아래 첨자, 괄호
+_FORMULA_ATOM = (
+    r'(?:\\[A-Za-z]+'
+    r'|\d+(?:[.,]\d+)*'
+    r'|(?<![A-Za-z])[A-Za-z]{1,2}(?![A-Za-z])'
+    r'|(?:sin|cos|tan|sec|csc|cot|log|ln|lim|exp|max|min)(?![A-Za-z])'
+    r'|[+\-−*/=<>^_|!%°·×÷±∓≤≥≠≈∫∬∮∑∏√∛∜∞∂∆ΔΣΠΩα-ω→∈∪∩⊂∠⊥∴∵'
+    r'²³¹⁴⁵⁶⁷⁸⁹⁰⁺⁻⁼⁽⁾ⁿⁱ₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎'
+    r'(){}\[\]])'
+)
+
+# 원자들이 공백(줄바꿈 제외)으로만 이어진 구간을 한 번의 스캔으로 찾음
+_FORMULA_RUN_RE = re.compile(_FORMULA_ATOM + r'(?:[ \t]*' + _FORMULA_ATOM + r')*')
+
+# 구간이 수식이려면 연산/관계 기호, 첨자, LaTeX 명령 중 하나가 있어야 함 (괄호나 낱글자만으로는 수식 아님)
+_FORMULA_TRIGGER_RE = re.compile(
+    r'[+\-−*/=<>^_×÷±∓≤≥≠≈∫∬∮∑∏√∛∜∞∂'
+    r'²³¹⁴⁵⁶⁷⁸⁹⁰⁺⁻⁼⁽⁾ⁿⁱ₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎]|\\[A-Za-z]'
+)
+
+
+# 구간 앞뒤에 붙은 두 글자 영어 낱말 (변수 곱 xy 등과 구분하기 위해 흔한 낱말만)
+_EDGE_WORD_RE = re.compile(r'(?:is|of|in|to|be|as|at|by|if|or|on|an|so|we|it)', re.IGNORECASE)
+
+
+def _trim_edge_words(text: str, start: int, end: int):
+    """수식 구간 앞뒤의 두 글자 낱말을 떼어낸 (start, end)"""
+    while True:
+        gap = start + 2
+        while gap < end and text[gap] in ' \t':
+            gap += 1
+        if gap == start + 2 or gap >= end or not _EDGE_WORD_RE.fullmatch(text, start, start + 2):
+            break
+        start = gap
+    while True:
+        gap = end - 2
+        while gap > start and text[gap - 1] in ' \t':
+            gap -= 1
+        if gap == end - 2 or gap <= start or not _EDGE_WORD_RE.fullmatch(text, end - 2, end):
+            break
+        end = gap
+    return start, end
+
+
+def _is_prose_compound(word: str) -> bool:
+    """하이픈 말고는 연산 기호가 없는 낱말 (A-B, 3-4, COVID-19의 -19 등)"""
+    return '-' in word and not _FORMULA_TRIGGER_RE.search(word.replace('-', ''))
+
+
+def _trim_prose_compounds(text: str, start: int, end: int):
+    """
+    수식 구간 앞뒤 끝 낱말이 글자에 바로 붙은 하이픈 합성어이면 떼어낸 (start, end)
+    예: "A-B형", "노-사", "COVID-19" - 수식 원자로는 읽히지만 수식이 아닌 산문
+    """
+    if start > 0 and text[start - 1].isalpha():
+        gap = start
+        while gap < end and text[gap] not in ' \t':
+            gap += 1
+        if _is_prose_compound(text[start:gap]):
+            start = gap
+            while start < end and text[start] in ' \t':
+                start += 1
+    if start < end and end < len(text) and text[end].isalpha():
+        gap = end
+        while gap > start and text[gap - 1] not in ' \t':
+            gap -= 1
+        if _is_prose_compound(text[gap:end]):
+            end = gap
+            while end > start and text[end - 1] in ' \t':
+                end -= 1
+    return start, end
+
+
+def iter_formulas(text: str) -> Iterator[FormulaSpan]:
+    """
+    텍스트의 모든 수식을 앞에서부터 차례로 찾음 (텍스트 길이에 선형)
+
+    Yields:
+        FormulaSpan(수식, 시작 위치, 끝 위치) - text[start:end] == 수식
+    """
+    if not text:
+        return
+    for match in _FORMULA_RUN_RE.finditer(text):
+        if not _FORMULA_TRIGGER_RE.search(match.group()):
+            continue
+        start, end = _trim_prose_compounds(text, match.start(), match.end())
+        if start >= end or not _FORMULA_TRIGGER_RE.search(text, start, end):
+            continue
+        start, end = _trim_edge_words(text, start, end)
+        yield FormulaSpan(text[start:end], start, end)
+
+
+def find_formulas(text: str) -> List[FormulaSpan]:
+    """
+    텍스트의 모든 수식과 위치
+    예: "x² + 2x + 1 = 0 이고 y = 3 이다" → [("x² + 2x + 1 = 0", 0, 15), ("y = 3", 19, 24)]
+    """
+    return list(iter_formulas(text))
 
 
 def extract_formula(text: str) -> str:
     """
-    수식 추출 (예: "x² + 2x + 1 = 0")
+    첫 번째 수식 추출 (예: "x² + 2x + 1 = 0"), 없으면 빈 문자열
+    """
+    span = next(iter_formulas(text), None)
+    return span.text if span else ''
+
+
+# 문장 구분: 마침표, 느낌표, 물음표 + 공백
+_SENTENCE_BREAK_RE = re.compile(r'[.!?]\s+')
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    문장 위치 목록 [(start, end), ...] (split_sentences와 같은 문장, 앞뒤 공백 제외)
     """
     if not text:
-        return ''
-    
-    # 수식 패턴: 변수, 지수, 연산자, 등호 등
-    formula_pattern = r'[a-zA-Z]\s*[²³⁴⁵⁶⁷⁸⁹⁰⁺⁻⁼⁽⁾∫∑∏√∞±×÷≤≥≠≈]|[\+\-\*\/\=\<\>\(\)\^]|\\[a-zA-Z]+'
+        return []
     
-    match = re.search(formula_pattern, text)
-    if match:
-        # 수식 부분만 추출
-        formula_start = match.start()
-        # 수식이 끝나는 지점 찾기 (공백, 문장부호 등)
-        formula_end = formula_start
-        for i in range(formula_start, len(text)):
-            char = text[i]
-            if re.match(r'[.!?]', char) or (re.match(r'\s', char) and i > formula_start + 10):
-                formula_end = i
-                break
-        if formula_end == formula_start:
-            formula_end = min(formula_start + 50, len(text))
-        return text[formula_start:formula_end].strip()
+    spans = []
+    start = 0
+    for match in _SENTENCE_BREAK_RE.finditer(text):
+        spans.append((start, match.start()))
+        start = match.end()
+    spans.append((start, len(text)))
     
-    return ''
+    stripped = []
+    for start, end in spans:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            stripped.append((start, end))
+    return stripped
+
+
+def word_spans(text: str) -> List[Tuple[int, int]]:
+    """어절(공백으로 구분) 위치 목록 [(start, end), ...]"""
+    return [match.span() for match in re.finditer(r'\S+', text or '')]
 
 
 def split_sentences(text: str) -> List[str]:
     """
     텍스트를 문장 단위로 분할
     """
-    if not text:
-        return []
-    
     # 문장 분리 (마침표, 느낌표, 물음표 기준)
-    sentences = re.split(r'[.!?]\s+', text)
-    return [s.strip() for s in sentences if s.strip()]
+    return [text[start:end] for start, end in sentence_spans(text)]
 
 
 def extract_keywords(text: str, max_count: int = 3) -> List[str]:
@@ -79,11 +196,6 @@ def extract_keywords(text: str, max_count: int = 3) -> List[str]:
 
 def contains_formula(text: str) -> bool:
     """
-    수식이 포함된 텍스트인지 확인
+    수식이 포함된 텍스트인지 확인 (첫 수식을 찾으면 바로 종료)
     """
-    if not text:
-        return False
-    
-    formula_pattern = r'[a-zA-Z]\s*[²³⁴⁵⁶⁷⁸⁹⁰⁺⁻⁼⁽⁾∫∑∏√∞±×÷≤≥≠≈]|[\+\-\*\/\=\<\>\(\)\^]|\\[a-zA-Z]+'
-    return bool(re.search(formula_pattern, text))
-
+    return next(iter_formulas(text), None) is not None
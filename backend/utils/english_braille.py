@@ -0,0 +1,217 @@
+"""
+영어 점자 변환 (UEB 1종/2종)
+data/english_braille.json의 약자 규칙으로 트라이를 미리 만들어 두고
+낱말마다 대문자/숫자 표시 상태를 따라가며 최장 일치로 약자를 적용
+한글 구간은 한글 점자 테이블로 변환 (구간 나누기는 utils.script_segmenter)
+"""
+import re
+import unicodedata
+from array import array
+from functools import lru_cache, partial
+from typing import Dict, Optional
+from utils.data_loader import load_json
+from utils.braille_converter import (
+    BLANK_CELL, WORD_MEMO_SIZE, WORD_MEMO_MAX_CHARS, dot_numbers_to_unicode, table_version, text_to_unicode,
+    word_alignment,
+)
+from utils.script_segmenter import HANGUL, LATIN, NUMBER, PUNCT, attach_punct, group_runs, segment
+
+# 트라이 노드에서 규칙 끝을 나타내는 키
+_END = ''
+
+# 2종에서 홀로 쓰면 낱말 기호로 읽히는 글자 (a, i, o 외의 낱글자는 1종 기호를 붙임)
+_PLAIN_SINGLE_LETTERS = frozenset('aio')
+
+# 낱말 안의 토큰: 로마자 묶음, 수(소수점/자릿점 포함), 그 밖의 문자 하나
+_TOKEN_RE = re.compile(r'(?P<letters>[A-Za-z]+)|(?P<number>[0-9]+(?:[.,][0-9]+)*)|(?P<other>.)', re.DOTALL)
+
+# 낱말 안의 한글 (있을 때만 구간을 나눔)
+_HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎᄀ-ᇿ]')
+
+# 영어 점자 테이블 하나로 함께 적는 구간 (대문자/수 표시 상태가 이어짐)
+_ENGLISH_FAMILIES = ({HANGUL}, {LATIN, NUMBER, PUNCT})
+
+
+class EnglishBrailleTable:
+    """
+    미리 컴파일된 영어 점자 테이블
+    - letters, punctuation: 문자 → 점자 유니코드 문자열
+    - wordsigns: 낱말 전체 → 약자 (알파벳/강한/아래 낱말 기호, 약어)
+    - trie: 글자 단위 트라이, 끝 노드에 (점자, 위치 조건)
+    """
+
+    def __init__(self, data: Dict):
+        indicators = {name: dot_numbers_to_unicode(dots) for name, dots in data.get('indicators', {}).items()}
+        self.capital = indicators.get('capital', '')
+        self.capital_word = indicators.get('capitalWord', '')
+        self.number_sign = indicators.get('number', '')
+        self.grade1 = indicators.get('grade1', '')
+
+        self.letters = {ch: dot_numbers_to_unicode(dots) for ch, dots in data.get('letters', {}).items()}
+        self.punctuation = {ch: dot_numbers_to_unicode(dots) for ch, dots in data.get('punctuation', {}).items()}
+
+        digits = {ord(d): dot_numbers_to_unicode(dots) for d, dots in data.get('digits', {}).items()}
+        digits[ord('.')] = indicators.get('decimal', '')
+        digits[ord(',')] = indicators.get('numericComma', '')
+        self.digits = digits
+
+        self.wordsigns = {word: dot_numbers_to_unicode(dots) for word, dots in data.get('wordsigns', {}).items()}
+        self.trie: Dict = {}
+        for position, groups in data.get('groupsigns', {}).items():
+            for group, dots in groups.items():
+                node = self.trie
+                for ch in group:
+                    node = node.setdefault(ch, {})
+                node[_END] = (dot_numbers_to_unicode(dots), position)
+
+    def encode_word(self, word: str, grade: int = 2) -> str:
+        """공백 없는 낱말 하나를 점자로 (대문자/숫자 표시 상태 포함)"""
+        tokens = list(_TOKEN_RE.finditer(word))
+        letter_runs = sum(1 for token in tokens if token.lastgroup == 'letters')
+        standalone = letter_runs == 1 and not any(token.lastgroup == 'number' for token in tokens)
+
+        out = []
+        after_number = False
+        for token in tokens:
+            kind, text = token.lastgroup, token.group()
+            if kind == 'number':
+                out.append(self.number_sign + text.translate(self.digits))
+                after_number = True
+                continue
+            if kind == 'other':
+                cells = self.punctuation.get(text)
+                out.append(cells if cells is not None else text_to_unicode(text))
+                # 숫자 뒤 문장부호 다음에도 숫자 상태는 끝남
+                after_number = False
+                continue
+
+            # 수 바로 뒤의 a~j 소문자는 숫자로 읽히지 않도록 1종 기호
+            if after_number and 'a' <= text[0] <= 'j':
+                out.append(self.grade1)
+            after_number = False
+            out.append(self._encode_letters(text, grade, standalone))
+        return ''.join(out)
+
+    def _encode_letters(self, run: str, grade: int, standalone: bool) -> str:
+        lower = run.lower()
+        all_caps = len(run) > 1 and run.isupper()
+        title = run[0].isupper() and (len(run) == 1 or run[1:].islower())
+        prefix = self.capital_word if all_caps else (self.capital if title else '')
+        per_letter_caps = not (all_caps or title or run.islower())
+
+        if grade >= 2 and standalone and not per_letter_caps:
+            sign = self.wordsigns.get(lower)
+            if sign is not None:
+                return prefix + sign
+            if len(lower) == 1 and lower not in _PLAIN_SINGLE_LETTERS:
+                return self.grade1 + prefix + self.letters[lower]
+
+        out = [prefix]
+        i, length = 0, len(lower)
+        while i < length:
+            match = self._longest_group(run, lower, i, per_letter_caps) if grade >= 2 else None
+            if per_letter_caps and run[i].isupper():
+                out.append(self.capital)
+            if match:
+                i, cells = match
+                out.append(cells)
+            else:
+                out.append(self.letters[lower[i]])
+                i += 1
+        return ''.join(out)
+
+    def _longest_group(self, run: str, lower: str, i: int, per_letter_caps: bool):
+        """i 위치에서 위치 조건을 만족하는 가장 긴 약자 (끝 위치, 점자)"""
+        node, j, match = self.trie, i, None
+        length = len(lower)
+        while j < length and lower[j] in node:
+            # 대소문자가 섞인 낱말에서는 약자 안에 대문자가 끼지 않도록 (첫 글자만 허용)
+            if per_letter_caps and j > i and run[j].isupper():
+                break
+            node = node[lower[j]]
+            j += 1
+            rule = node.get(_END)
+            if rule and _position_ok(rule[1], i, j, length):
+                match = (j, rule[0])
+        return match
+
+
+def _position_ok(position: str, start: int, end: int, length: int) -> bool:
+    if position == 'start':
+        return start == 0 and end < length
+    if position == 'middle':
+        return start > 0 and end < length
+    if position == 'notStart':
+        return start > 0
+    return True
+
+
+_TABLE: Optional[EnglishBrailleTable] = None
+_KOREAN_VERSION = None
+
+
+def get_english_table() -> EnglishBrailleTable:
+    """컴파일된 영어 점자 테이블 (처음 사용할 때 한 번 컴파일)"""
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = EnglishBrailleTable(load_json("english_braille.json", {}))
+    return _TABLE
+
+
+def _check_korean_version() -> None:
+    """한글 점자 테이블이 바뀌면 (한글 구간이 든) 낱말 메모를 비움"""
+    global _KOREAN_VERSION
+    version = table_version()
+    if version != _KOREAN_VERSION:
+        _memo_english_word.cache_clear()
+        _KOREAN_VERSION = version
+
+
+def _encode_word(word: str, grade: int) -> str:
+    """한글 구간(뒤에 붙은 문장부호 포함)은 한글 점자 테이블, 나머지는 영어 점자"""
+    table = get_english_table()
+    if not _HANGUL_RE.search(word):
+        return table.encode_word(word, grade)
+    runs = group_runs(attach_punct(segment(word), (HANGUL,)), _ENGLISH_FAMILIES)
+    return ''.join(
+        text_to_unicode(run.text) if run.kind == HANGUL else table.encode_word(run.text, grade)
+        for run in runs
+    )
+
+
+@lru_cache(maxsize=WORD_MEMO_SIZE)
+def _memo_english_word(word: str, grade: int) -> str:
+    return _encode_word(word, grade)
+
+
+def english_word_to_unicode(word: str, grade: int = 2) -> str:
+    """공백 없는 낱말 하나를 영어 점자로 (메모된 결과 사용)"""
+    if len(word) > WORD_MEMO_MAX_CHARS:
+        return _encode_word(word, grade)
+    return _memo_english_word(word, grade)
+
+
+def english_to_unicode(text: str, grade: int = 2) -> str:
+    """
+    영어 텍스트를 UEB 점자 유니코드 문자열로 변환
+    공백으로 나눈 낱말마다 메모된 결과를 재사용 (공백 하나 = 빈 셀 하나)
+
+    Args:
+        text: 변환할 텍스트 (한글이 섞이면 한글 구간은 한글 점자)
+        grade: 1(풀어 쓰기) 또는 2(약자 적용, 기본)
+
+    Returns:
+        점자 유니코드 문자열
+    """
+    if not text:
+        return ''
+    _check_korean_version()
+    normalized = unicodedata.normalize("NFC", text)
+    return BLANK_CELL.join(english_word_to_unicode(word, grade) for word in normalized.split(' '))
+
+
+def english_alignment(text: str, grade: int = 2) -> array:
+    """영어 텍스트 → 원문-셀 정렬 배열 (약자 때문에 낱말 단위로 맞춤, NFC 기준)"""
+    _check_korean_version()
+    normalized = unicodedata.normalize("NFC", text or "")
+    return word_alignment(normalized, partial(english_word_to_unicode, grade=grade))
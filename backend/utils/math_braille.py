@@ -0,0 +1,312 @@
+"""
+수식 점자 변환
+수식을 컴파일된 정규식 한 번의 스캔으로 토큰화하고,
+미리 계산한 토큰 → 점자 테이블(data/math_braille.json)로 인코딩
+"""
+import re
+import unicodedata
+from array import array
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from utils.data_loader import load_json
+from utils.braille_converter import (
+    BLANK_CELL, dot_numbers_to_unicode, table_version, text_to_unicode, unicode_to_cells, word_alignment,
+)
+
+# 분수/근호처럼 뒤따르는 묶음을 받는 LaTeX 명령
+_FRACTION_COMMANDS = ('\\frac', '\\dfrac', '\\tfrac')
+_ROOT_COMMANDS = ('\\sqrt',)
+
+# 근호 기호와 근지수
+_ROOTS = {'√': '', '∛': '3', '∜': '4'}
+
+# 여는 괄호 → 닫는 괄호
+_BRACKETS = {'(': ')', '[': ']', '{': '}'}
+_CLOSING = frozenset(_BRACKETS.values())
+
+
+class Token(NamedTuple):
+    """수식 토큰 (종류, 원문, 원문 위치)"""
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+def _char_class(chars) -> str:
+    return '[' + ''.join(re.escape(ch) for ch in chars) + ']'
+
+
+class MathBrailleTable:
+    """
+    컴파일된 수식 점자 테이블
+    - pattern: 토큰 종류별 이름 그룹을 묶은 단일 정규식
+    - cells: 기호/문자/그리스 문자/함수 토큰 → 점자 유니코드 문자열
+    """
+
+    def __init__(self, data: Dict):
+        indicators = {name: dot_numbers_to_unicode(dots) for name, dots in data.get('indicators', {}).items()}
+        self.number_sign = indicators.get('number', '')
+        self.letter_sign = indicators.get('letter', '')
+        self.superscript = indicators.get('superscript', '')
+        self.subscript = indicators.get('subscript', '')
+        self.fraction = indicators.get('fraction', '')
+        self.root = indicators.get('root', '')
+        self.root_end = indicators.get('rootEnd', '')
+
+        # 수 안의 숫자/소수점/자릿점은 str.translate 한 번으로 변환
+        digits = {ord(d): dot_numbers_to_unicode(dots) for d, dots in data.get('digits', {}).items()}
+        digits[ord('.')] = indicators.get('decimal', '')
+        digits[ord(',')] = indicators.get('thousands', '')
+        self.digits = digits
+
+        cells: Dict[str, str] = {}
+        capital = indicators.get('capital', '')
+        for letter, dots in data.get('letters', {}).items():
+            cells[letter] = dot_numbers_to_unicode(dots)
+            cells[letter.upper()] = capital + cells[letter]
+        greek_sign = indicators.get('greek', '')
+        for letter, dots in data.get('greek', {}).items():
+            cells[letter] = greek_sign + dot_numbers_to_unicode(dots)
+        for symbol, dots in data.get('symbols', {}).items():
+            cells[symbol] = dot_numbers_to_unicode(dots)
+        self.functions = tuple(data.get('functions', []))
+        for name in self.functions:
+            cells[name] = self.letter_sign + ''.join(cells.get(ch, '') for ch in name)
+        self.cells = cells
+
+        self.latex = dict(data.get('latex', {}))
+        self.superscripts = str.maketrans(data.get('superscripts', {}))
+        self.subscripts = str.maketrans(data.get('subscripts', {}))
+
+        letters = ''.join(data.get('letters', {}).keys())
+        symbols = sorted(data.get('symbols', {}).keys(), key=len, reverse=True)
+        groups = [
+            ('number', r'[0-9]+(?:[.,][0-9]+)*'),
+            ('latex', r'\\[A-Za-z]+'),
+            ('func', '|'.join(sorted(map(re.escape, self.functions), key=len, reverse=True)) or '(?!)'),
+            ('letter', f'[{letters}{letters.upper()}]' if letters else '(?!)'),
+            ('greek', _char_class(data.get('greek', {})) if data.get('greek') else '(?!)'),
+            ('sup', _char_class(data.get('superscripts', {})) + '+' if data.get('superscripts') else '(?!)'),
+            ('sub', _char_class(data.get('subscripts', {})) + '+' if data.get('subscripts') else '(?!)'),
+            ('script', r'[\^_]'),
+            ('root', _char_class(_ROOTS)),
+            ('symbol', '|'.join(map(re.escape, symbols)) or '(?!)'),
+            ('space', r'\s+'),
+            ('hangul', r'[가-힣ㄱ-ㅣ]+'),
+            ('other', r'.'),
+        ]
+        self.pattern = re.compile('|'.join(f'(?P<{name}>{regex})' for name, regex in groups), re.DOTALL)
+
+    def tokenize(self, formula: str) -> List[Token]:
+        """수식을 한 번의 스캔으로 토큰화"""
+        return [
+            Token(match.lastgroup, match.group(), match.start(), match.end())
+            for match in self.pattern.finditer(formula)
+        ]
+
+    def number(self, text: str) -> str:
+        """수 (수표 + 숫자)"""
+        return self.number_sign + text.translate(self.digits)
+
+    def encode(self, tokens: List[Token]) -> str:
+        """토큰 리스트를 수식 점자로 인코딩"""
+        out = []
+        i, count = 0, len(tokens)
+        in_letters = False
+        while i < count:
+            kind, text = tokens[i].kind, tokens[i].text
+
+            # 연속된 로마자는 로마자표 하나로 묶음
+            if kind == 'letter':
+                if not in_letters:
+                    out.append(self.letter_sign)
+                    in_letters = True
+                out.append(self.cells[text])
+                i += 1
+                continue
+            in_letters = False
+
+            if kind == 'number':
+                # 수/수 는 분모, 분수표, 분자 순으로
+                if (i + 2 < count and tokens[i + 1].text == '/' and tokens[i + 2].kind == 'number'):
+                    out.append(self.number(tokens[i + 2].text) + self.fraction + self.number(text))
+                    i += 3
+                    continue
+                out.append(self.number(text))
+            elif kind == 'script':
+                group, i = _take_group(tokens, i + 1)
+                out.append((self.superscript if text == '^' else self.subscript) + self.encode(group))
+                continue
+            elif kind == 'root':
+                group, i = _take_group(tokens, i + 1, strip_parens=True)
+                index = _ROOTS[text]
+                prefix = self.superscript + self.number(index) if index else ''
+                out.append(prefix + self.root + self.encode(group) + self.root_end)
+                continue
+            elif kind == 'sup':
+                out.append(self.superscript + self.encode(self.tokenize(text.translate(self.superscripts))))
+            elif kind == 'sub':
+                out.append(self.subscript + self.encode(self.tokenize(text.translate(self.subscripts))))
+            elif kind == 'latex':
+                if text in _FRACTION_COMMANDS:
+                    numerator, i = _take_group(tokens, i + 1)
+                    denominator, i = _take_group(tokens, i)
+                    out.append(self.encode(denominator) + self.fraction + self.encode(numerator))
+                    continue
+                if text in _ROOT_COMMANDS:
+                    group, i = _take_group(tokens, i + 1)
+                    out.append(self.root + self.encode(group) + self.root_end)
+                    continue
+                alias = self.latex.get(text)
+                if alias is None:
+                    # 알 수 없는 명령은 이름을 로마자로
+                    alias = text[1:]
+                out.append(self.encode(self.tokenize(alias)))
+            elif kind in ('func', 'greek', 'symbol'):
+                out.append(self.cells[text])
+            elif kind == 'space':
+                out.append(BLANK_CELL * len(text))
+            else:
+                # 한글/기타 문자는 한글 점자 테이블
+                out.append(text_to_unicode(text))
+            i += 1
+        return ''.join(out)
+
+
+def _take_group(tokens: List[Token], i: int, strip_parens: bool = False) -> Tuple[List[Token], int]:
+    """
+    i 위치에서 한 덩이를 가져옴: {…} 는 안쪽, (…) 는 괄호 포함(strip_parens면 안쪽), 그 밖은 토큰 하나
+    Returns:
+        (덩이 토큰 리스트, 다음 위치)
+    """
+    count = len(tokens)
+    while i < count and tokens[i].kind == 'space':
+        i += 1
+    if i >= count:
+        return [], i
+
+    opener = tokens[i].text
+    closer = _BRACKETS.get(opener)
+    if closer is None:
+        return [tokens[i]], i + 1
+
+    depth = 0
+    for j in range(i, count):
+        if tokens[j].text == opener:
+            depth += 1
+        elif tokens[j].text == closer:
+            depth -= 1
+            if depth == 0:
+                if opener == '{' or strip_parens:
+                    return tokens[i + 1:j], j + 1
+                return tokens[i:j + 1], j + 1
+    # 닫히지 않은 묶음은 끝까지
+    return tokens[i + 1:], count
+
+
+_TABLE: Optional[MathBrailleTable] = None
+_KOREAN_VERSION = None
+
+
+def get_math_table() -> MathBrailleTable:
+    """컴파일된 수식 점자 테이블 (처음 사용할 때 한 번 컴파일)"""
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = MathBrailleTable(load_json("math_braille.json", {}))
+    return _TABLE
+
+
+def tokenize(formula: str) -> List[Token]:
+    """수식 토큰화"""
+    return get_math_table().tokenize(formula or '')
+
+
+# 어절 메모 크기와 메모 대상 최대 길이
+MATH_MEMO_SIZE = 4096
+MATH_MEMO_MAX_CHARS = 64
+
+
+def check_table_version() -> None:
+    """한글 점자 테이블이 바뀌면 (한글이 든) 수식 어절 메모를 비움"""
+    global _KOREAN_VERSION
+    version = table_version()
+    if version != _KOREAN_VERSION:
+        _memo_math_word.cache_clear()
+        _KOREAN_VERSION = version
+
+
+def split_words(formula: str) -> List[str]:
+    """
+    수식을 묶음({…}, (…), […]) 밖의 공백에서만 어절로 나눔
+    \\frac{a + b}{2}, √(x + 1)처럼 묶음 안에 공백이 있어도 한 어절 (' '로 이으면 원문)
+    """
+    words = []
+    depth = start = 0
+    for index, ch in enumerate(formula):
+        if ch in _BRACKETS:
+            depth += 1
+        elif ch in _CLOSING:
+            depth = max(depth - 1, 0)
+        elif ch == ' ' and not depth:
+            words.append(formula[start:index])
+            start = index + 1
+    words.append(formula[start:])
+    return words
+
+
+def _encode_word(word: str) -> str:
+    table = get_math_table()
+    return table.encode(table.tokenize(word))
+
+
+@lru_cache(maxsize=MATH_MEMO_SIZE)
+def _memo_math_word(word: str) -> str:
+    return _encode_word(word)
+
+
+def _word_braille(word: str) -> str:
+    if len(word) > MATH_MEMO_MAX_CHARS:
+        return _encode_word(word)
+    return _memo_math_word(word)
+
+
+def math_word_to_unicode(word: str) -> str:
+    """
+    정규화된(NFC) 수식 어절 하나(split_words 결과)를 수식 점자로 (메모된 결과 사용)
+    호출하는 쪽에서 check_table_version()으로 한글 테이블을 먼저 확인해야 함
+    """
+    return _word_braille(word)
+
+
+def math_to_unicode(formula: str) -> str:
+    """
+    수식(또는 수식이 섞인 텍스트)을 수식 점자 유니코드 문자열로 변환
+    묶음 밖의 공백으로 나눈 어절마다 메모된 결과를 재사용 (공백 하나 = 빈 셀 하나)
+
+    Args:
+        formula: 변환할 수식 (예: "x² + 2x + 1 = 0", "\\frac{1}{2}")
+
+    Returns:
+        점자 유니코드 문자열 (한글은 한글 점자 테이블로 변환)
+    """
+    if not formula:
+        return ''
+    check_table_version()
+    normalized = unicodedata.normalize("NFC", formula)
+    return BLANK_CELL.join(map(_word_braille, split_words(normalized)))
+
+
+def math_alignment(formula: str) -> array:
+    """
+    수식 → 원문-셀 정렬 배열 (utils.braille_converter.text_alignment와 같은 형식, NFC 기준)
+    수식 점자는 분수처럼 순서가 바뀌므로 어절 단위로 맞춤
+    """
+    check_table_version()
+    normalized = unicodedata.normalize("NFC", formula or '')
+    return word_alignment(normalized, _word_braille, split_words)
+
+
+def math_to_cells(formula: str) -> List[List[int]]:
+    """수식을 [[0|1 x 6], ...] 셀 배열로 변환"""
+    return unicode_to_cells(math_to_unicode(formula))
@@ -0,0 +1,235 @@
+"""
+한글 바탕 혼합 텍스트 점자 변환
+utils.script_segmenter로 나눈 구간을 종류별 인코더로 보냄
+- 한글/문장부호: 한글 점자 테이블
+- 수: 수표 + 숫자 (숫자 뒤 ㄴ,ㄷ,ㅁ,ㅋ,ㅌ,ㅍ,ㅎ/운 앞은 한 칸 띄움)
+- 로마자: 로마자표 … 로마자 종료표 사이에 영어 점자 (여러 어절에 걸친 로마자 구간은 표 한 쌍)
+- 수식(formulas=True): 수식 점자
+로마자/숫자가 없는 어절은 한글 테이블 메모를 그대로 사용
+"""
+import re
+import unicodedata
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from utils.data_loader import load_json
+from utils.braille_converter import (
+    ALIGNMENT_TYPECODE, BLANK_CELL, CHOSEONG, HANGUL_FIRST, HANGUL_COUNT, WORD_MEMO_SIZE, WORD_MEMO_MAX_CHARS,
+    char_to_unicode, dot_numbers_to_unicode, table_version, text_alignment, text_to_unicode, word_to_unicode,
+)
+from utils.english_braille import get_english_table
+from utils.script_segmenter import HANGUL, LATIN, NUMBER, attach_punct, group_runs, needs_dispatch, segment
+
+# 로마자 뒤에 붙은 문장부호는 로마자 구간에 포함
+_LATIN_FAMILIES = ({HANGUL}, {LATIN})
+
+# 어절이 로마자로 끝나는지 (뒤에 붙은 문장부호 포함)
+_ENDS_LATIN_RE = re.compile(r'[A-Za-z][^\sA-Za-z0-9가-힣ㄱ-ㆎᄀ-ᇿ]*$')
+
+
+class MixedBrailleTable:
+    """
+    혼합 텍스트용 표시 기호 (data/mixed_braille.json)
+    - number_sign + digits: 수
+    - roman / roman_end: 로마자표, 로마자 종료표
+    - space_initials / space_syllables: 숫자 뒤에서 띄어 쓰는 한글 첫소리/음절
+    """
+
+    def __init__(self, data: Dict):
+        indicators = {name: dot_numbers_to_unicode(dots) for name, dots in data.get('indicators', {}).items()}
+        self.number_sign = indicators.get('number', '')
+        self.roman = indicators.get('roman', '')
+        self.roman_end = indicators.get('romanEnd', '')
+
+        digits = {ord(d): dot_numbers_to_unicode(dots) for d, dots in data.get('digits', {}).items()}
+        digits[ord('.')] = indicators.get('decimal', '')
+        digits[ord(',')] = indicators.get('numericComma', '')
+        self.digits = digits
+
+        self.space_initials = frozenset(data.get('numberSpaceInitials', []))
+        self.space_syllables = frozenset(data.get('numberSpaceSyllables', []))
+        self.latin_grade = int(data.get('latinGrade', 1))
+
+    def number(self, text: str) -> str:
+        return self.number_sign + text.translate(self.digits)
+
+    def space_after_number(self, hangul: str) -> bool:
+        """숫자 바로 뒤 한글이 숫자로 읽힐 수 있어 띄어야 하는지"""
+        first = hangul[0]
+        if first in self.space_syllables or first in self.space_initials:
+            return True
+        base = ord(first) - HANGUL_FIRST
+        return 0 <= base < HANGUL_COUNT and CHOSEONG[base // (21 * 28)] in self.space_initials
+
+
+_TABLE: Optional[MixedBrailleTable] = None
+_KOREAN_VERSION = None
+
+
+def get_mixed_table() -> MixedBrailleTable:
+    """컴파일된 혼합 텍스트 표시 기호 (처음 사용할 때 한 번 컴파일)"""
+    global _TABLE
+    if _TABLE is None:
+        _TABLE = MixedBrailleTable(load_json("mixed_braille.json", {}))
+    return _TABLE
+
+
+def _check_korean_version() -> None:
+    """한글 점자 테이블이 바뀌면 어절 메모를 비움"""
+    global _KOREAN_VERSION
+    version = table_version()
+    if version != _KOREAN_VERSION:
+        _memo_mixed_word.cache_clear()
+        _KOREAN_VERSION = version
+
+
+def _encode_word(word: str, roman_open: bool, roman_close: bool) -> str:
+    """
+    로마자/숫자가 든 어절 하나를 구간별로 변환
+    roman_open: 앞 어절에서 이어지는 로마자 구간 (로마자표 생략)
+    roman_close: 어절 끝의 로마자 구간을 여기서 닫음 (로마자 종료표)
+    """
+    table = get_mixed_table()
+    english = get_english_table()
+    runs = group_runs(attach_punct(segment(word)), _LATIN_FAMILIES)
+    out = []
+    last = len(runs) - 1
+    for index, run in enumerate(runs):
+        if run.kind == LATIN:
+            if index or not roman_open:
+                out.append(table.roman)
+            out.append(english.encode_word(run.text, table.latin_grade))
+            if index < last or roman_close:
+                out.append(table.roman_end)
+        elif run.kind == NUMBER:
+            out.append(table.number(run.text))
+            following = runs[index + 1] if index < last else None
+            if following is not None and following.kind == HANGUL and table.space_after_number(following.text):
+                out.append(BLANK_CELL)
+        else:
+            out.append(word_to_unicode(run.text))
+    return ''.join(out)
+
+
+@lru_cache(maxsize=WORD_MEMO_SIZE)
+def _memo_mixed_word(word: str, roman_open: bool, roman_close: bool) -> str:
+    return _encode_word(word, roman_open, roman_close)
+
+
+def _starts_latin(word: str) -> bool:
+    return bool(word) and ('a' <= word[0] <= 'z' or 'A' <= word[0] <= 'Z')
+
+
+def roman_continues(word: str, following: str) -> bool:
+    """앞 어절의 로마자 구간이 다음 어절로 이어지는지 (사이에 로마자 종료표/로마자표를 쓰지 않음)"""
+    return _ENDS_LATIN_RE.search(word) is not None and _starts_latin(following)
+
+
+def _encode_words(words: List[str], more: bool) -> List[str]:
+    """
+    어절 리스트 → 어절별 점자 (로마자 구간이 어절을 넘어 이어지는지 앞뒤 어절로 판단)
+    more: 뒤에 텍스트가 더 있음 (마지막 어절의 로마자 구간도 닫음)
+    """
+    result = []
+    count = len(words)
+    previous_latin = False
+    for index, word in enumerate(words):
+        if not needs_dispatch(word):
+            result.append(word_to_unicode(word))
+            previous_latin = False
+            continue
+        ends_latin = _ENDS_LATIN_RE.search(word) is not None
+        roman_open = previous_latin and _starts_latin(word)
+        if index + 1 < count:
+            roman_close = ends_latin and not _starts_latin(words[index + 1])
+        else:
+            roman_close = ends_latin and more
+        if len(word) > WORD_MEMO_MAX_CHARS:
+            result.append(_encode_word(word, roman_open, roman_close))
+        else:
+            result.append(_memo_mixed_word(word, roman_open, roman_close))
+        previous_latin = ends_latin
+    return result
+
+
+def _iter_pieces(text: str, formulas: bool) -> Iterator[Tuple[bool, str]]:
+    """(수식 여부, 원문 조각) - 수식 사이 텍스트와 수식을 차례로"""
+    if not formulas:
+        yield False, text
+        return
+    from utils.content_extractor import iter_formulas
+
+    cursor = 0
+    for formula in iter_formulas(text):
+        yield False, text[cursor:formula.start]
+        yield True, formula.text
+        cursor = formula.end
+    yield False, text[cursor:]
+
+
+def _convert_pieces(text: str, formulas: bool) -> Iterator[Tuple[bool, List[str], List[str]]]:
+    """조각별 (수식 여부, 어절 리스트, 어절별 점자)"""
+    from utils.math_braille import check_table_version, math_word_to_unicode, split_words
+
+    if formulas:
+        check_table_version()
+    pieces = list(_iter_pieces(text, formulas))
+    last = len(pieces) - 1
+    for index, (is_math, piece) in enumerate(pieces):
+        if is_math:
+            words = split_words(piece)
+            yield True, words, [math_word_to_unicode(word) for word in words]
+        else:
+            words = piece.split(' ')
+            yield False, words, _encode_words(words, index < last)
+
+
+def mixed_to_unicode(text: str, formulas: bool = False) -> str:
+    """
+    한글 바탕 혼합 텍스트를 점자 유니코드 문자열로 변환
+    로마자/숫자가 없으면 text_to_unicode와 같음
+
+    Args:
+        text: 변환할 텍스트
+        formulas: True면 수식 구간을 수식 점자로 변환
+
+    Returns:
+        점자 유니코드 문자열
+    """
+    if not text:
+        return ''
+    _check_korean_version()
+    normalized = unicodedata.normalize("NFC", text)
+    if not needs_dispatch(normalized):
+        return text_to_unicode(normalized)
+    return ''.join(
+        BLANK_CELL.join(braille) for _, _, braille in _convert_pieces(normalized, formulas)
+    )
+
+
+def mixed_alignment(text: str, formulas: bool = False) -> array:
+    """
+    혼합 텍스트 → 원문-셀 정렬 배열 (NFC 기준)
+    한글 어절은 문자 단위, 로마자/숫자/수식이 든 어절은 어절 단위로 맞춤
+    """
+    _check_korean_version()
+    normalized = unicodedata.normalize("NFC", text or "")
+    if not needs_dispatch(normalized):
+        return text_alignment(normalized)
+
+    offsets = array(ALIGNMENT_TYPECODE)
+    position = 0
+    for is_math, words, braille in _convert_pieces(normalized, formulas):
+        for index, (word, cells) in enumerate(zip(words, braille)):
+            if index:
+                offsets.append(position)
+                position += 1
+            if is_math or needs_dispatch(word):
+                offsets.extend([position] * len(word))
+                position += len(cells)
+            else:
+                for ch in word:
+                    offsets.append(position)
+                    position += len(char_to_unicode(ch))
+    offsets.append(position)
+    return offsets
@@ -0,0 +1,102 @@
+"""
+PDF 추출 결과 캐시 (내용 주소)
+파일 바이트를 조각으로 읽으면서 SHA-256을 계산하고, 페이지별 텍스트를 gzip으로 압축해
+data/cache/pdf/<해시>.json.gz에 저장
+같은 파일이면 PyPDF2를 거치지 않고 캐시에서 읽음 (PyPDF2 버전이 바뀌면 다시 추출)
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+import PyPDF2
+from utils.data_loader import DATA_DIR
+from utils.pdf_extractor import PdfExtractor, PdfText, join_pages
+
+CACHE_DIR = DATA_DIR / "cache" / "pdf"
+
+# 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK = 1 << 20
+
+# 캐시 파일 형식 버전
+CACHE_FORMAT = 1
+
+
+def iter_chunks(source, chunk_size: int = HASH_CHUNK) -> Iterator[bytes]:
+    """
+    PDF 바이트를 조각으로 (파일 경로, 바이트, 파일 객체, Django 업로드 파일)
+    파일 객체는 다 읽은 뒤 처음 위치로 되돌림
+    """
+    if isinstance(source, (bytes, bytearray)):
+        yield bytes(source)
+        return
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            yield from iter(lambda: f.read(chunk_size), b'')
+        return
+    source.seek(0)
+    if hasattr(source, 'chunks'):
+        yield from source.chunks(chunk_size)
+    else:
+        yield from iter(lambda: source.read(chunk_size), b'')
+    source.seek(0)
+
+
+def file_digest(source) -> str:
+    """PDF 바이트의 SHA-256 (16진수 64자)"""
+    digest = hashlib.sha256()
+    for chunk in iter_chunks(source):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(digest: str) -> Path:
+    return CACHE_DIR / f"{digest}.json.gz"
+
+
+def load_pages(digest: str) -> Optional[List[Optional[str]]]:
+    """캐시된 페이지별 텍스트 (없거나 형식/PyPDF2 버전이 다르면 None)"""
+    try:
+        with gzip.open(cache_path(digest), 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('format') != CACHE_FORMAT or data.get('extractor') != PyPDF2.__version__:
+        return None
+    return data.get('pages')
+
+
+def save_pages(digest: str, pages: List[Optional[str]]) -> None:
+    """페이지별 텍스트 저장 (임시 파일에 쓴 뒤 바꿔 넣어 읽는 쪽이 반쯤 쓴 파일을 보지 않게)"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    data = {'format': CACHE_FORMAT, 'extractor': PyPDF2.__version__, 'pages': pages}
+    fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+            f.write(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        os.replace(temp_path, cache_path(digest))
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def extract_pdf_cached(source, digest: Optional[str] = None, workers: Optional[int] = None) -> Tuple[str, PdfText]:
+    """
+    캐시를 거쳐 PDF 전체 텍스트 추출
+    digest: 이미 계산한 해시 (없으면 계산)
+    Returns:
+        (해시, PdfText)
+    """
+    digest = digest or file_digest(source)
+    pages = load_pages(digest)
+    if pages is None:
+        with PdfExtractor(source, workers=workers) as extractor:
+            pages = list(extractor.iter_pages())
+        try:
+            save_pages(digest, pages)
+        except OSError:
+            # 캐시는 저장하지 못해도 추출 결과는 그대로 사용
+            pass
+    return digest, join_pages(pages)
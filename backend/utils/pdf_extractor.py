@@ -0,0 +1,195 @@
+"""
+PDF 텍스트 추출
+페이지 범위를 프로세스 풀에서 나눠 추출하고, 페이지 텍스트를 리스트로 모아 한 번에 이어 붙임
+페이지별 시작 위치(offsets)를 함께 돌려주어 단원 등 텍스트 위치를 페이지로 되짚을 수 있음
+
+사용 예:
+    with PdfExtractor(pdf_file) as extractor:
+        pdf_text = extractor.extract()
+    pdf_text.page_of(position)
+"""
+import io
+import os
+import shutil
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+import PyPDF2
+from django.conf import settings
+
+# 페이지가 이보다 적으면 프로세스 풀 없이 추출
+PARALLEL_MIN_PAGES = 32
+
+# 작업 하나가 맡는 최소 페이지 수
+MIN_PAGES_PER_TASK = 8
+
+# 페이지 텍스트 뒤에 붙는 구분자 (빈 페이지는 구분자도 없음)
+PAGE_SEPARATOR = "\n"
+
+
+def default_workers() -> int:
+    """설정된 추출 워커 수 (PDF_EXTRACT_WORKERS, 0이면 CPU 수)"""
+    workers = getattr(settings, 'PDF_EXTRACT_WORKERS', 0)
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+class PdfText(NamedTuple):
+    """
+    추출 결과
+    text: 페이지 텍스트를 이어 붙인 전체 텍스트
+    offsets: 페이지 i의 텍스트는 text[offsets[i]:offsets[i + 1]] (길이 = 페이지 수 + 1)
+    failed_pages: 추출에 실패한 페이지 번호 (0부터, 빈 텍스트로 처리)
+    """
+    text: str
+    offsets: List[int]
+    failed_pages: List[int]
+
+    @property
+    def page_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def page_text(self, page: int) -> str:
+        return self.text[self.offsets[page]:self.offsets[page + 1]]
+
+    def page_of(self, position: int) -> int:
+        """텍스트 위치가 속한 페이지 번호 (0부터, 빈 페이지는 건너뜀)"""
+        if self.page_count <= 0:
+            raise IndexError(position)
+        return min(max(bisect_right(self.offsets, position) - 1, 0), self.page_count - 1)
+
+    def page_range(self, start: int, end: int) -> Tuple[int, int]:
+        """텍스트 구간 [start, end)가 걸친 (첫 페이지, 마지막 페이지)"""
+        return self.page_of(start), self.page_of(max(end - 1, start))
+
+
+def unit_pages(pdf_text: PdfText, unit_data: dict) -> dict:
+    """
+    단원 추출 결과의 원문 위치('start', 'end') → Unit 페이지 필드 (1부터)
+    위치가 없거나 텍스트가 비어 있으면 빈 딕셔너리
+    """
+    if 'start' not in unit_data or pdf_text.page_count <= 0:
+        return {}
+    first, last = pdf_text.page_range(unit_data['start'], unit_data.get('end', unit_data['start']))
+    return {'start_page': first + 1, 'end_page': last + 1}
+
+
+def join_pages(pages: List[Optional[str]]) -> PdfText:
+    """페이지별 텍스트 리스트 (실패한 페이지는 None) → PdfText"""
+    parts, offsets, failed = [], [0], []
+    position = 0
+    for index, page_text in enumerate(pages):
+        if page_text is None:
+            failed.append(index)
+        elif page_text:
+            parts.append(page_text)
+            parts.append(PAGE_SEPARATOR)
+            position += len(page_text) + len(PAGE_SEPARATOR)
+        offsets.append(position)
+    return PdfText(''.join(parts), offsets, failed)
+
+
+def _extract_pages(reader: PyPDF2.PdfReader, start: int, end: int) -> List[Optional[str]]:
+    """페이지 start..end-1의 텍스트 (실패한 페이지는 None)"""
+    texts = []
+    for index in range(start, end):
+        try:
+            texts.append(reader.pages[index].extract_text() or '')
+        except Exception:
+            texts.append(None)
+    return texts
+
+
+def _extract_range(path: str, start: int, end: int) -> List[Optional[str]]:
+    """워커 프로세스 작업: 파일을 직접 열어 페이지 범위 추출"""
+    with open(path, 'rb') as f:
+        return _extract_pages(PyPDF2.PdfReader(f), start, end)
+
+
+def page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """페이지를 워커당 약 4개 작업으로 나눈 (시작, 끝) 리스트"""
+    size = max(MIN_PAGES_PER_TASK, -(-page_count // (workers * 4)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+class PdfExtractor:
+    """
+    PDF 하나의 텍스트 추출기
+    source: 파일 경로, 바이트, 파일 객체 (Django 업로드 파일 포함)
+    생성할 때 PDF를 열므로 손상된 파일은 여기서 PyPDF2.errors.PdfReadError
+    """
+
+    def __init__(self, source, workers: Optional[int] = None):
+        self.workers = workers if workers and workers > 0 else default_workers()
+        self._path: Optional[str] = None
+        self._spooled: Optional[str] = None
+        self._file = None
+
+        if isinstance(source, (str, Path)):
+            self._path = str(source)
+            self._file = open(self._path, 'rb')
+            stream = self._file
+        elif isinstance(source, (bytes, bytearray)):
+            stream = io.BytesIO(source)
+        else:
+            if hasattr(source, 'temporary_file_path'):
+                self._path = source.temporary_file_path()
+            stream = source
+            stream.seek(0)
+        self._stream = stream
+        self.reader = PyPDF2.PdfReader(stream)
+        self.page_count = len(self.reader.pages)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._spooled is not None:
+            os.unlink(self._spooled)
+            self._spooled = None
+
+    def _worker_path(self) -> str:
+        """워커가 열 파일 경로 (메모리에 있는 PDF는 임시 파일로 한 번 복사)"""
+        if self._path is None:
+            self._stream.seek(0)
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as spool:
+                shutil.copyfileobj(self._stream, spool)
+            self._path = self._spooled = spool.name
+        return self._path
+
+    def iter_pages(self) -> Iterator[Optional[str]]:
+        """페이지 텍스트를 순서대로 (실패한 페이지는 None), 병렬 추출이어도 앞 페이지부터 바로 나옴"""
+        if self.workers <= 1 or self.page_count < PARALLEL_MIN_PAGES:
+            for index in range(self.page_count):
+                yield from _extract_pages(self.reader, index, index + 1)
+            return
+
+        path = self._worker_path()
+        ranges = page_ranges(self.page_count, self.workers)
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(ranges))) as executor:
+            futures = [executor.submit(_extract_range, path, start, end) for start, end in ranges]
+            for future in futures:
+                yield from future.result()
+
+    def iter_texts(self) -> Iterator[str]:
+        """비어 있지 않은 페이지 텍스트 + 구분자 (스트리밍 변환 입력)"""
+        for page_text in self.iter_pages():
+            if page_text:
+                yield page_text + PAGE_SEPARATOR
+
+    def extract(self) -> PdfText:
+        """전체 텍스트와 페이지별 위치"""
+        return join_pages(list(self.iter_pages()))
+
+
+def extract_pdf(source, workers: Optional[int] = None) -> PdfText:
+    """PDF 전체 텍스트 추출 (PdfExtractor 한 번 사용)"""
+    with PdfExtractor(source, workers=workers) as extractor:
+        return extractor.extract()
@@ -0,0 +1,108 @@
+"""
+문자 종류별 구간 나누기
+정규화된 텍스트를 한 번의 스캔으로 한글/로마자/수/문장부호/공백 구간으로 나눔
+(수식 구간은 content_extractor.iter_formulas 결과를 같은 스캔에 끼워 넣음)
+각 구간은 종류별 전용 인코더로 보냄 (utils.mixed_braille, utils.english_braille)
+"""
+import re
+from typing import Iterator, List, NamedTuple
+
+# 구간 종류
+HANGUL = 'hangul'
+LATIN = 'latin'
+NUMBER = 'number'
+PUNCT = 'punct'
+SPACE = 'space'
+MATH = 'math'
+
+# 한글 음절, 호환 자모, 첫가끝 자모
+_HANGUL_CHARS = '가-힣ㄱ-ㆎᄀ-ᇿ'
+
+_RUN_RE = re.compile(
+    rf'(?P<{SPACE}>\s+)'
+    rf'|(?P<{HANGUL}>[{_HANGUL_CHARS}]+)'
+    rf'|(?P<{LATIN}>[A-Za-z]+)'
+    rf'|(?P<{NUMBER}>[0-9]+(?:[.,][0-9]+)*)'
+    rf'|(?P<{PUNCT}>[^\sA-Za-z0-9{_HANGUL_CHARS}]+)'
+)
+
+# 한글 점자 테이블만으로 충분한지 (로마자/숫자가 없는지) 확인
+_NEEDS_DISPATCH_RE = re.compile(r'[A-Za-z0-9]')
+
+
+class Run(NamedTuple):
+    """같은 종류 문자가 이어진 구간 (종류, 원문, 시작/끝 위치)"""
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+def needs_dispatch(text: str) -> bool:
+    """로마자나 숫자가 있어 구간별 인코더가 필요한지 (없으면 한글 테이블 하나로 변환)"""
+    return _NEEDS_DISPATCH_RE.search(text) is not None
+
+
+def iter_runs(text: str, start: int = 0, end: int = None) -> Iterator[Run]:
+    """text[start:end]를 앞에서부터 종류별 구간으로 나눔 (위치는 text 기준)"""
+    end = len(text) if end is None else end
+    for match in _RUN_RE.finditer(text, start, end):
+        yield Run(match.lastgroup, match.group(), match.start(), match.end())
+
+
+def segment(text: str, formulas: bool = False) -> List[Run]:
+    """
+    텍스트를 종류별 구간으로 나눔 (구간을 이어 붙이면 원문)
+
+    Args:
+        text: 정규화된 텍스트
+        formulas: True면 수식 구간을 MATH 구간 하나로 묶음
+
+    Returns:
+        [Run(kind, text, start, end), ...]
+    """
+    if not text:
+        return []
+    if not formulas:
+        return list(iter_runs(text))
+
+    from utils.content_extractor import iter_formulas
+
+    runs, cursor = [], 0
+    for formula in iter_formulas(text):
+        runs.extend(iter_runs(text, cursor, formula.start))
+        runs.append(Run(MATH, formula.text, formula.start, formula.end))
+        cursor = formula.end
+    runs.extend(iter_runs(text, cursor))
+    return runs
+
+
+def attach_punct(runs: List[Run], kinds=(HANGUL, LATIN)) -> List[Run]:
+    """
+    kinds 구간 바로 뒤에 붙은 문장부호 구간을 앞 구간의 종류로 바꿈
+    (한글 뒤 마침표는 한글 점자, 로마자 뒤 마침표는 영어 점자로 적도록)
+    """
+    attached: List[Run] = []
+    for run in runs:
+        if run.kind == PUNCT and attached and attached[-1].kind in kinds and attached[-1].end == run.start:
+            run = run._replace(kind=attached[-1].kind)
+        attached.append(run)
+    return attached
+
+
+def group_runs(runs: List[Run], families) -> List[Run]:
+    """
+    같은 묶음(families의 종류 집합 하나)에 속한 구간이 이어지면 하나로 합침 (합친 구간의 종류는 첫 구간의 종류)
+    한 인코더가 문맥(대문자/수 표시 상태 등)을 보고 함께 처리해야 하는 구간을 묶을 때 사용
+    """
+    family_of = {kind: index for index, family in enumerate(families) for kind in family}
+    grouped: List[Run] = []
+    for run in runs:
+        family = family_of.get(run.kind)
+        if (grouped and family is not None and family_of.get(grouped[-1].kind) == family
+                and grouped[-1].end == run.start):
+            last = grouped[-1]
+            grouped[-1] = Run(last.kind, last.text + run.text, last.start, run.end)
+        else:
+            grouped.append(run)
+    return grouped